@@ -50,7 +50,7 @@ echo.
 
 echo [4/4] Launching AI Pathfinder Visualizer...
 echo.
-poetry run python src/ai_path_finder/main.py
+poetry run ai-pathfinder
 
 IF ERRORLEVEL 1 (
     echo.
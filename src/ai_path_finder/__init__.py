@@ -1,6 +1,14 @@
 __version__ = "0.1.0"
 __author__ = "za_coding_paradox & Mtz00"
 
-from .main import main
-
 __all__ = ["main"]
+
+
+def __getattr__(name):
+    # Resolved on first use: the GUI imports pygame, and the headless entry
+    # points in this package should not pay for it.
+    if name == "main":
+        from .main import main as launch_gui
+        globals()["main"] = launch_gui
+        return launch_gui
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,121 @@
+"""
+Implementation of the A* family: A*, Weighted A* and Greedy Best-First.
+Heuristics are matched to the six-direction move set.
+"""
+import heapq
+from array import array
+
+from ai_path_finder.algorithms.metrics import SearchMetrics
+from ai_path_finder.algorithms.result import SearchResult
+
+UNREACHED_COST = float("inf")
+DEFAULT_EPSILON = 1.5
+
+
+def six_direction_steps(row_change, col_change):
+    """
+    Fewest moves between two cells under STRICT_MOVEMENT_ORDER.
+    Only the down-right / up-left diagonals exist, so a diagonal shortcut
+    helps only when both offsets share a sign.
+    """
+    if (row_change > 0 and col_change > 0) or (row_change < 0 and col_change < 0):
+        return max(abs(row_change), abs(col_change))
+    return abs(row_change) + abs(col_change)
+
+
+def make_heuristic(grid, target_cell):
+    """
+    Admissible and consistent estimate of the cost to target_cell.
+    Every move costs the weight of the entered cell, which is at least the
+    lightest weight on the grid.
+    """
+    cols = grid.cols
+    target_row, target_col = divmod(target_cell, cols)
+    lightest_weight = min(grid.weights) if grid.size else 0
+
+    def heuristic(cell):
+        row, col = divmod(cell, cols)
+        return lightest_weight * six_direction_steps(target_row - row, target_col - col)
+
+    return heuristic
+
+
+def run_astar(grid, start_cell, target_cell, metrics=None, heuristic=None):
+    return (yield from best_first_search(grid, start_cell, target_cell, 1.0, 1.0, metrics, heuristic))
+
+
+def run_weighted_astar(grid, start_cell, target_cell, metrics=None, heuristic=None, epsilon=DEFAULT_EPSILON):
+    # f = g + epsilon * h keeps the path within epsilon times the optimum.
+    return (yield from best_first_search(grid, start_cell, target_cell, 1.0, epsilon, metrics, heuristic))
+
+
+def run_greedy_best_first(grid, start_cell, target_cell, metrics=None, heuristic=None):
+    return (yield from best_first_search(grid, start_cell, target_cell, 0.0, 1.0, metrics, heuristic))
+
+
+def best_first_search(grid, start_cell, target_cell, cost_weight, heuristic_weight, metrics=None, heuristic=None):
+    if metrics is None:
+        metrics = SearchMetrics()
+    if heuristic is None:
+        heuristic = make_heuristic(grid, target_cell)
+
+    # Priority Queue stores tuples: (Priority, Estimate, PriorityCount, Cell).
+    # Ties on priority favour the cell closer to the target.
+    start_estimate = heuristic(start_cell)
+    priority_queue = [(heuristic_weight * start_estimate, start_estimate, 0, start_cell)]
+
+    parent_tracker = array("i", [-1]) * grid.size
+    cost_so_far = array("d", [UNREACHED_COST]) * grid.size
+    cost_so_far[start_cell] = 0
+    visited_set = bytearray(grid.size)
+    weights = grid.weights
+    neighbor_masks = grid.neighbor_masks
+    mask_deltas = grid.mask_deltas
+    counter = 1
+
+    while priority_queue:
+        _, _, _, current_active_cell = heapq.heappop(priority_queue)
+
+        if visited_set[current_active_cell]:
+            continue
+        visited_set[current_active_cell] = 1
+
+        if current_active_cell == target_cell:
+            path = yield from reconstruct_final_path(grid, parent_tracker, target_cell, start_cell)
+            return SearchResult.from_path(grid, path, metrics)
+
+        metrics.nodes_expanded += 1
+        current_cost = cost_so_far[current_active_cell]
+        for delta in mask_deltas[neighbor_masks[current_active_cell]]:
+            neighbor = current_active_cell + delta
+            new_cost = current_cost + weights[neighbor]
+
+            if new_cost < cost_so_far[neighbor] and not visited_set[neighbor]:
+                cost_so_far[neighbor] = new_cost
+                parent_tracker[neighbor] = current_active_cell
+                estimate = heuristic(neighbor)
+                priority = cost_weight * new_cost + heuristic_weight * estimate
+                heapq.heappush(priority_queue, (priority, estimate, counter, neighbor))
+                counter += 1
+                grid.mark_frontier(neighbor)
+                metrics.nodes_pushed += 1
+
+        metrics.peak_frontier = max(metrics.peak_frontier, len(priority_queue))
+
+        if current_active_cell != start_cell:
+            grid.mark_explored(current_active_cell)
+        yield True
+    return SearchResult.not_found(metrics)
+
+
+def reconstruct_final_path(grid, parent_tracker, current_step, start_cell):
+    """Mark the path back from current_step; returns it start to target."""
+    path = [current_step]
+    while parent_tracker[current_step] != -1:
+        current_step = parent_tracker[current_step]
+        path.append(current_step)
+        if current_step != start_cell:
+            grid.mark_path(current_step)
+        yield True
+    path.reverse()
+    return path
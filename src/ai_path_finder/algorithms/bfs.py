@@ -0,0 +1,56 @@
+from array import array
+from collections import deque
+
+from ai_path_finder.algorithms.metrics import SearchMetrics
+from ai_path_finder.algorithms.result import SearchResult, SearchTree
+
+
+def run_bfs(grid, start_cell, target_cell, metrics=None):
+    if metrics is None:
+        metrics = SearchMetrics()
+
+    nodes_to_visit_queue = deque([start_cell])
+    parent_tracker = array("i", [-1]) * grid.size
+    nodes_already_visited = bytearray(grid.size)
+    nodes_already_visited[start_cell] = 1
+    neighbor_masks = grid.neighbor_masks
+    mask_deltas = grid.mask_deltas
+
+    while nodes_to_visit_queue:
+        current_active_cell = nodes_to_visit_queue.popleft()
+
+        if current_active_cell == target_cell:
+            path = yield from reconstruct_final_path(grid, parent_tracker, target_cell, start_cell)
+            # Every discovered cell already has its fewest-move parent.
+            tree = SearchTree(start_cell, parent_tracker, nodes_already_visited, False)
+            return SearchResult.from_path(grid, path, metrics, tree)
+
+        metrics.nodes_expanded += 1
+        for delta in mask_deltas[neighbor_masks[current_active_cell]]:
+            neighbor_candidate = current_active_cell + delta
+            if not nodes_already_visited[neighbor_candidate]:
+                nodes_already_visited[neighbor_candidate] = 1
+                parent_tracker[neighbor_candidate] = current_active_cell
+                grid.mark_frontier(neighbor_candidate)
+                nodes_to_visit_queue.append(neighbor_candidate)
+                metrics.nodes_pushed += 1
+
+        metrics.peak_frontier = max(metrics.peak_frontier, len(nodes_to_visit_queue))
+
+        if current_active_cell != start_cell:
+            grid.mark_explored(current_active_cell)
+        yield True
+    return SearchResult.not_found(metrics, SearchTree(start_cell, parent_tracker, nodes_already_visited, True))
+
+
+def reconstruct_final_path(grid, parent_tracker, current_step, start_cell):
+    """Mark the path back from current_step; returns it start to target."""
+    path = [current_step]
+    while parent_tracker[current_step] != -1:
+        current_step = parent_tracker[current_step]
+        path.append(current_step)
+        if current_step != start_cell:
+            grid.mark_path(current_step)
+        yield True
+    path.reverse()
+    return path
@@ -0,0 +1,254 @@
+"""
+Implementation of Bidirectional Search.
+Level-synchronous BFS plus weighted bidirectional Dijkstra and A*.
+"""
+import heapq
+from array import array
+
+from ai_path_finder.algorithms.astar import make_heuristic
+from ai_path_finder.algorithms.metrics import SearchMetrics
+from ai_path_finder.algorithms.result import SearchResult
+
+UNREACHED_COST = float("inf")
+UNVISITED_DEPTH = -1
+
+
+def run_bidirectional(grid, start_cell, target_cell, metrics=None):
+    """
+    Expand one whole BFS level at a time, always on the smaller frontier.
+    The first contact is not necessarily the shortest, so the level it
+    appears in is finished and the best meeting edge kept.
+    """
+    if metrics is None:
+        metrics = SearchMetrics()
+    if start_cell == target_cell:
+        return SearchResult.from_path(grid, [start_cell], metrics)
+
+    start_frontier = [start_cell]
+    target_frontier = [target_cell]
+
+    start_parent_map = array("i", [-1]) * grid.size
+    target_parent_map = array("i", [-1]) * grid.size
+
+    start_depth = array("i", [UNVISITED_DEPTH]) * grid.size
+    target_depth = array("i", [UNVISITED_DEPTH]) * grid.size
+    start_depth[start_cell] = 0
+    target_depth[target_cell] = 0
+    neighbor_masks = grid.neighbor_masks
+    mask_deltas = grid.mask_deltas
+
+    best_length = grid.size
+    meeting_edge = None
+
+    while start_frontier and target_frontier and meeting_edge is None:
+        # The move set is closed under reversal, so neighbor_masks also
+        # lists the predecessors the target side walks back through.
+        is_start_side = len(start_frontier) <= len(target_frontier)
+        if is_start_side:
+            frontier, own_depth, other_depth = start_frontier, start_depth, target_depth
+            parent_map, origin_cell = start_parent_map, start_cell
+        else:
+            frontier, own_depth, other_depth = target_frontier, target_depth, start_depth
+            parent_map, origin_cell = target_parent_map, target_cell
+
+        next_frontier = []
+        for current_active_cell in frontier:
+            if current_active_cell != origin_cell:
+                grid.mark_explored(current_active_cell)
+
+            metrics.nodes_expanded += 1
+            next_depth = own_depth[current_active_cell] + 1
+            for delta in mask_deltas[neighbor_masks[current_active_cell]]:
+                neighbor = current_active_cell + delta
+
+                if other_depth[neighbor] != UNVISITED_DEPTH:
+                    length = next_depth + other_depth[neighbor]
+                    if length < best_length:
+                        best_length = length
+                        if is_start_side:
+                            meeting_edge = (current_active_cell, neighbor)
+                        else:
+                            meeting_edge = (neighbor, current_active_cell)
+
+                if own_depth[neighbor] == UNVISITED_DEPTH:
+                    own_depth[neighbor] = next_depth
+                    parent_map[neighbor] = current_active_cell
+                    grid.mark_frontier(neighbor)
+                    next_frontier.append(neighbor)
+                    metrics.nodes_pushed += 1
+            yield True
+
+        if is_start_side:
+            start_frontier = next_frontier
+        else:
+            target_frontier = next_frontier
+
+        metrics.peak_frontier = max(metrics.peak_frontier, len(start_frontier) + len(target_frontier))
+
+    if meeting_edge is None:
+        return SearchResult.not_found(metrics)
+    path = yield from _reconstruct_bidirectional(
+        grid,
+        start_parent_map,
+        target_parent_map,
+        meeting_edge,
+        start_cell,
+        target_cell,
+    )
+    return SearchResult.from_path(grid, path, metrics)
+
+
+def run_bidirectional_dijkstra(grid, start_cell, target_cell, metrics=None):
+    return (yield from bidirectional_best_first(grid, start_cell, target_cell, metrics, use_heuristic=False))
+
+
+def run_bidirectional_astar(grid, start_cell, target_cell, metrics=None, heuristic=None, start_heuristic=None):
+    return (yield from bidirectional_best_first(
+        grid, start_cell, target_cell, metrics, use_heuristic=True,
+        heuristic=heuristic, start_heuristic=start_heuristic,
+    ))
+
+
+def bidirectional_best_first(grid, start_cell, target_cell, metrics=None, use_heuristic=False, heuristic=None, start_heuristic=None):
+    """
+    Weighted bidirectional search on the reverse-edge view of the grid.
+    Entering a cell costs its weight, so the backward search pays the weight
+    of the cell it leaves. With use_heuristic the keys carry the averaged
+    potential p(v) = (h_target(v) - h_start(v)) / 2, which stays consistent
+    for both directions. Whichever side has fewer open cells expands next,
+    and the search stops once the two smallest keys add up to the best
+    meeting cost found so far. heuristic and start_heuristic replace the
+    geometric estimates to the target and from the start.
+    """
+    if metrics is None:
+        metrics = SearchMetrics()
+    if start_cell == target_cell:
+        return SearchResult.from_path(grid, [start_cell], metrics)
+
+    potential = None
+    if use_heuristic:
+        estimate_to_target = heuristic or make_heuristic(grid, target_cell)
+        estimate_from_start = start_heuristic or make_heuristic(grid, start_cell)
+
+        def potential(cell):
+            return (estimate_to_target(cell) - estimate_from_start(cell)) / 2
+
+    start_cost = array("d", [UNREACHED_COST]) * grid.size
+    target_cost = array("d", [UNREACHED_COST]) * grid.size
+    start_cost[start_cell] = 0
+    target_cost[target_cell] = 0
+
+    start_parent_map = array("i", [-1]) * grid.size
+    target_parent_map = array("i", [-1]) * grid.size
+    start_settled = bytearray(grid.size)
+    target_settled = bytearray(grid.size)
+
+    # Priority Queues store tuples: (Key, PriorityCount, Cell).
+    start_queue = [(potential(start_cell) if potential else 0, 0, start_cell)]
+    target_queue = [(-potential(target_cell) if potential else 0, 0, target_cell)]
+    open_counts = [1, 1]
+    counter = 1
+
+    weights = grid.weights
+    neighbor_masks = grid.neighbor_masks
+    mask_deltas = grid.mask_deltas
+
+    best_cost = UNREACHED_COST
+    meeting_edge = None
+
+    while True:
+        # Drop entries superseded by a cheaper push so the tops are exact.
+        while start_queue and start_settled[start_queue[0][2]]:
+            heapq.heappop(start_queue)
+        while target_queue and target_settled[target_queue[0][2]]:
+            heapq.heappop(target_queue)
+        if not start_queue or not target_queue:
+            break
+        if start_queue[0][0] + target_queue[0][0] >= best_cost:
+            break
+
+        is_start_side = open_counts[0] <= open_counts[1]
+        if is_start_side:
+            queue, own_cost, other_cost = start_queue, start_cost, target_cost
+            own_settled, parent_map, origin_cell = start_settled, start_parent_map, start_cell
+            side, key_sign = 0, 1
+        else:
+            queue, own_cost, other_cost = target_queue, target_cost, start_cost
+            own_settled, parent_map, origin_cell = target_settled, target_parent_map, target_cell
+            side, key_sign = 1, -1
+
+        _, _, current_active_cell = heapq.heappop(queue)
+        own_settled[current_active_cell] = 1
+        open_counts[side] -= 1
+        if current_active_cell != origin_cell:
+            grid.mark_explored(current_active_cell)
+
+        metrics.nodes_expanded += 1
+        current_cost = own_cost[current_active_cell]
+        leaving_weight = weights[current_active_cell]
+        for delta in mask_deltas[neighbor_masks[current_active_cell]]:
+            neighbor = current_active_cell + delta
+            new_cost = current_cost + (weights[neighbor] if is_start_side else leaving_weight)
+
+            meeting_cost = new_cost + other_cost[neighbor]
+            if meeting_cost < best_cost:
+                best_cost = meeting_cost
+                if is_start_side:
+                    meeting_edge = (current_active_cell, neighbor)
+                else:
+                    meeting_edge = (neighbor, current_active_cell)
+
+            if new_cost < own_cost[neighbor] and not own_settled[neighbor]:
+                if own_cost[neighbor] == UNREACHED_COST:
+                    open_counts[side] += 1
+                own_cost[neighbor] = new_cost
+                parent_map[neighbor] = current_active_cell
+                key = new_cost + key_sign * potential(neighbor) if potential else new_cost
+                heapq.heappush(queue, (key, counter, neighbor))
+                counter += 1
+                grid.mark_frontier(neighbor)
+                metrics.nodes_pushed += 1
+
+        metrics.peak_frontier = max(metrics.peak_frontier, open_counts[0] + open_counts[1])
+        yield True
+
+    if meeting_edge is None:
+        return SearchResult.not_found(metrics)
+    path = yield from _reconstruct_bidirectional(
+        grid,
+        start_parent_map,
+        target_parent_map,
+        meeting_edge,
+        start_cell,
+        target_cell,
+    )
+    return SearchResult.from_path(grid, path, metrics)
+
+
+def _reconstruct_bidirectional(grid, start_map, target_map, meeting_edge, start, target):
+    # meeting_edge is (last cell of the start half, first cell of the target half).
+    start_side_cell, target_side_cell = meeting_edge
+    for meeting_cell in meeting_edge:
+        if meeting_cell != start and meeting_cell != target:
+            grid.mark_path(meeting_cell)
+    yield True
+
+    start_half = [start_side_cell]
+    curr = start_side_cell
+    while start_map[curr] != -1:
+        curr = start_map[curr]
+        start_half.append(curr)
+        if curr != start:
+            grid.mark_path(curr)
+        yield True
+    start_half.reverse()
+
+    target_half = [target_side_cell]
+    curr = target_side_cell
+    while target_map[curr] != -1:
+        curr = target_map[curr]
+        target_half.append(curr)
+        if curr != target:
+            grid.mark_path(curr)
+        yield True
+    return start_half + target_half
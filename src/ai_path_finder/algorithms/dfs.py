@@ -0,0 +1,53 @@
+from array import array
+
+from ai_path_finder.algorithms.metrics import SearchMetrics
+from ai_path_finder.algorithms.result import SearchResult
+
+
+def run_dfs(grid, start_cell, target_cell, metrics=None):
+    if metrics is None:
+        metrics = SearchMetrics()
+
+    nodes_to_visit_stack = [start_cell]
+    parent_tracker = array("i", [-1]) * grid.size
+    nodes_already_visited = bytearray(grid.size)
+    nodes_already_visited[start_cell] = 1
+    neighbor_masks = grid.neighbor_masks
+    mask_deltas = grid.mask_deltas
+
+    while nodes_to_visit_stack:
+        current_active_cell = nodes_to_visit_stack.pop()
+
+        if current_active_cell == target_cell:
+            path = yield from reconstruct_final_path(grid, parent_tracker, target_cell, start_cell)
+            return SearchResult.from_path(grid, path, metrics)
+
+        if current_active_cell != start_cell:
+            grid.mark_explored(current_active_cell)
+
+        metrics.nodes_expanded += 1
+        for delta in mask_deltas[neighbor_masks[current_active_cell]]:
+            neighbor_candidate = current_active_cell + delta
+            if not nodes_already_visited[neighbor_candidate]:
+                nodes_already_visited[neighbor_candidate] = 1
+                parent_tracker[neighbor_candidate] = current_active_cell
+                grid.mark_frontier(neighbor_candidate)
+                nodes_to_visit_stack.append(neighbor_candidate)
+                metrics.nodes_pushed += 1
+
+        metrics.peak_frontier = max(metrics.peak_frontier, len(nodes_to_visit_stack))
+        yield True
+    return SearchResult.not_found(metrics)
+
+
+def reconstruct_final_path(grid, parent_tracker, current_step, start_cell):
+    """Mark the path back from current_step; returns it start to target."""
+    path = [current_step]
+    while parent_tracker[current_step] != -1:
+        current_step = parent_tracker[current_step]
+        path.append(current_step)
+        if current_step != start_cell:
+            grid.mark_path(current_step)
+        yield True
+    path.reverse()
+    return path
@@ -0,0 +1,101 @@
+"""
+Implementation of Depth-Limited Search (DLS).
+Iterative approach.
+"""
+from array import array
+
+from ai_path_finder.algorithms.metrics import SearchMetrics
+from ai_path_finder.algorithms.result import SearchResult
+
+UNVISITED_DEPTH = 2**31 - 1
+
+
+def run_dls(grid, start_cell, target_cell, limit=50, metrics=None):
+    if metrics is None:
+        metrics = SearchMetrics()
+
+    parent_tracker = array("i", [-1]) * grid.size
+    visited_at_depth = array("i", [UNVISITED_DEPTH]) * grid.size
+    visit_epoch = array("i", [0]) * grid.size
+
+    found, _ = yield from depth_limited_pass(
+        grid, start_cell, target_cell, limit,
+        parent_tracker, visited_at_depth, visit_epoch, 1, metrics,
+    )
+    if found:
+        path = yield from reconstruct_final_path(grid, parent_tracker, target_cell, start_cell)
+        return SearchResult.from_path(grid, path, metrics)
+    return SearchResult.not_found(metrics)
+
+
+def depth_limited_pass(grid, start_cell, target_cell, limit, parent_tracker, visited_at_depth, visit_epoch, epoch, metrics, touched_cells=None):
+    """
+    One depth-first sweep bounded by limit; returns (found, cutoff_occurred).
+
+    visited_at_depth holds the shallowest depth each cell was reached at and
+    may carry over from earlier sweeps. A cell is pushed again only at a
+    strictly shallower depth, or at its recorded depth once per epoch, and
+    stale stack entries are skipped when popped. Each cell is therefore
+    expanded at most once per depth improvement.
+    """
+    nodes_to_visit_stack = [(start_cell, 0)]
+    visited_at_depth[start_cell] = 0
+    visit_epoch[start_cell] = epoch
+    neighbor_masks = grid.neighbor_masks
+    mask_deltas = grid.mask_deltas
+    cutoff_occurred = False
+
+    while nodes_to_visit_stack:
+        current_active_cell, current_depth = nodes_to_visit_stack.pop()
+
+        if current_active_cell == target_cell:
+            return True, cutoff_occurred
+
+        if current_depth > visited_at_depth[current_active_cell]:
+            continue
+
+        if current_depth >= limit:
+            # Only a cut that hides undiscovered cells justifies a deeper sweep.
+            if not cutoff_occurred:
+                for delta in mask_deltas[neighbor_masks[current_active_cell]]:
+                    if visited_at_depth[current_active_cell + delta] == UNVISITED_DEPTH:
+                        cutoff_occurred = True
+                        break
+            continue
+
+        if current_active_cell != start_cell:
+            grid.mark_explored(current_active_cell)
+
+        metrics.nodes_expanded += 1
+        new_depth = current_depth + 1
+        for delta in mask_deltas[neighbor_masks[current_active_cell]]:
+            neighbor = current_active_cell + delta
+            known_depth = visited_at_depth[neighbor]
+            if new_depth < known_depth or (new_depth == known_depth and visit_epoch[neighbor] != epoch):
+                visited_at_depth[neighbor] = new_depth
+                visit_epoch[neighbor] = epoch
+                parent_tracker[neighbor] = current_active_cell
+                grid.mark_frontier(neighbor)
+                nodes_to_visit_stack.append((neighbor, new_depth))
+                metrics.nodes_pushed += 1
+                if known_depth != UNVISITED_DEPTH:
+                    metrics.nodes_reopened += 1
+                if touched_cells is not None:
+                    touched_cells.append(neighbor)
+
+        metrics.peak_frontier = max(metrics.peak_frontier, len(nodes_to_visit_stack))
+        yield True
+    return False, cutoff_occurred
+
+
+def reconstruct_final_path(grid, parent_tracker, current_step, start_cell):
+    """Mark the path back from current_step; returns it start to target."""
+    path = [current_step]
+    while parent_tracker[current_step] != -1:
+        current_step = parent_tracker[current_step]
+        path.append(current_step)
+        if current_step != start_cell:
+            grid.mark_path(current_step)
+        yield True
+    path.reverse()
+    return path
@@ -0,0 +1,444 @@
+"""
+Implementation of Hierarchical Pathfinding A* (HPA*).
+Plans over cluster entrances first, then refines each leg inside one cluster.
+"""
+import heapq
+import time
+import zlib
+from array import array
+from itertools import pairwise
+
+from ai_path_finder.algorithms.astar import make_heuristic
+from ai_path_finder.algorithms.metrics import SearchMetrics
+from ai_path_finder.algorithms.result import SearchResult
+
+DEFAULT_CLUSTER_SIZE = 16
+# A short open border run gets one transition in its middle; longer runs
+# get one at each end and every ENTRANCE_SPACING cells in between, so
+# routes over weighted terrain are not forced through a few points.
+LONG_ENTRANCE_LENGTH = 6
+ENTRANCE_SPACING = 4
+# refresh() yields after this many border rebuilds, which together cost
+# about as much as linking one cluster.
+BORDERS_PER_STEP = 256
+UNREACHED_COST = float("inf")
+
+
+def run_hpastar(grid, start_cell, target_cell, metrics=None, hierarchy=None, cluster_size=DEFAULT_CLUSTER_SIZE):
+    """
+    Without a hierarchy a fresh ClusterGraph is built first, which costs
+    far more than the query; callers with many queries on one map keep a
+    ClusterGraph and pass it in. A hierarchy that is already up to date is
+    only read, so a search on another thread can share it with the screen.
+    Paths are near-optimal: the abstract search only crosses cluster
+    borders at the chosen transitions.
+    """
+    if metrics is None:
+        metrics = SearchMetrics()
+    if hierarchy is None:
+        hierarchy = ClusterGraph(grid, cluster_size)
+    elif hierarchy.grid.map_id != grid.map_id or hierarchy.grid.map_version != grid.map_version:
+        raise ValueError("the cluster graph belongs to a different map")
+
+    if hierarchy.needs_refresh:
+        yield from hierarchy.refresh()
+
+    abstract_path = yield from hierarchy.abstract_search(grid, start_cell, target_cell, metrics)
+    if abstract_path is None:
+        return SearchResult.not_found(metrics)
+
+    path = [start_cell]
+    for from_cell, to_cell in pairwise(abstract_path):
+        if hierarchy.cluster_of(from_cell) == hierarchy.cluster_of(to_cell):
+            path.extend(hierarchy.local_path(from_cell, to_cell, metrics)[1:])
+        else:
+            # Consecutive cells in different clusters are one transition move.
+            path.append(to_cell)
+
+    for cell in path[1:-1]:
+        grid.mark_path(cell)
+        yield True
+    return SearchResult.from_path(grid, path, metrics)
+
+
+class ClusterGraph:
+    """
+    The grid is cut into cluster_size squares. Wherever a run of open
+    cells faces another run across a cluster border, one or two of those
+    facing pairs become transitions, and both cells become abstract nodes.
+    Each cluster links its nodes with the cheapest routes that stay inside
+    it. Entering a cell costs its weight and moves are reversible, so one
+    sweep per node pair gives both directions: d(b, a) = d(a, b) + w[a] - w[b].
+
+    Diagonal moves need both orthogonal cells open, so every diagonal
+    border crossing sits next to orthogonal ones and only those are used.
+
+    attach() follows single-cell edits: each marks the clusters around the
+    edited 3x3 block dirty, and refresh() rebuilds just their borders and
+    links, plus any neighbor whose shared border changed. Bulk loads notify
+    nobody; refresh() notices the new map_version and compares a checksum
+    of weights and adjacency before deciding on a full rebuild.
+    """
+
+    def __init__(self, grid, cluster_size=DEFAULT_CLUSTER_SIZE):
+        self.grid = grid
+        self.cluster_size = cluster_size
+        self.cluster_rows = -(-grid.rows // cluster_size)
+        self.cluster_cols = -(-grid.cols // cluster_size)
+        self.cluster_count = self.cluster_rows * self.cluster_cols
+        # Cluster index of every cell, so sweeps test membership with one lookup.
+        self.cell_clusters = array("i", bytes(4 * grid.size))
+        for row in range(grid.rows):
+            if row % cluster_size == 0:
+                first_cluster = (row // cluster_size) * self.cluster_cols
+                row_clusters = array("i", (first_cluster + col // cluster_size for col in range(grid.cols)))
+            self.cell_clusters[row * grid.cols:(row + 1) * grid.cols] = row_clusters
+
+        # (cluster, right or lower neighbor) -> [(cell, facing cell), ...]
+        self.transitions = {}
+        # cell -> {cell across a border: cost of that move}
+        self.inter_edges = {}
+        # cell -> {node of the same cluster: cost of the best route inside it}
+        self.intra_edges = {}
+        self.cluster_nodes = [[] for _ in range(self.cluster_count)]
+
+        self.dirty_clusters = set(range(self.cluster_count))
+        self.pending_borders = set()
+        self.pending_clusters = set()
+        self.tracked_version = None
+        self.fingerprint = None
+        self.is_attached = False
+
+        self.last_rebuilt = 0
+        self.last_refresh_time = 0.0
+
+    @property
+    def node_count(self):
+        return len(self.inter_edges)
+
+    @property
+    def edge_count(self):
+        return sum(map(len, self.inter_edges.values())) + sum(map(len, self.intra_edges.values()))
+
+    @property
+    def needs_refresh(self):
+        grid = self.grid
+        is_pending = self.dirty_clusters or self.pending_borders or self.pending_clusters
+        return bool(is_pending) or self.tracked_version != (grid.map_id, grid.map_version)
+
+    def attach(self):
+        if not self.is_attached:
+            self.grid.edit_listeners.append(self.cell_changed)
+            self.is_attached = True
+
+    def detach(self):
+        if self.is_attached:
+            self.grid.edit_listeners.remove(self.cell_changed)
+            self.is_attached = False
+
+    def cell_changed(self, cell):
+        grid = self.grid
+        version = (grid.map_id, grid.map_version)
+        if version == self.tracked_version:
+            # An endpoint moved onto an open cell; nothing to rebuild.
+            return
+        if self.tracked_version is not None:
+            self.tracked_version = version
+        # Walls change moves anywhere in the 3x3 block; weights change the
+        # cost of entering the cell from any side.
+        row, col = divmod(cell, grid.cols)
+        size = self.cluster_size
+        for affected_row in range(max(row - 1, 0), min(row + 2, grid.rows)):
+            for affected_col in range(max(col - 1, 0), min(col + 2, grid.cols)):
+                self.dirty_clusters.add((affected_row // size) * self.cluster_cols + affected_col // size)
+
+    def cluster_of(self, cell):
+        return self.cell_clusters[cell]
+
+    def cluster_bounds(self, cluster):
+        """(first row, end row, first col, end col) of a cluster."""
+        cluster_row, cluster_col = divmod(cluster, self.cluster_cols)
+        first_row = cluster_row * self.cluster_size
+        first_col = cluster_col * self.cluster_size
+        return (
+            first_row,
+            min(first_row + self.cluster_size, self.grid.rows),
+            first_col,
+            min(first_col + self.cluster_size, self.grid.cols),
+        )
+
+    def refresh(self):
+        """
+        Bring the graph up to date with the grid, yielding once per rebuilt
+        cluster and every BORDERS_PER_STEP borders. An abandoned refresh
+        picks up where it stopped next time. Returns how many clusters were
+        rebuilt.
+        """
+        grid = self.grid
+        version = (grid.map_id, grid.map_version)
+        if version != self.tracked_version:
+            if self.tracked_version is None or self._map_fingerprint() != self.fingerprint:
+                self.dirty_clusters.update(range(self.cluster_count))
+            self.tracked_version = version
+
+        started = time.perf_counter()
+        if self.dirty_clusters:
+            self.pending_borders.update(self._borders_around(self.dirty_clusters))
+            self.pending_clusters.update(self.dirty_clusters)
+            self.dirty_clusters = set()
+
+        # Every border is rebuilt before any cluster is linked, since the
+        # links join the nodes the borders' transitions define.
+        while self.pending_borders:
+            border = self.pending_borders.pop()
+            if self._rebuild_border(border):
+                self.pending_clusters.update(border)
+            if len(self.pending_borders) % BORDERS_PER_STEP == 0:
+                yield True
+
+        rebuilt = 0
+        while self.pending_clusters:
+            self._link_cluster(self.pending_clusters.pop())
+            rebuilt += 1
+            yield True
+
+        if rebuilt:
+            self.fingerprint = self._map_fingerprint()
+            self.last_rebuilt = rebuilt
+            self.last_refresh_time = time.perf_counter() - started
+        return rebuilt
+
+    def _map_fingerprint(self):
+        return zlib.crc32(self.grid.neighbor_masks, zlib.crc32(self.grid.weights))
+
+    def _borders_around(self, clusters):
+        borders = set()
+        cluster_cols = self.cluster_cols
+        for cluster in clusters:
+            cluster_row, cluster_col = divmod(cluster, cluster_cols)
+            if cluster_col + 1 < cluster_cols:
+                borders.add((cluster, cluster + 1))
+            if cluster_col > 0:
+                borders.add((cluster - 1, cluster))
+            if cluster_row + 1 < self.cluster_rows:
+                borders.add((cluster, cluster + cluster_cols))
+            if cluster_row > 0:
+                borders.add((cluster - cluster_cols, cluster))
+        return borders
+
+    def _rebuild_border(self, border):
+        """Recompute one border's transitions; returns whether they changed."""
+        grid = self.grid
+        cols = grid.cols
+        weights = grid.weights
+        neighbor_masks = grid.neighbor_masks
+        mask_deltas = grid.mask_deltas
+
+        cluster, neighbor_cluster = border
+        first_row, end_row, first_col, end_col = self.cluster_bounds(cluster)
+        if cluster // self.cluster_cols == neighbor_cluster // self.cluster_cols:
+            # Vertical border: pairs run down the cluster's last column.
+            step = cols
+            facing_offset = 1
+            first_cell = first_row * cols + end_col - 1
+            length = end_row - first_row
+        else:
+            step = 1
+            facing_offset = cols
+            first_cell = (end_row - 1) * cols + first_col
+            length = end_col - first_col
+
+        transitions = []
+        run_length = 0
+        for index in range(length + 1):
+            cell = first_cell + index * step
+            is_open = index < length and facing_offset in mask_deltas[neighbor_masks[cell]]
+            if is_open:
+                run_length += 1
+                continue
+            if run_length:
+                run_start = cell - run_length * step
+                if run_length >= LONG_ENTRANCE_LENGTH:
+                    picks = [run_start + offset * step for offset in range(0, run_length - 1, ENTRANCE_SPACING)]
+                    picks.append(cell - step)
+                else:
+                    picks = (run_start + (run_length // 2) * step,)
+                transitions.extend((pick, pick + facing_offset) for pick in picks)
+                run_length = 0
+
+        old_transitions = self.transitions.get(border, [])
+        inter_edges = self.inter_edges
+        changed = old_transitions != transitions
+        for cell, facing_cell in old_transitions:
+            for from_cell, to_cell in ((cell, facing_cell), (facing_cell, cell)):
+                edges = inter_edges[from_cell]
+                del edges[to_cell]
+                if not edges:
+                    del inter_edges[from_cell]
+        for cell, facing_cell in transitions:
+            inter_edges.setdefault(cell, {})[facing_cell] = weights[facing_cell]
+            inter_edges.setdefault(facing_cell, {})[cell] = weights[cell]
+        if transitions:
+            self.transitions[border] = transitions
+        else:
+            self.transitions.pop(border, None)
+        return changed
+
+    def _link_cluster(self, cluster):
+        """Recompute the node list and every inside route of one cluster."""
+        first_row, end_row, first_col, end_col = self.cluster_bounds(cluster)
+        cols = self.grid.cols
+        weights = self.grid.weights
+        inter_edges = self.inter_edges
+        intra_edges = self.intra_edges
+
+        for node in self.cluster_nodes[cluster]:
+            intra_edges.pop(node, None)
+
+        # Nodes are exactly the cluster's cells that own a transition.
+        nodes = []
+        for row in (first_row, end_row - 1) if end_row - first_row > 1 else (first_row,):
+            nodes.extend(cell for cell in range(row * cols + first_col, row * cols + end_col) if cell in inter_edges)
+        for row in range(first_row + 1, end_row - 1):
+            for cell in {row * cols + first_col, row * cols + end_col - 1}:
+                if cell in inter_edges:
+                    nodes.append(cell)
+        self.cluster_nodes[cluster] = nodes
+
+        for node in nodes:
+            intra_edges[node] = {}
+        for index, node in enumerate(nodes[:-1]):
+            later_nodes = nodes[index + 1:]
+            settled, _ = self._local_sweep(node, cluster, set(later_nodes))
+            for other_node in later_nodes:
+                cost = settled.get(other_node)
+                if cost is not None:
+                    intra_edges[node][other_node] = cost
+                    intra_edges[other_node][node] = cost + weights[node] - weights[other_node]
+
+    def _local_sweep(self, source_cell, cluster, goal_cells=None, metrics=None):
+        """
+        Dijkstra from source_cell that never leaves cluster. Stops once
+        every goal cell is settled. Returns (settled costs, parents).
+        """
+        grid = self.grid
+        weights = grid.weights
+        neighbor_masks = grid.neighbor_masks
+        mask_deltas = grid.mask_deltas
+        cell_clusters = self.cell_clusters
+
+        settled = {}
+        best_costs = {source_cell: 0}
+        parents = {source_cell: -1}
+        remaining_goals = len(goal_cells) if goal_cells else -1
+        frontier = [(0, source_cell)]
+        while frontier:
+            current_cost, current_cell = heapq.heappop(frontier)
+            if current_cell in settled:
+                continue
+            settled[current_cell] = current_cost
+            if goal_cells and current_cell in goal_cells:
+                remaining_goals -= 1
+                if not remaining_goals:
+                    break
+            if metrics is not None:
+                metrics.nodes_expanded += 1
+
+            for delta in mask_deltas[neighbor_masks[current_cell]]:
+                neighbor = current_cell + delta
+                if neighbor in settled or cell_clusters[neighbor] != cluster:
+                    continue
+                new_cost = current_cost + weights[neighbor]
+                if new_cost < best_costs.get(neighbor, UNREACHED_COST):
+                    best_costs[neighbor] = new_cost
+                    parents[neighbor] = current_cell
+                    heapq.heappush(frontier, (new_cost, neighbor))
+        return settled, parents
+
+    def local_path(self, from_cell, to_cell, metrics=None):
+        """Cheapest route between two cells of one cluster that stays inside it."""
+        _, parents = self._local_sweep(from_cell, self.cluster_of(from_cell), {to_cell}, metrics)
+        path = [to_cell]
+        while parents[path[-1]] != -1:
+            path.append(parents[path[-1]])
+        path.reverse()
+        return path
+
+    def abstract_search(self, grid, start_cell, target_cell, metrics):
+        """
+        A* over the abstract nodes, with start and target linked into their
+        clusters for this query only. Expanded nodes are marked on grid, so
+        the visualizer shows the abstract level being searched. Returns the
+        abstract path from start to target, or None.
+        """
+        weights = grid.weights
+        start_cluster = self.cluster_of(start_cell)
+        target_cluster = self.cluster_of(target_cell)
+
+        start_goals = set(self.cluster_nodes[start_cluster])
+        if target_cluster == start_cluster:
+            start_goals.add(target_cell)
+        start_links, _ = self._local_sweep(start_cell, start_cluster, start_goals, metrics)
+        start_links = {cell: cost for cell, cost in start_links.items() if cell in start_goals and cell != start_cell}
+
+        # The sweep runs from the target, so each cost is turned around.
+        target_goals = set(self.cluster_nodes[target_cluster])
+        target_links, _ = self._local_sweep(target_cell, target_cluster, target_goals, metrics)
+        target_links = {
+            cell: cost + weights[target_cell] - weights[cell]
+            for cell, cost in target_links.items()
+            if cell in target_goals and cell != target_cell
+        }
+
+        heuristic = make_heuristic(grid, target_cell)
+        inter_edges = self.inter_edges
+        intra_edges = self.intra_edges
+        no_edges = {}
+
+        best_costs = {start_cell: 0}
+        parents = {start_cell: None}
+        closed = set()
+        start_estimate = heuristic(start_cell)
+        open_heap = [(start_estimate, start_estimate, 0, start_cell)]
+        counter = 1
+
+        while open_heap:
+            _, _, _, current_cell = heapq.heappop(open_heap)
+            if current_cell in closed:
+                continue
+            closed.add(current_cell)
+
+            if current_cell == target_cell:
+                abstract_path = [target_cell]
+                while parents[abstract_path[-1]] is not None:
+                    abstract_path.append(parents[abstract_path[-1]])
+                abstract_path.reverse()
+                return abstract_path
+
+            metrics.nodes_expanded += 1
+            current_cost = best_costs[current_cell]
+            if current_cell == start_cell:
+                edge_groups = (start_links, inter_edges.get(current_cell, no_edges))
+            else:
+                edge_groups = (intra_edges.get(current_cell, no_edges), inter_edges.get(current_cell, no_edges))
+            link_cost = target_links.get(current_cell)
+            if link_cost is not None:
+                edge_groups += ({target_cell: link_cost},)
+
+            for edges in edge_groups:
+                for neighbor, edge_cost in edges.items():
+                    new_cost = current_cost + edge_cost
+                    if new_cost < best_costs.get(neighbor, UNREACHED_COST) and neighbor not in closed:
+                        best_costs[neighbor] = new_cost
+                        parents[neighbor] = current_cell
+                        estimate = heuristic(neighbor)
+                        heapq.heappush(open_heap, (new_cost + estimate, estimate, counter, neighbor))
+                        counter += 1
+                        grid.mark_frontier(neighbor)
+                        metrics.nodes_pushed += 1
+
+            metrics.peak_frontier = max(metrics.peak_frontier, len(open_heap))
+            if current_cell != start_cell:
+                grid.mark_explored(current_cell)
+            yield True
+        return None
@@ -0,0 +1,62 @@
+"""
+Implementation of Iterative Deepening DFS (IDDFS).
+Incremental engine: only touched cells are reset between depths.
+"""
+from array import array
+
+from ai_path_finder.algorithms.dls import UNVISITED_DEPTH, depth_limited_pass
+from ai_path_finder.algorithms.metrics import SearchMetrics
+from ai_path_finder.algorithms.result import SearchResult
+
+
+def run_iddfs(grid, start_cell, target_cell, metrics=None):
+    if metrics is None:
+        metrics = SearchMetrics()
+
+    parent_tracker = array("i", [-1]) * grid.size
+    # Transposition table shared by every sweep. After depth L it holds the
+    # exact distance of every cell within L moves, so later sweeps expand
+    # each known cell once, at its true depth, instead of re-walking every
+    # longer route to it.
+    best_depth = array("i", [UNVISITED_DEPTH]) * grid.size
+    visit_epoch = array("i", [0]) * grid.size
+    touched_cells = []
+
+    for current_max_depth in range(1, grid.size):
+        grid.clear_marks(touched_cells)
+        touched_cells.clear()
+
+        found, cutoff_occurred = yield from depth_limited_pass(
+            grid,
+            start_cell,
+            target_cell,
+            current_max_depth,
+            parent_tracker,
+            best_depth,
+            visit_epoch,
+            current_max_depth,
+            metrics,
+            touched_cells,
+        )
+
+        if found:
+            path = yield from reconstruct_final_path(grid, parent_tracker, target_cell, start_cell)
+            return SearchResult.from_path(grid, path, metrics)
+
+        if not cutoff_occurred:
+            # Nothing was hidden by the depth limit: the target is unreachable.
+            break
+    return SearchResult.not_found(metrics)
+
+
+def reconstruct_final_path(grid, parent_tracker, current_step, start_cell):
+    """Mark the path back from current_step; returns it start to target."""
+    path = [current_step]
+    while parent_tracker[current_step] != -1:
+        current_step = parent_tracker[current_step]
+        path.append(current_step)
+        if current_step != start_cell:
+            grid.mark_path(current_step)
+        yield True
+    path.reverse()
+    return path
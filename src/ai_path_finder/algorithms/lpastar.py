@@ -0,0 +1,227 @@
+"""
+Implementation of Lifelong Planning A* (LPA*).
+Keeps g/rhs values after a search so grid edits only repair what they touch.
+"""
+import heapq
+from array import array
+
+from ai_path_finder.algorithms.astar import make_heuristic
+from ai_path_finder.algorithms.metrics import SearchMetrics
+from ai_path_finder.algorithms.result import SearchResult
+
+UNREACHED_COST = float("inf")
+UNKNOWN_ESTIMATE = -1.0
+
+
+def run_lpastar(grid, start_cell, target_cell, metrics=None):
+    """
+    One-shot search. Callers that want to keep replanning create a
+    LifelongPlanner themselves and drive its search() after every edit.
+    """
+    planner = LifelongPlanner(grid, start_cell, target_cell, metrics)
+    return (yield from planner.search())
+
+
+class LifelongPlanner:
+    """
+    g[cell] is the settled cost from the start and rhs[cell] the one-step
+    lookahead, weights[cell] + min(g[neighbor]). Cells where the two differ
+    are queued by (min(g, rhs) + h, min(g, rhs)). Entering a cell costs its
+    weight and the move set is closed under reversal, so a cell's
+    predecessors are exactly its neighbors, and a weight change only
+    touches the rhs of the cell itself.
+
+    The heap is lazy like the other solvers': an entry only counts while it
+    matches the key recorded for its cell, so requeueing or dropping a cell
+    never has to search the heap.
+    """
+
+    def __init__(self, grid, start_cell, target_cell, metrics=None):
+        self.grid = grid
+        self.start_cell = start_cell
+        self.target_cell = target_cell
+        self.metrics = metrics if metrics is not None else SearchMetrics()
+        self.path_cells = []
+        self.is_attached = False
+        self._reset()
+
+    def _reset(self):
+        grid = self.grid
+        self.heuristic = make_heuristic(grid, self.target_cell)
+        # Estimates are filled in the first time a cell is keyed.
+        self.estimates = array("d", [UNKNOWN_ESTIMATE]) * grid.size
+        self.lightest_weight = min(grid.weights) if grid.size else 0
+        self.g = array("d", [UNREACHED_COST]) * grid.size
+        self.rhs = array("d", [UNREACHED_COST]) * grid.size
+        self.rhs[self.start_cell] = 0
+        self.open_heap = []
+        self.is_queued = bytearray(grid.size)
+        self.queued_key1 = array("d", [UNREACHED_COST]) * grid.size
+        self.queued_key2 = array("d", [UNREACHED_COST]) * grid.size
+        self.open_count = 0
+        self._enqueue(self.start_cell)
+        self.needs_repair = True
+
+    def attach(self):
+        """Follow wall and weight edits on the grid from now on."""
+        if not self.is_attached:
+            self.grid.edit_listeners.append(self.cell_changed)
+            self.is_attached = True
+
+    def detach(self):
+        if self.is_attached:
+            self.grid.edit_listeners.remove(self.cell_changed)
+            self.is_attached = False
+
+    def cell_changed(self, cell):
+        """
+        A wall toggle only changes moves inside the 3x3 block around the
+        cell (direct moves and diagonal corner cuts), so those nine cells
+        are the only ones whose rhs can differ.
+        """
+        if self.grid.weights[cell] < self.lightest_weight:
+            # The heuristic assumed a heavier floor, so it is no longer
+            # admissible; start over from scratch.
+            self._reset()
+            return
+
+        cols = self.grid.cols
+        row, col = divmod(cell, cols)
+        for affected_row in range(max(row - 1, 0), min(row + 2, self.grid.rows)):
+            for affected_col in range(max(col - 1, 0), min(col + 2, cols)):
+                self._update_vertex(affected_row * cols + affected_col)
+        self.needs_repair = True
+
+    def search(self):
+        """Bring the g values up to date, redraw the path and return it."""
+        grid = self.grid
+        for cell in self.path_cells:
+            grid.mark_explored(cell)
+        if self.start_cell == self.target_cell:
+            # No edit can change an empty path, so nothing is ever expanded.
+            self.path_cells = []
+            self.needs_repair = False
+            return SearchResult.from_path(grid, [self.start_cell], self.metrics)
+
+        yield from self._compute_shortest_path()
+
+        self.path_cells = self._extract_path()
+        self.needs_repair = False
+        for cell in self.path_cells:
+            grid.mark_path(cell)
+            yield True
+
+        if self.g[self.target_cell] == UNREACHED_COST:
+            return SearchResult.not_found(self.metrics)
+        return SearchResult.from_path(grid, [self.start_cell, *self.path_cells, self.target_cell], self.metrics)
+
+    def _enqueue(self, cell):
+        """Queue cell (or move it) under its current key."""
+        best = min(self.g[cell], self.rhs[cell])
+        estimate = self.estimates[cell]
+        if estimate == UNKNOWN_ESTIMATE:
+            estimate = self.estimates[cell] = self.heuristic(cell)
+        if not self.is_queued[cell]:
+            self.is_queued[cell] = 1
+            self.open_count += 1
+            self.grid.mark_frontier(cell)
+            self.metrics.nodes_pushed += 1
+        self.queued_key1[cell] = best + estimate
+        self.queued_key2[cell] = best
+        heapq.heappush(self.open_heap, (best + estimate, best, cell))
+
+    def _update_vertex(self, cell):
+        g, rhs = self.g, self.rhs
+        if cell != self.start_cell:
+            grid = self.grid
+            best = UNREACHED_COST
+            # This runs for every neighbour of each expanded or edited cell;
+            # a min() call per predecessor would dominate its cost.
+            for delta in grid.mask_deltas[grid.neighbor_masks[cell]]:
+                if g[cell + delta] < best:
+                    best = g[cell + delta]
+            rhs[cell] = best + grid.weights[cell]
+
+        if g[cell] != rhs[cell]:
+            self._enqueue(cell)
+        elif self.is_queued[cell]:
+            self.is_queued[cell] = 0
+            self.open_count -= 1
+
+    def _compute_shortest_path(self):
+        grid = self.grid
+        g, rhs = self.g, self.rhs
+        open_heap = self.open_heap
+        is_queued = self.is_queued
+        queued_key1, queued_key2 = self.queued_key1, self.queued_key2
+        weights = grid.weights
+        neighbor_masks = grid.neighbor_masks
+        mask_deltas = grid.mask_deltas
+        start_cell = self.start_cell
+        target_cell = self.target_cell
+        metrics = self.metrics
+        enqueue = self._enqueue
+        update_vertex = self._update_vertex
+        target_estimate = self.heuristic(target_cell)
+
+        while open_heap:
+            key1, key2, current_active_cell = open_heap[0]
+            if not is_queued[current_active_cell] or key1 != queued_key1[current_active_cell] or key2 != queued_key2[current_active_cell]:
+                heapq.heappop(open_heap)
+                continue
+
+            target_best = min(g[target_cell], rhs[target_cell])
+            if (key1, key2) >= (target_best + target_estimate, target_best) and rhs[target_cell] == g[target_cell]:
+                break
+
+            heapq.heappop(open_heap)
+            is_queued[current_active_cell] = 0
+            self.open_count -= 1
+            old_cost = g[current_active_cell]
+            if old_cost != UNREACHED_COST:
+                metrics.nodes_reopened += 1
+
+            if old_cost > rhs[current_active_cell]:
+                # Over-consistent: settle it and offer the cheaper route on.
+                new_cost = g[current_active_cell] = rhs[current_active_cell]
+                for delta in mask_deltas[neighbor_masks[current_active_cell]]:
+                    neighbor = current_active_cell + delta
+                    offered_cost = new_cost + weights[neighbor]
+                    if offered_cost < rhs[neighbor] and neighbor != start_cell:
+                        rhs[neighbor] = offered_cost
+                        enqueue(neighbor)
+            else:
+                # Under-consistent: forget it, and re-derive every cell whose
+                # lookahead went through it.
+                g[current_active_cell] = UNREACHED_COST
+                update_vertex(current_active_cell)
+                for delta in mask_deltas[neighbor_masks[current_active_cell]]:
+                    neighbor = current_active_cell + delta
+                    if rhs[neighbor] == old_cost + weights[neighbor]:
+                        update_vertex(neighbor)
+
+            grid.mark_explored(current_active_cell)
+            metrics.nodes_expanded += 1
+            metrics.peak_frontier = max(metrics.peak_frontier, self.open_count)
+            yield True
+
+    def _extract_path(self):
+        # Every move into a cell costs that cell's weight, so the best
+        # predecessor is simply the neighbor with the smallest g.
+        g = self.g
+        if g[self.target_cell] == UNREACHED_COST:
+            return []
+
+        grid = self.grid
+        path_cells = []
+        current_cell = self.target_cell
+        for _ in range(grid.size):
+            current_cell = min(
+                (current_cell + delta for delta in grid.mask_deltas[grid.neighbor_masks[current_cell]]),
+                key=g.__getitem__,
+            )
+            if current_cell == self.start_cell:
+                path_cells.reverse()
+                return path_cells
+            path_cells.append(current_cell)
+        return []
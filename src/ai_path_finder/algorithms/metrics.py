@@ -0,0 +1,23 @@
+"""
+Search Metrics for the AI Pathfinder.
+Counters every solver reports into while it runs.
+"""
+
+
+class SearchMetrics:
+    """
+    nodes_reopened counts work a solver repeats on cells it had already
+    reached: DLS/IDDFS re-pushes at a shallower depth or in a later sweep,
+    and LPA* expansions of cells that already had a cost.
+    """
+
+    __slots__ = ("nodes_expanded", "nodes_pushed", "nodes_reopened", "peak_frontier")
+
+    def __init__(self):
+        self.nodes_expanded = 0
+        self.nodes_pushed = 0
+        self.nodes_reopened = 0
+        self.peak_frontier = 0
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
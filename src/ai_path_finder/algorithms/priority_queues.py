@@ -0,0 +1,133 @@
+"""
+Priority Queues for the weighted solvers.
+Queues hold integer cell ids below a fixed capacity and keep at most one
+entry per cell, so decrease-key never leaves stale entries behind.
+"""
+from array import array
+
+# Dial's buckets stay worthwhile while a single step spans this many buckets.
+MAX_BUCKET_WEIGHT = 1024
+
+_INTEGER_TYPECODES = "bBhHiIlLqQ"
+
+
+class IndexedHeap:
+    """
+    Binary min-heap with a position index for O(log n) decrease-key,
+    increase-key and removal. Entries are [priority, sequence, cell]; the
+    sequence number keeps equal priorities first-in first-out.
+    """
+
+    def __init__(self, capacity):
+        self.heap = []
+        self.position = array("i", [-1]) * capacity
+        self.sequence = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, cell):
+        return self.position[cell] != -1
+
+    def priority_of(self, cell):
+        return self.heap[self.position[cell]][0]
+
+    def push(self, cell, priority):
+        """Insert cell, or move it to priority if it is already queued."""
+        if self.position[cell] != -1:
+            self.update(cell, priority)
+            return
+
+        self.sequence += 1
+        self.heap.append([priority, self.sequence, cell])
+        self.position[cell] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+
+    def update(self, cell, priority):
+        """Set the priority of a queued cell in either direction."""
+        index = self.position[cell]
+        entry = self.heap[index]
+        old_priority = entry[0]
+        self.sequence += 1
+        entry[0] = priority
+        entry[1] = self.sequence
+        if priority < old_priority:
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
+
+    def peek(self):
+        entry = self.heap[0]
+        return entry[0], entry[2]
+
+    def pop(self):
+        priority, _, cell = self.heap[0]
+        self._remove_at(0)
+        return priority, cell
+
+    def remove(self, cell):
+        index = self.position[cell]
+        if index != -1:
+            self._remove_at(index)
+
+    def _remove_at(self, index):
+        heap = self.heap
+        self.position[heap[index][2]] = -1
+        last = heap.pop()
+        if index < len(heap):
+            heap[index] = last
+            self.position[last[2]] = index
+            self._sift_down(index)
+            self._sift_up(index)
+
+    def _sift_up(self, index):
+        heap = self.heap
+        position = self.position
+        entry = heap[index]
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            parent = heap[parent_index]
+            if entry < parent:
+                heap[index] = parent
+                position[parent[2]] = index
+                index = parent_index
+            else:
+                break
+        heap[index] = entry
+        position[entry[2]] = index
+
+    def _sift_down(self, index):
+        heap = self.heap
+        position = self.position
+        size = len(heap)
+        entry = heap[index]
+        while True:
+            child_index = 2 * index + 1
+            if child_index >= size:
+                break
+            right_index = child_index + 1
+            if right_index < size and heap[right_index] < heap[child_index]:
+                child_index = right_index
+            child = heap[child_index]
+            if child < entry:
+                heap[index] = child
+                position[child[2]] = index
+                index = child_index
+            else:
+                break
+        heap[index] = entry
+        position[entry[2]] = index
+
+
+def dial_bucket_count(weights):
+    """
+    Number of circular buckets Dial's algorithm needs for these step
+    weights, or None when they are not small non-negative integers.
+    """
+    typecode = getattr(weights, "typecode", "B")
+    if typecode not in _INTEGER_TYPECODES or not len(weights):
+        return None
+    heaviest = max(weights)
+    if min(weights) < 0 or heaviest > MAX_BUCKET_WEIGHT:
+        return None
+    return heaviest + 1
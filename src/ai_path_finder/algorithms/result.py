@@ -0,0 +1,104 @@
+"""
+Search Results for the AI Pathfinder.
+What every solver returns from its generator once it stops.
+"""
+import time
+
+
+class SearchTree:
+    """
+    Parent links a BFS or UCS run leaves behind. Only cells flagged in
+    settled have final parents, since a run that stopped at its target
+    settled just part of the map; is_complete means the run exhausted
+    everything reachable from source.
+
+    Moves are reversible and a route's cost in either direction differs
+    only in which endpoint's weight is paid, so reversing a tree path also
+    gives a shortest route *to* the source.
+    """
+
+    __slots__ = ("is_complete", "parents", "settled", "source")
+
+    def __init__(self, source, parents, settled, is_complete):
+        self.source = source
+        self.parents = parents
+        self.settled = settled
+        self.is_complete = is_complete
+
+    @property
+    def nbytes(self):
+        return self.parents.itemsize * len(self.parents) + len(self.settled)
+
+    def path_to(self, cell):
+        """Tree path from the source to a settled cell, both ends included."""
+        parents = self.parents
+        path = [cell]
+        while parents[cell] != -1:
+            cell = parents[cell]
+            path.append(cell)
+        path.reverse()
+        return path
+
+
+class SearchResult:
+    """
+    path lists every cell from start to target inclusive and is empty when
+    the target was not reached. Entering a cell costs its weight, so cost
+    sums the weights of path[1:] and path_length counts moves. Solvers that
+    build a reusable shortest-path tree (BFS, UCS) also hand it back.
+    """
+
+    __slots__ = ("cost", "found", "metrics", "path", "tree")
+
+    def __init__(self, found, path, cost, metrics, tree=None):
+        self.found = found
+        self.path = path
+        self.cost = cost
+        self.metrics = metrics
+        self.tree = tree
+
+    @classmethod
+    def from_path(cls, grid, path, metrics, tree=None):
+        weights = grid.weights
+        return cls(True, path, sum(weights[cell] for cell in path[1:]), metrics, tree)
+
+    @classmethod
+    def not_found(cls, metrics, tree=None):
+        return cls(False, [], None, metrics, tree)
+
+    @property
+    def path_length(self):
+        return len(self.path) - 1 if self.found else None
+
+    def to_dict(self):
+        return {
+            "found": self.found,
+            "path_length": self.path_length,
+            "path_cost": self.cost,
+            "path": list(self.path),
+            **self.metrics.to_dict(),
+        }
+
+
+def run_to_completion(search_generator):
+    """Drive a solver generator to the end and return its SearchResult."""
+    while True:
+        try:
+            next(search_generator)
+        except StopIteration as stop:
+            return stop.value
+
+
+def run_for(generator, seconds):
+    """
+    Drive a generator for about seconds and return whether it finished;
+    an unfinished one carries on from where it stopped on the next call.
+    """
+    deadline = time.perf_counter() + seconds
+    while True:
+        try:
+            next(generator)
+        except StopIteration:
+            return True
+        if time.perf_counter() >= deadline:
+            return False
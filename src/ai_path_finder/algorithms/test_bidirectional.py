@@ -0,0 +1,40 @@
+"""
+Checks for Bidirectional Search.
+Compares the three bidirectional solvers with Dijkstra's costs.
+"""
+import random
+
+import pytest
+
+from ai_path_finder.logic.grid_model import WALL
+from ai_path_finder.logic.map_generators import generate_grid
+from ai_path_finder.logic.pathfinding import find_path
+
+BIDIRECTIONAL_ALGORITHMS = ("BIDIRECTIONAL", "BIDIR DIJKSTRA", "BIDIR A*")
+
+
+@pytest.mark.parametrize("algorithm", BIDIRECTIONAL_ALGORITHMS)
+def test_start_on_target_is_an_empty_path(algorithm):
+    grid = generate_grid(20, 20, "RANDOM", "TERRAIN", seed=1)
+    cell = next(cell for cell in range(grid.size) if grid.state[cell] != WALL)
+    result = find_path(grid, cell, cell, algorithm)
+    assert result.found
+    assert list(result.path) == [cell]
+    assert result.cost == 0
+    assert result.path_length == 0
+
+
+@pytest.mark.parametrize("walls", ["RANDOM", "MAZE", "ROOMS"])
+def test_weighted_searches_match_dijkstra(walls):
+    grid = generate_grid(45, 30, walls, "TERRAIN", seed=6)
+    open_cells = [cell for cell in range(grid.size) if grid.state[cell] != WALL]
+    rng = random.Random(4)
+    for _ in range(25):
+        start_cell, target_cell = rng.choice(open_cells), rng.choice(open_cells)
+        expected = find_path(grid, start_cell, target_cell, "UCS")
+        for algorithm in ("BIDIR DIJKSTRA", "BIDIR A*"):
+            result = find_path(grid, start_cell, target_cell, algorithm)
+            assert result.found == expected.found
+            assert result.cost == expected.cost
+        unweighted = find_path(grid, start_cell, target_cell, "BIDIRECTIONAL")
+        assert unweighted.path_length == find_path(grid, start_cell, target_cell, "BFS").path_length
@@ -0,0 +1,100 @@
+"""
+Checks for Hierarchical Pathfinding A*.
+Compares HPA* with Dijkstra's costs on random maps and random edits.
+"""
+import random
+from itertools import pairwise
+
+import pytest
+
+from ai_path_finder.algorithms.hpastar import ClusterGraph, run_hpastar
+from ai_path_finder.algorithms.result import run_to_completion
+from ai_path_finder.logic.grid_model import WALL, GridModel
+from ai_path_finder.logic.map_generators import generate_grid
+from ai_path_finder.logic.pathfinding import find_path
+
+
+def assert_valid_path(grid, result, start_cell, target_cell):
+    path = result.path
+    assert path[0] == start_cell
+    assert path[-1] == target_cell
+    for from_cell, to_cell in pairwise(path):
+        assert to_cell in grid.neighbors_of(from_cell)
+
+
+def compare_with_dijkstra(grid, hierarchy, rng, query_count):
+    open_cells = [cell for cell in range(grid.size) if grid.state[cell] != WALL]
+    for _ in range(query_count):
+        start_cell, target_cell = rng.choice(open_cells), rng.choice(open_cells)
+        if start_cell == target_cell:
+            continue
+        expected = find_path(grid, start_cell, target_cell, "UCS")
+        result = run_to_completion(run_hpastar(grid.fork(), start_cell, target_cell, hierarchy=hierarchy))
+        assert result.found == expected.found
+        if result.found:
+            assert_valid_path(grid, result, start_cell, target_cell)
+            assert result.cost >= expected.cost
+
+
+@pytest.mark.parametrize(("rows", "cols"), [(10, 40), (40, 10), (16, 16), (5, 12), (17, 33)])
+def test_open_grid_is_crossed_corner_to_corner(rows, cols):
+    grid = GridModel(rows, cols)
+    result = find_path(grid, 0, grid.size - 1, "HPA*")
+    assert result.found
+    assert_valid_path(grid, result, 0, grid.size - 1)
+
+
+@pytest.mark.parametrize("cluster_size", [8, 16])
+@pytest.mark.parametrize("walls", ["RANDOM", "MAZE", "ROOMS"])
+@pytest.mark.parametrize(("rows", "cols"), [(48, 12), (12, 48), (40, 40)])
+def test_matches_dijkstra_on_random_maps(walls, rows, cols, cluster_size):
+    grid = generate_grid(rows, cols, walls, "TERRAIN", seed=rows * cols)
+    hierarchy = ClusterGraph(grid, cluster_size)
+    compare_with_dijkstra(grid, hierarchy, random.Random(rows + cols), query_count=25)
+
+
+@pytest.mark.parametrize(("rows", "cols"), [(48, 12), (40, 40)])
+def test_incremental_refresh_matches_fresh_graph(rows, cols):
+    grid = generate_grid(rows, cols, "RANDOM", "TERRAIN", seed=7)
+    hierarchy = ClusterGraph(grid, cluster_size=8)
+    hierarchy.attach()
+    run_to_completion(hierarchy.refresh())
+
+    rng = random.Random(rows * cols)
+    for _ in range(4):
+        for _ in range(20):
+            cell = rng.randrange(grid.size)
+            if grid.state[cell] == WALL:
+                grid.reset_cell(cell)
+            elif rng.random() < 0.5:
+                grid.set_wall(cell)
+            else:
+                grid.set_weight(cell, rng.randint(1, 5))
+        run_to_completion(hierarchy.refresh())
+
+        fresh = ClusterGraph(grid, cluster_size=8)
+        run_to_completion(fresh.refresh())
+        assert hierarchy.transitions == fresh.transitions
+        assert hierarchy.inter_edges == fresh.inter_edges
+        assert hierarchy.intra_edges == fresh.intra_edges
+        compare_with_dijkstra(grid, hierarchy, rng, query_count=10)
+
+
+def test_abandoned_refresh_resumes():
+    grid = generate_grid(128, 128, "ROOMS", "TERRAIN", seed=5)
+    hierarchy = ClusterGraph(grid, cluster_size=8)
+    hierarchy.attach()
+    rng = random.Random(3)
+    for step_count in (1, 2, 100):
+        refresh = hierarchy.refresh()
+        for _ in range(step_count):
+            next(refresh)
+        refresh.close()
+        assert hierarchy.needs_refresh
+        grid.set_wall(rng.randrange(grid.size))
+    run_to_completion(hierarchy.refresh())
+
+    fresh = ClusterGraph(grid, cluster_size=8)
+    run_to_completion(fresh.refresh())
+    assert hierarchy.transitions == fresh.transitions
+    assert hierarchy.intra_edges == fresh.intra_edges
@@ -0,0 +1,89 @@
+"""
+Checks for Lifelong Planning A*.
+Compares LPA* and its repairs after random edits with Dijkstra's costs.
+"""
+import random
+from itertools import pairwise
+
+import pytest
+
+from ai_path_finder.algorithms.lpastar import LifelongPlanner
+from ai_path_finder.algorithms.result import run_to_completion
+from ai_path_finder.logic.grid_model import WALL
+from ai_path_finder.logic.map_generators import generate_grid
+from ai_path_finder.logic.pathfinding import find_path
+
+
+def open_cells_of(grid):
+    return [cell for cell in range(grid.size) if grid.state[cell] != WALL]
+
+
+@pytest.mark.parametrize("walls", ["RANDOM", "MAZE", "ROOMS"])
+def test_one_shot_search_matches_dijkstra(walls):
+    grid = generate_grid(50, 35, walls, "TERRAIN", seed=21)
+    open_cells = open_cells_of(grid)
+    rng = random.Random(8)
+    for _ in range(25):
+        start_cell, target_cell = rng.choice(open_cells), rng.choice(open_cells)
+        expected = find_path(grid, start_cell, target_cell, "UCS")
+        result = find_path(grid, start_cell, target_cell, "LPA*")
+        assert result.found == expected.found
+        assert result.cost == expected.cost
+
+
+@pytest.mark.parametrize("walls", ["RANDOM", "ROOMS"])
+def test_repairs_after_edits_match_dijkstra(walls):
+    grid = generate_grid(40, 40, walls, "TERRAIN", seed=13)
+    rng = random.Random(17)
+    start_cell, target_cell = rng.sample(open_cells_of(grid), 2)
+    planner = LifelongPlanner(grid, start_cell, target_cell)
+    planner.attach()
+    run_to_completion(planner.search())
+
+    for _ in range(12):
+        for _ in range(rng.randint(1, 6)):
+            cell = rng.randrange(grid.size)
+            if cell in (start_cell, target_cell):
+                continue
+            if grid.state[cell] == WALL:
+                grid.reset_cell(cell)
+            elif rng.random() < 0.6:
+                grid.set_wall(cell)
+            else:
+                grid.set_weight(cell, rng.randint(1, 5))
+        assert planner.needs_repair
+        result = run_to_completion(planner.search())
+
+        expected = find_path(grid, start_cell, target_cell, "UCS")
+        assert result.found == expected.found
+        assert result.cost == expected.cost
+        if result.found:
+            path = result.path
+            assert path[0] == start_cell
+            assert path[-1] == target_cell
+            for from_cell, to_cell in pairwise(path):
+                assert to_cell in grid.neighbors_of(from_cell)
+    planner.detach()
+
+
+def test_start_on_target_is_an_empty_path():
+    grid = generate_grid(20, 20, "RANDOM", "TERRAIN", seed=3)
+    cell = open_cells_of(grid)[0]
+    result = find_path(grid, cell, cell, "LPA*")
+    assert result.found
+    assert list(result.path) == [cell]
+    assert result.cost == 0
+
+    planner = LifelongPlanner(grid, cell, cell)
+    planner.attach()
+    run_to_completion(planner.search())
+    rng = random.Random(2)
+    for _ in range(5):
+        edited_cell = rng.randrange(grid.size)
+        if edited_cell != cell:
+            grid.set_weight(edited_cell, rng.randint(1, 5))
+        result = run_to_completion(planner.search())
+        assert list(result.path) == [cell]
+        assert result.cost == 0
+        assert result.path_length == 0
+    planner.detach()
@@ -0,0 +1,148 @@
+"""
+Implementation of Uniform Cost Search (UCS).
+Dial's bucket queue on small integer weights, indexed heap otherwise.
+"""
+from array import array
+
+from ai_path_finder.algorithms.metrics import SearchMetrics
+from ai_path_finder.algorithms.priority_queues import IndexedHeap, dial_bucket_count
+from ai_path_finder.algorithms.result import SearchResult, SearchTree
+
+UNREACHED_COST = 2**63 - 1
+UNREACHED_FLOAT_COST = float("inf")
+
+def run_ucs(grid, start_cell, target_cell, metrics=None):
+    if metrics is None:
+        metrics = SearchMetrics()
+
+    parent_tracker = array("i", [-1]) * grid.size
+    found, _, settled = yield from uniform_cost_sweep(grid, start_cell, target_cell, parent_tracker, metrics)
+    tree = SearchTree(start_cell, parent_tracker, settled, not found)
+    if found:
+        path = yield from reconstruct_final_path(grid, parent_tracker, target_cell, start_cell)
+        return SearchResult.from_path(grid, path, metrics, tree)
+    return SearchResult.not_found(metrics, tree)
+
+def uniform_cost_sweep(grid, start_cell, target_cell, parent_tracker, metrics):
+    """
+    Settle cells in cost order until target_cell is popped.
+    Returns (found, cost_so_far, settled), where settled flags the popped
+    cells, whose cost and parent are final. Every queue keeps one entry per
+    cell, so a cheaper route moves the cell instead of leaving a stale copy
+    behind.
+    """
+    bucket_count = dial_bucket_count(grid.weights)
+    if bucket_count is not None:
+        return (yield from _dial_sweep(grid, start_cell, target_cell, parent_tracker, metrics, bucket_count))
+    return (yield from _indexed_heap_sweep(grid, start_cell, target_cell, parent_tracker, metrics))
+
+def _dial_sweep(grid, start_cell, target_cell, parent_tracker, metrics, bucket_count):
+    # Live costs never span more than bucket_count consecutive values, so
+    # cost % bucket_count is a unique bucket. Buckets are insertion-ordered
+    # dicts: ties pop first-in first-out and a decrease-key is two O(1)
+    # dict operations. A cell is queued exactly when it has a finite cost
+    # and is not yet settled, so its old bucket is known from cost_so_far.
+    buckets = [{} for _ in range(bucket_count)]
+    buckets[0][start_cell] = None
+    cost_so_far = array("q", [UNREACHED_COST]) * grid.size
+    cost_so_far[start_cell] = 0
+    queued_count = 1
+    current_cost = 0
+
+    visited_set = bytearray(grid.size)
+    weights = grid.weights
+    neighbor_masks = grid.neighbor_masks
+    mask_deltas = grid.mask_deltas
+
+    while queued_count:
+        bucket = buckets[current_cost % bucket_count]
+        while not bucket:
+            current_cost += 1
+            bucket = buckets[current_cost % bucket_count]
+
+        current_active_cell = next(iter(bucket))
+        del bucket[current_active_cell]
+        queued_count -= 1
+        visited_set[current_active_cell] = 1
+
+        if current_active_cell == target_cell:
+            return True, cost_so_far, visited_set
+
+        metrics.nodes_expanded += 1
+        for delta in mask_deltas[neighbor_masks[current_active_cell]]:
+            neighbor = current_active_cell + delta
+            if visited_set[neighbor]:
+                continue
+
+            # USE RANDOM WEIGHT HERE
+            new_cost = current_cost + weights[neighbor]
+            known_cost = cost_so_far[neighbor]
+
+            if new_cost < known_cost:
+                if known_cost != UNREACHED_COST:
+                    del buckets[known_cost % bucket_count][neighbor]
+                else:
+                    queued_count += 1
+                buckets[new_cost % bucket_count][neighbor] = None
+                cost_so_far[neighbor] = new_cost
+                parent_tracker[neighbor] = current_active_cell
+                grid.mark_frontier(neighbor)
+                metrics.nodes_pushed += 1
+
+        metrics.peak_frontier = max(metrics.peak_frontier, queued_count)
+
+        if current_active_cell != start_cell:
+            grid.mark_explored(current_active_cell)
+        yield True
+    return False, cost_so_far, visited_set
+
+def _indexed_heap_sweep(grid, start_cell, target_cell, parent_tracker, metrics):
+    frontier = IndexedHeap(grid.size)
+    frontier.push(start_cell, 0)
+    cost_so_far = array("d", [UNREACHED_FLOAT_COST]) * grid.size
+    cost_so_far[start_cell] = 0
+
+    visited_set = bytearray(grid.size)
+    weights = grid.weights
+    neighbor_masks = grid.neighbor_masks
+    mask_deltas = grid.mask_deltas
+
+    while frontier:
+        current_cost, current_active_cell = frontier.pop()
+        visited_set[current_active_cell] = 1
+
+        if current_active_cell == target_cell:
+            return True, cost_so_far, visited_set
+
+        metrics.nodes_expanded += 1
+        for delta in mask_deltas[neighbor_masks[current_active_cell]]:
+            neighbor = current_active_cell + delta
+            if visited_set[neighbor]:
+                continue
+
+            new_cost = current_cost + weights[neighbor]
+            if new_cost < cost_so_far[neighbor]:
+                cost_so_far[neighbor] = new_cost
+                parent_tracker[neighbor] = current_active_cell
+                frontier.push(neighbor, new_cost)
+                grid.mark_frontier(neighbor)
+                metrics.nodes_pushed += 1
+
+        metrics.peak_frontier = max(metrics.peak_frontier, len(frontier))
+
+        if current_active_cell != start_cell:
+            grid.mark_explored(current_active_cell)
+        yield True
+    return False, cost_so_far, visited_set
+
+def reconstruct_final_path(grid, parent_tracker, current_step, start_cell):
+    """Mark the path back from current_step; returns it start to target."""
+    path = [current_step]
+    while parent_tracker[current_step] != -1:
+        current_step = parent_tracker[current_step]
+        path.append(current_step)
+        if current_step != start_cell:
+            grid.mark_path(current_step)
+        yield True
+    path.reverse()
+    return path
@@ -0,0 +1,10 @@
+"""
+AI Pathfinder Benchmark Entry Point.
+Runs the headless solver benchmark; never opens a window or imports pygame.
+"""
+import sys
+
+from ai_path_finder.logic.benchmark import main
+
+if __name__ == "__main__":
+    sys.exit(main())
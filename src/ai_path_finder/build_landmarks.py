@@ -0,0 +1,10 @@
+"""
+AI Pathfinder Landmark Builder Entry Point.
+Precomputes ALT landmark distances next to a saved map; never imports pygame.
+"""
+import sys
+
+from ai_path_finder.logic.landmarks import main
+
+if __name__ == "__main__":
+    sys.exit(main())
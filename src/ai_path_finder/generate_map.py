@@ -0,0 +1,10 @@
+"""
+AI Pathfinder Map Generator Entry Point.
+Writes a seeded generated map as a .pfmap; never opens a window or imports pygame.
+"""
+import sys
+
+from ai_path_finder.logic.map_generators import main
+
+if __name__ == "__main__":
+    sys.exit(main())
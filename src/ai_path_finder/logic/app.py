@@ -0,0 +1,481 @@
+"""
+The Application Orchestrator.
+Updated for Left Sidebar Layout.
+"""
+import time
+
+import pygame
+
+import ai_path_finder.utils.config as global_config
+from ai_path_finder.algorithms.result import run_for
+from ai_path_finder.logic.landmarks import (
+    build_landmarks,
+    landmark_path_for,
+    load_landmarks_for,
+    save_landmarks,
+)
+from ai_path_finder.logic.map_generators import generate_grid
+from ai_path_finder.logic.map_io import find_endpoints, load_map, save_grid
+from ai_path_finder.logic.search_trace import load_trace
+from ai_path_finder.logic.simulation_manager import SimulationManager as LogicEngine
+from ai_path_finder.ui.grid import GridNode, GridRenderer, get_node_from_mouse_click
+from ai_path_finder.ui.menu import InterfaceRenderer as ControlPanel
+from ai_path_finder.ui.race_view import RaceView
+from ai_path_finder.ui.viewport import Viewport
+
+
+class PathfinderApp:
+    def __init__(self, map_path=None):
+        pygame.init()
+        self.display_surface = pygame.display.set_mode(
+            (global_config.WINDOW_WIDTH, global_config.WINDOW_HEIGHT),
+            pygame.RESIZABLE
+        )
+        pygame.display.set_caption("AI Pathfinder Visualizer v2.0")
+        
+        self.execution_clock = pygame.time.Clock()
+
+        self.grid_size = global_config.GRID_SIZE
+        # G cycles MAP_GENERATORS (-1 means a blank map); SHIFT+G reseeds.
+        self.map_seed = global_config.MAP_SEED
+        self.map_generator_index = -1
+        self.grid_model = self._generate_map()
+        self.grid_viewport = Viewport(
+            self._grid_area(),
+            self.grid_model.rows,
+            self.grid_model.cols,
+            global_config.CELL_SIZE
+        )
+        self.grid_renderer = GridRenderer(self.grid_model, self.grid_viewport)
+        self.logic_orchestrator = LogicEngine(
+            step_delay=global_config.STEP_DELAY, use_worker=global_config.SEARCH_IN_WORKER
+        )
+        self.ui_renderer = ControlPanel(self.display_surface, list(self.logic_orchestrator.algorithm_map))
+
+        self.origin_node = None
+        self.destination_node = None
+        self.is_application_active = True
+        
+        self.finish_time_stamp = None
+        self.POPUP_DELAY_SECONDS = 1.0
+
+        self.race_view = None
+        self.abstract_refresh = None
+
+        self.needs_full_frame = True
+        self.popup_was_visible = False
+
+        if map_path is not None:
+            loaded_grid = load_map(map_path)
+            self._reinitialize_workspace(loaded_grid, load_landmarks_for(loaded_grid, map_path))
+
+    def _process_user_inputs(self, pending_events):
+        for active_event in pending_events:
+            if active_event.type == pygame.QUIT:
+                self.is_application_active = False
+
+            if active_event.type == pygame.VIDEORESIZE:
+                self.display_surface = pygame.display.set_mode(
+                    (active_event.w, active_event.h), pygame.RESIZABLE
+                )
+                self.ui_renderer.display = self.display_surface
+                self.needs_full_frame = True
+
+            if active_event.type == pygame.MOUSEWHEEL and self.race_view is None:
+                mouse_pos = pygame.mouse.get_pos()
+                if self.grid_viewport.screen_rect.collidepoint(mouse_pos):
+                    self.grid_viewport.zoom_at(mouse_pos, global_config.ZOOM_STEP ** active_event.y)
+
+            if active_event.type == pygame.MOUSEMOTION:
+                if active_event.buttons[1]:
+                    self.grid_viewport.pan(*active_event.rel)
+                elif (active_event.buttons[0] or active_event.buttons[2]) and self._is_grid_editable():
+                    self._handle_grid_interactions()
+
+            if active_event.type == pygame.MOUSEBUTTONDOWN and active_event.button in (1, 3):
+                mouse_pos = pygame.mouse.get_pos()
+                
+                if mouse_pos[0] < 280:
+                    if not self.logic_orchestrator.is_running:
+                        clicked_algo = self.ui_renderer.check_button_clicks(mouse_pos)
+                        if clicked_algo:
+                            self.logic_orchestrator.set_algorithm(clicked_algo)
+                
+                elif self._is_grid_editable():
+                    self._handle_grid_interactions()
+
+            self._handle_keyboard_commands(active_event)
+
+    def _is_grid_editable(self):
+        # A finished incremental search stays editable and repairs its path.
+        orchestrator = self.logic_orchestrator
+        return not orchestrator.is_running and (not orchestrator.is_finished or orchestrator.replanner is not None)
+
+    def _node_under_mouse(self):
+        grid_coordinates = get_node_from_mouse_click(pygame.mouse.get_pos(), self.grid_viewport)
+        if not grid_coordinates:
+            return None
+        return GridNode(self.grid_model, self.grid_model.cell_id(*grid_coordinates))
+
+    def _handle_grid_interactions(self):
+        current_node = self._node_under_mouse()
+        if current_node is None:
+            return
+
+        # The replanner searches between fixed endpoints.
+        if self.logic_orchestrator.replanner is not None and current_node in [self.origin_node, self.destination_node]:
+            return
+
+        if pygame.mouse.get_pressed()[0]:
+            if not self.origin_node and current_node != self.destination_node:
+                self.origin_node = current_node
+                self.origin_node.set_as_start()
+            elif not self.destination_node and current_node != self.origin_node:
+                self.destination_node = current_node
+                self.destination_node.set_as_target()
+            elif current_node not in [self.origin_node, self.destination_node]:
+                current_node.set_as_wall()
+
+        elif pygame.mouse.get_pressed()[2]:
+            if current_node == self.origin_node: self.origin_node = None
+            elif current_node == self.destination_node: self.destination_node = None
+            current_node.reset_to_empty()
+
+    def _handle_keyboard_commands(self, active_event):
+        if active_event.type == pygame.KEYDOWN:
+            if active_event.key == pygame.K_c:
+                self.map_generator_index = -1
+                self._reinitialize_workspace()
+                self._discard_results()
+                return
+
+            if active_event.key == pygame.K_x and not self.logic_orchestrator.is_running:
+                # Keep the map and endpoints, so a rerun can use cached trees.
+                self.grid_model.clear_search_marks()
+                self._discard_results()
+                return
+
+            if active_event.key == pygame.K_f:
+                self.grid_viewport.fit()
+                return
+
+            if active_event.key == pygame.K_n and not self.logic_orchestrator.is_running:
+                presets = global_config.GRID_SIZE_PRESETS
+                larger_sizes = [size for size in presets if size > self.grid_size]
+                self.grid_size = larger_sizes[0] if larger_sizes else presets[0]
+                self._reinitialize_workspace()
+                self._discard_results()
+                return
+
+            if active_event.key == pygame.K_g and not self.logic_orchestrator.is_running:
+                if active_event.mod & pygame.KMOD_SHIFT:
+                    self.map_seed += 1
+                    self.map_generator_index = max(self.map_generator_index, 0)
+                else:
+                    self.map_generator_index = (self.map_generator_index + 1) % len(global_config.MAP_GENERATORS)
+                self._reinitialize_workspace(self._generate_map())
+                self._discard_results()
+                return
+
+            if active_event.key == pygame.K_s and not self.logic_orchestrator.is_running:
+                save_grid(self.grid_model, global_config.MAP_PATH)
+                landmarks = self.logic_orchestrator.landmarks
+                if landmarks is not None and landmarks.matches(self.grid_model):
+                    save_landmarks(landmarks, landmark_path_for(global_config.MAP_PATH))
+                return
+
+            if active_event.key == pygame.K_o and not self.logic_orchestrator.is_running:
+                try:
+                    loaded_grid = load_map(global_config.MAP_PATH)
+                except (OSError, ValueError) as error:
+                    print(f"Could not open {global_config.MAP_PATH}: {error}")
+                    return
+                self._reinitialize_workspace(loaded_grid, load_landmarks_for(loaded_grid, global_config.MAP_PATH))
+                self._discard_results()
+                return
+
+            if active_event.key == pygame.K_e and active_event.mod & pygame.KMOD_SHIFT:
+                if not self.logic_orchestrator.is_running:
+                    self._open_trace()
+                return
+
+            if active_event.key == pygame.K_h and not self.logic_orchestrator.is_running:
+                self._toggle_abstract_level()
+                return
+
+            if active_event.key == pygame.K_l and not self.logic_orchestrator.is_running:
+                self._build_landmarks()
+                return
+
+            if active_event.key == pygame.K_ESCAPE:
+                if self.logic_orchestrator.cancel_run():
+                    self.finish_time_stamp = time.time()
+                return
+
+            if active_event.key == pygame.K_m:
+                self.logic_orchestrator.cycle_step_mode()
+                return
+
+            if active_event.key == pygame.K_t:
+                self.logic_orchestrator.toggle_memory_tracking()
+                return
+
+            if active_event.key == pygame.K_j:
+                run_metrics = self.logic_orchestrator.run_metrics
+                if run_metrics is not None and not run_metrics.is_live:
+                    run_metrics.save(global_config.METRICS_EXPORT_PATH)
+                return
+
+            if active_event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                self.logic_orchestrator.adjust_speed(1)
+                return
+
+            if active_event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                self.logic_orchestrator.adjust_speed(-1)
+                return
+
+            if active_event.key in (pygame.K_LEFTBRACKET, pygame.K_RIGHTBRACKET):
+                if not self.logic_orchestrator.is_running:
+                    direction = 1 if active_event.key == pygame.K_RIGHTBRACKET else -1
+                    self.logic_orchestrator.adjust_heuristic_weight(direction)
+                return
+
+            if pygame.K_1 <= active_event.key <= pygame.K_5 and self._is_grid_editable():
+                current_node = self._node_under_mouse()
+                if current_node is not None and not current_node.is_barrier():
+                    self.grid_model.set_weight(current_node.cell, active_event.key - pygame.K_0)
+                return
+
+            if self.logic_orchestrator.is_finished and self.logic_orchestrator.trace is not None:
+                if active_event.key == pygame.K_r:
+                    self.logic_orchestrator.start_replay()
+                    return
+
+                if active_event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                    # Arrows jump 1% of the run; with SHIFT they move one step.
+                    step_change = 1
+                    if not active_event.mod & pygame.KMOD_SHIFT:
+                        step_change = max(self.logic_orchestrator.trace.step_count // 100, 1)
+                    if active_event.key == pygame.K_LEFT:
+                        step_change = -step_change
+                    self.logic_orchestrator.seek_replay(step_change)
+                    return
+
+                if active_event.key == pygame.K_e:
+                    self.logic_orchestrator.trace.save(global_config.TRACE_EXPORT_PATH)
+                    return
+
+            if not self.logic_orchestrator.is_running and not self.logic_orchestrator.is_finished:
+                has_endpoints = self.origin_node and self.destination_node
+                if active_event.key == pygame.K_SPACE and has_endpoints:
+                    self.logic_orchestrator.start_simulation(
+                        self.grid_model,
+                        self.origin_node.cell,
+                        self.destination_node.cell
+                    )
+
+                if active_event.key == pygame.K_v and has_endpoints:
+                    self.logic_orchestrator.start_race(
+                        self.grid_model,
+                        self.origin_node.cell,
+                        self.destination_node.cell
+                    )
+                    self._open_race_view()
+
+    def _grid_area(self):
+        return pygame.Rect(
+            global_config.GRID_OFFSET_X,
+            global_config.GRID_OFFSET_Y,
+            global_config.WINDOW_WIDTH - global_config.GRID_OFFSET_X - 20,
+            global_config.WINDOW_HEIGHT - global_config.GRID_OFFSET_Y - 20,
+        )
+
+    def _open_race_view(self):
+        self.race_view = RaceView(self.logic_orchestrator.race, self._grid_area())
+        self.needs_full_frame = True
+
+    def _generate_map(self):
+        if self.map_generator_index < 0:
+            walls, weights = "EMPTY", "UNIFORM"
+        else:
+            walls, weights = global_config.MAP_GENERATORS[self.map_generator_index], "TERRAIN"
+        pygame.display.set_caption(f"AI Pathfinder Visualizer v2.0 - {walls} #{self.map_seed}")
+        return generate_grid(self.grid_size, self.grid_size, walls, weights, self.map_seed)
+
+    def _build_landmarks(self):
+        # Blocks for a few seconds on large maps. S writes the table next to
+        # the map, so reopening it with O skips this.
+        try:
+            landmarks = build_landmarks(self.grid_model, global_config.LANDMARK_COUNT)
+        except ValueError as error:
+            print(f"Could not place landmarks: {error}")
+            return
+        self.logic_orchestrator.landmarks = landmarks
+        print(f"{landmarks.count} landmarks in {landmarks.build_time:.2f}s ({landmarks.nbytes / 2**20:.1f} MB)")
+        self.needs_full_frame = True
+
+    def _open_trace(self):
+        try:
+            trace = load_trace(global_config.TRACE_EXPORT_PATH)
+        except (OSError, ValueError) as error:
+            print(f"Could not open {global_config.TRACE_EXPORT_PATH}: {error}")
+            return
+        self._reinitialize_workspace(trace.build_grid())
+        self._discard_results()
+        self.logic_orchestrator.load_replay(self.grid_model, trace)
+
+    def _toggle_abstract_level(self):
+        if self.grid_renderer.abstract_level is not None:
+            self.grid_renderer.set_abstract_level(None)
+            self.abstract_refresh = None
+            return
+        # The run loop builds the graph over the next frames.
+        self.grid_renderer.set_abstract_level(self.logic_orchestrator.hierarchy_for(self.grid_model))
+
+    def _abstract_level_is_stale(self):
+        abstract_level = self.grid_renderer.abstract_level
+        return abstract_level is not None and abstract_level.needs_refresh
+
+    def _refresh_abstract_level(self):
+        # Edits only rebuild the clusters they touched, a slice per frame.
+        if self.abstract_refresh is None:
+            self.abstract_refresh = self.grid_renderer.abstract_level.refresh()
+        if run_for(self.abstract_refresh, global_config.ABSTRACT_REFRESH_SLICE_SECONDS):
+            self.abstract_refresh = None
+        self.grid_model.invalidate()
+
+    def _discard_results(self):
+        self.logic_orchestrator.end_race()
+        self.logic_orchestrator.discard_trace()
+        self.logic_orchestrator.discard_replanner()
+        self.logic_orchestrator.is_finished = False
+        self.finish_time_stamp = None
+
+    def _reinitialize_workspace(self, grid_model=None, landmarks=None):
+        if grid_model is None:
+            grid_model = self._generate_map()
+        self.grid_model = grid_model
+        self.logic_orchestrator.landmarks = landmarks
+        self.grid_renderer.attach(self.grid_model)
+        self.grid_renderer.abstract_level = None
+        self.abstract_refresh = None
+        if self.race_view is not None:
+            self.race_view = None
+            self.needs_full_frame = True
+
+        # Loaded maps may already carry their endpoints.
+        start_cell, target_cell = find_endpoints(self.grid_model)
+        self.origin_node = None if start_cell is None else GridNode(self.grid_model, start_cell)
+        self.destination_node = None if target_cell is None else GridNode(self.grid_model, target_cell)
+
+    def run(self):
+        while self.is_application_active:
+            current_time = time.time()
+            
+            if self.logic_orchestrator.is_running:
+                self.logic_orchestrator.advance(current_time)
+                
+                if not self.logic_orchestrator.is_running and self.logic_orchestrator.is_finished:
+                    self.finish_time_stamp = time.time()
+            elif self.logic_orchestrator.replan():
+                # Keep the results popup out of the way while editing.
+                self.finish_time_stamp = None
+            elif self._abstract_level_is_stale():
+                self._refresh_abstract_level()
+
+            render_started = time.perf_counter()
+            if self.race_view is not None:
+                active_view = self.race_view
+            else:
+                active_view = self.grid_renderer
+                self.grid_renderer.set_show_weights(self.logic_orchestrator.uses_weights())
+            grid_rects = active_view.update()
+
+            if self.race_view is not None:
+                status = "RACE"
+            elif self.logic_orchestrator.is_replaying:
+                status = "REPLAY"
+            elif self.logic_orchestrator.is_running:
+                status = "RUNNING"
+            elif self.logic_orchestrator.is_finished:
+                status = "FINISHED"
+            else:
+                status = "IDLE"
+
+            popup_visible = (
+                self.logic_orchestrator.is_finished
+                and self.finish_time_stamp is not None
+                and time.time() - self.finish_time_stamp > self.POPUP_DELAY_SECONDS
+                and not self.logic_orchestrator.is_reviewing()
+                and self.race_view is None
+            )
+            if popup_visible != self.popup_was_visible:
+                self.popup_was_visible = popup_visible
+                self.needs_full_frame = True
+
+            if self.needs_full_frame:
+                self.needs_full_frame = False
+                self.display_surface.fill(global_config.COLOR_BG)
+                active_view.blit(self.display_surface)
+                self.ui_renderer.render_control_panel(
+                    self.logic_orchestrator.selected_algorithm, 
+                    status,
+                    self.logic_orchestrator.step_mode,
+                    self.logic_orchestrator.speed_label(),
+                    self.logic_orchestrator.algorithm_detail(),
+                    self.logic_orchestrator.run_metrics,
+                    self.logic_orchestrator.track_memory
+                )
+                if popup_visible:
+                    self.ui_renderer.render_result_popup(
+                        self.logic_orchestrator.result,
+                        self.logic_orchestrator.duration,
+                        self.logic_orchestrator.run_metrics
+                    )
+                changed_rects = None
+            elif popup_visible:
+                # The dimmed frame stays valid until the popup is dismissed.
+                changed_rects = []
+            else:
+                active_view.blit(self.display_surface, grid_rects)
+                sidebar_rect = self.ui_renderer.render_control_panel(
+                    self.logic_orchestrator.selected_algorithm, 
+                    status,
+                    self.logic_orchestrator.step_mode,
+                    self.logic_orchestrator.speed_label(),
+                    self.logic_orchestrator.algorithm_detail(),
+                    self.logic_orchestrator.run_metrics,
+                    self.logic_orchestrator.track_memory
+                )
+                changed_rects = grid_rects if sidebar_rect is None else [*grid_rects, sidebar_rect]
+
+            if changed_rects is None:
+                pygame.display.flip()
+            elif changed_rects:
+                pygame.display.update(changed_rects)
+            self.logic_orchestrator.record_render_time(time.perf_counter() - render_started)
+
+            if self._is_animating():
+                self._process_user_inputs(pygame.event.get())
+            else:
+                # Nothing changes on screen until an event arrives, so sleep
+                # in the event queue instead of redrawing the same frame.
+                first_event = pygame.event.wait(self._idle_wait_ms())
+                self._process_user_inputs([first_event, *pygame.event.get()])
+            self.execution_clock.tick(global_config.FPS)
+        pygame.quit()
+
+    def _is_animating(self):
+        if self.logic_orchestrator.is_running or self._abstract_level_is_stale():
+            return True
+        # Held buttons are a drag (painting walls or panning) that should
+        # follow the mouse every frame.
+        return any(pygame.mouse.get_pressed())
+
+    def _idle_wait_ms(self):
+        # Wake up in time to show the results popup.
+        if self.finish_time_stamp is not None and not self.popup_was_visible:
+            remaining = self.finish_time_stamp + self.POPUP_DELAY_SECONDS - time.time()
+            if remaining > 0:
+                return min(int(remaining * 1000) + 1, global_config.IDLE_WAIT_MS)
+        return global_config.IDLE_WAIT_MS
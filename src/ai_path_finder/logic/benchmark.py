@@ -0,0 +1,216 @@
+"""
+Headless Benchmark Suite for the AI Pathfinder.
+Runs every registered solver over seeded grids without importing pygame.
+"""
+import argparse
+import csv
+import functools
+import json
+import sys
+import time
+import tracemalloc
+
+from ai_path_finder.algorithms.hpastar import ClusterGraph
+from ai_path_finder.algorithms.metrics import SearchMetrics
+from ai_path_finder.algorithms.result import run_to_completion
+from ai_path_finder.logic.grid_model import EMPTY
+from ai_path_finder.logic.map_generators import WALL_GENERATORS, generate_grid
+from ai_path_finder.logic.simulation_manager import SimulationManager
+
+DEFAULT_SIZES = (25, 64, 256, 1024, 4096)
+DEFAULT_DENSITIES = (0.0, 0.2, 0.35)
+DEFAULT_SEED = 1337
+DEFAULT_MAX_EXPANSIONS = 2_000_000
+
+RESULT_FIELDS = (
+    "algorithm",
+    "rows",
+    "cols",
+    "layout",
+    "wall_density",
+    "seed",
+    "found",
+    "truncated",
+    "nodes_expanded",
+    "nodes_pushed",
+    "nodes_reopened",
+    "peak_frontier",
+    "expansions_per_sec",
+    "wall_time_s",
+    "preprocess_time_s",
+    "peak_memory_bytes",
+    "path_length",
+    "path_cost",
+)
+
+
+def build_benchmark_grid(size, wall_density, seed, layout="RANDOM"):
+    wall_options = {"density": wall_density} if layout == "RANDOM" else None
+    grid = generate_grid(size, size, walls=layout, weights="UNIFORM", seed=seed, wall_options=wall_options)
+
+    if layout == "RANDOM":
+        start_cell, target_cell = 0, grid.size - 1
+    else:
+        # Generated layouts wall their border, so use the outermost open cells.
+        start_cell, target_cell = grid.state.find(EMPTY), grid.state.rfind(EMPTY)
+    grid.set_start(start_cell)
+    grid.set_target(target_cell)
+    return grid, start_cell, target_cell
+
+
+def _drive_solver(solver_function, grid, start_cell, target_cell, max_expansions):
+    """Returns (metrics, elapsed, result); result is None when truncated."""
+    grid.clear_search_marks()
+    metrics = SearchMetrics()
+    result = None
+
+    search_generator = solver_function(grid, start_cell, target_cell, metrics=metrics)
+    started = time.perf_counter()
+    try:
+        while metrics.nodes_expanded < max_expansions:
+            next(search_generator)
+    except StopIteration as stop:
+        result = stop.value
+    elapsed = time.perf_counter() - started
+    return metrics, elapsed, result
+
+
+def run_case(algorithm_name, solver_function, grid, start_cell, target_cell, max_expansions, measure_memory=True):
+    peak_memory = None
+    if measure_memory:
+        # tracemalloc slows allocation down, so memory gets its own pass.
+        tracemalloc.start()
+        _drive_solver(solver_function, grid, start_cell, target_cell, max_expansions)
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    metrics, elapsed, result = _drive_solver(
+        solver_function, grid, start_cell, target_cell, max_expansions
+    )
+    found = result is not None and result.found
+
+    return {
+        "algorithm": algorithm_name,
+        "rows": grid.rows,
+        "cols": grid.cols,
+        "found": found,
+        "truncated": result is None,
+        "nodes_expanded": metrics.nodes_expanded,
+        "nodes_pushed": metrics.nodes_pushed,
+        "nodes_reopened": metrics.nodes_reopened,
+        "peak_frontier": metrics.peak_frontier,
+        "expansions_per_sec": metrics.nodes_expanded / elapsed if elapsed > 0 else None,
+        "wall_time_s": elapsed,
+        "preprocess_time_s": None,
+        "peak_memory_bytes": peak_memory,
+        "path_length": result.path_length if found else None,
+        "path_cost": result.cost if found else None,
+    }
+
+
+def run_benchmark(sizes=DEFAULT_SIZES, densities=DEFAULT_DENSITIES, seed=DEFAULT_SEED, algorithms=None, max_expansions=DEFAULT_MAX_EXPANSIONS, measure_memory=True, progress=None, layout="RANDOM"):
+    algorithm_map = SimulationManager().algorithm_map
+    selected = algorithms or list(algorithm_map)
+    results = []
+
+    # Only random layouts have a density to sweep.
+    if layout != "RANDOM":
+        densities = (None,)
+
+    for size in sizes:
+        for wall_density in densities:
+            grid, start_cell, target_cell = build_benchmark_grid(size, wall_density, seed, layout)
+            solvers = dict(algorithm_map)
+            preprocess_time = None
+            # HPA* gets its cluster graph built here, so the timed run and the
+            # expansion cap only cover the search itself.
+            if "HPA*" in selected:
+                hierarchy = ClusterGraph(grid)
+                started = time.perf_counter()
+                run_to_completion(hierarchy.refresh())
+                preprocess_time = time.perf_counter() - started
+                solvers["HPA*"] = functools.partial(solvers["HPA*"], hierarchy=hierarchy)
+            for algorithm_name in selected:
+                record = run_case(
+                    algorithm_name,
+                    solvers[algorithm_name],
+                    grid,
+                    start_cell,
+                    target_cell,
+                    max_expansions,
+                    measure_memory,
+                )
+                record["layout"] = layout
+                record["wall_density"] = wall_density
+                record["seed"] = seed
+                if algorithm_name == "HPA*":
+                    record["preprocess_time_s"] = preprocess_time
+                results.append(record)
+                if progress:
+                    progress(record)
+    return results
+
+
+def write_json(results, path):
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(results, handle, indent=2)
+
+
+def write_csv(results, path):
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def _print_record(record):
+    rate = record["expansions_per_sec"]
+    memory = record["peak_memory_bytes"]
+    preprocess = record["preprocess_time_s"]
+    print(
+        f"{record['algorithm']:<14} {record['rows']:>5}x{record['cols']:<5} "
+        f"{record['layout']:<8} walls={record['wall_density']!s:<5} expanded={record['nodes_expanded']:<9} "
+        f"rate={(rate or 0):>11,.0f}/s frontier={record['peak_frontier']:<8} "
+        f"mem={(memory or 0) / 1_048_576:>8.1f}MB time={record['wall_time_s']:.4f}s "
+        f"{'' if preprocess is None else f'preprocess={preprocess:.4f}s '}"
+        f"path={record['path_length']} cost={record['path_cost']}"
+        f"{' (truncated)' if record['truncated'] else ''}",
+        flush=True,
+    )
+
+
+def main(argv=None):
+    algorithm_names = list(SimulationManager().algorithm_map)
+
+    parser = argparse.ArgumentParser(description="Headless benchmark for every registered solver.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--densities", type=float, nargs="+", default=list(DEFAULT_DENSITIES))
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--layout", choices=list(WALL_GENERATORS), default="RANDOM", help="wall generator; --densities only applies to RANDOM")
+    parser.add_argument("--algorithms", nargs="+", choices=algorithm_names, default=None)
+    parser.add_argument("--max-expansions", type=int, default=DEFAULT_MAX_EXPANSIONS)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--json", dest="json_path", help="write results as JSON")
+    parser.add_argument("--csv", dest="csv_path", help="write results as CSV")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(
+        sizes=args.sizes,
+        densities=args.densities,
+        seed=args.seed,
+        algorithms=args.algorithms,
+        max_expansions=args.max_expansions,
+        measure_memory=not args.no_memory,
+        progress=_print_record,
+        layout=args.layout,
+    )
+
+    if args.json_path:
+        write_json(results, args.json_path)
+    if args.csv_path:
+        write_csv(results, args.csv_path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,347 @@
+"""
+Headless Grid Model for the AI Pathfinder.
+Flat byte buffers indexed by integer cell ids (row * cols + col).
+"""
+import itertools
+import random
+
+EMPTY = 0
+FRONTIER = 1
+EXPLORED = 2
+PATH = 3
+WALL = 4
+START = 5
+TARGET = 6
+
+STATE_NAMES = ("EMPTY", "FRONTIER", "EXPLORED", "PATH", "WALL", "START", "TARGET")
+
+STRICT_MOVEMENT_ORDER = ((-1, 0), (0, 1), (1, 0), (1, 1), (0, -1), (-1, -1))
+
+# Search overlays (FRONTIER, EXPLORED, PATH) collapse back to EMPTY.
+_CLEAR_MARKS_TABLE = bytes([EMPTY, EMPTY, EMPTY, EMPTY]) + bytes(range(4, 256))
+_WALL_FLAG_TABLE = bytes([EMPTY]) + bytes([WALL]) * 255
+_OPEN_CELL_TABLE = bytes(0 if value == WALL else 1 for value in range(256))
+
+# Map ids and versions come from one counter, so a version is never reused,
+# not even by a fork that was edited differently.
+_MAP_VERSIONS = itertools.count(1)
+
+
+class GridModel:
+    def __init__(self, row_count, col_count, weights=None, state=None, neighbor_masks=None):
+        self.rows = row_count
+        self.cols = col_count
+        self.size = row_count * col_count
+
+        # Cells with state <= PATH are open; overlays only ever land on them.
+        self.state = bytearray(self.size) if state is None else bytearray(state)
+
+        if weights is None:
+            weights = random.choices(range(1, 6), k=self.size)
+        self.weights = bytearray(weights)
+        self.owns_weights = True
+
+        # Bit i of neighbor_masks[cell] is set when STRICT_MOVEMENT_ORDER[i]
+        # is a legal move from cell; mask_deltas turns a mask into cell offsets.
+        self.direction_offsets = tuple(
+            row_change * col_count + col_change
+            for row_change, col_change in STRICT_MOVEMENT_ORDER
+        )
+        self.mask_deltas = tuple(
+            tuple(
+                offset
+                for bit, offset in enumerate(self.direction_offsets)
+                if mask >> bit & 1
+            )
+            for mask in range(1 << len(STRICT_MOVEMENT_ORDER))
+        )
+        # Forks share neighbor_masks until either side changes a wall.
+        self.owns_adjacency = True
+        if neighbor_masks is None:
+            self.neighbor_masks = bytearray(self.size)
+            self.rebuild_adjacency()
+        else:
+            # Saved maps carry their adjacency, so loading skips the rebuild.
+            self.neighbor_masks = bytearray(neighbor_masks)
+
+        # Renderers opt in; headless runs never pay for the bookkeeping.
+        self.dirty_cells = None
+        self.paused_dirty_cells = None
+        self.full_redraw_pending = False
+
+        # A recording SearchTrace installs its event array here; every
+        # overlay change is appended as (cell << 2) | new state.
+        self.trace_events = None
+
+        # Called with the cell after every single-cell wall, endpoint or
+        # weight edit; bulk loads replace the whole map and notify nobody.
+        self.edit_listeners = []
+
+        # map_id names this map and its forks; map_version changes with
+        # every wall or weight edit, so cached answers can be keyed on it.
+        self.map_id = next(_MAP_VERSIONS)
+        self.map_version = self.map_id
+
+    def fork(self):
+        """
+        Independent search state over the same map. Only the state buffer
+        is copied; weights and adjacency stay shared (copy-on-write).
+        """
+        twin = GridModel.__new__(GridModel)
+        twin.rows = self.rows
+        twin.cols = self.cols
+        twin.size = self.size
+        twin.state = bytearray(self.state)
+        twin.weights = self.weights
+        twin.owns_weights = False
+        self.owns_weights = False
+        twin.direction_offsets = self.direction_offsets
+        twin.mask_deltas = self.mask_deltas
+        twin.neighbor_masks = self.neighbor_masks
+        twin.owns_adjacency = False
+        self.owns_adjacency = False
+        twin.dirty_cells = None
+        twin.paused_dirty_cells = None
+        twin.full_redraw_pending = False
+        twin.trace_events = None
+        twin.edit_listeners = []
+        twin.map_id = self.map_id
+        twin.map_version = self.map_version
+        return twin
+
+    def cell_id(self, row, col):
+        return row * self.cols + col
+
+    def coordinates(self, cell):
+        return divmod(cell, self.cols)
+
+    def is_barrier(self, cell):
+        return self.state[cell] == WALL
+
+    def reset_cell(self, cell):
+        self._set_structural_state(cell, EMPTY)
+
+    def set_wall(self, cell):
+        self._set_structural_state(cell, WALL)
+
+    def set_start(self, cell):
+        self._set_structural_state(cell, START)
+
+    def set_target(self, cell):
+        self._set_structural_state(cell, TARGET)
+
+    def _set_structural_state(self, cell, new_state):
+        was_barrier = self.state[cell] == WALL
+        self.state[cell] = new_state
+        if self.dirty_cells is not None:
+            self.dirty_cells.add(cell)
+        if was_barrier != (new_state == WALL):
+            self._patch_adjacency(cell)
+            self.map_version = next(_MAP_VERSIONS)
+        for listener in self.edit_listeners:
+            listener(cell)
+
+    def set_weight(self, cell, weight):
+        if not self.owns_weights:
+            self.weights = bytearray(self.weights)
+            self.owns_weights = True
+        self.weights[cell] = weight
+        self.map_version = next(_MAP_VERSIONS)
+        if self.dirty_cells is not None:
+            self.dirty_cells.add(cell)
+        for listener in self.edit_listeners:
+            listener(cell)
+
+    def mark_frontier(self, cell):
+        if self.state[cell] <= PATH:
+            self.state[cell] = FRONTIER
+            if self.dirty_cells is not None:
+                self.dirty_cells.add(cell)
+            if self.trace_events is not None:
+                self.trace_events.append(cell << 2 | FRONTIER)
+
+    def mark_explored(self, cell):
+        if self.state[cell] <= PATH:
+            self.state[cell] = EXPLORED
+            if self.dirty_cells is not None:
+                self.dirty_cells.add(cell)
+            if self.trace_events is not None:
+                self.trace_events.append(cell << 2 | EXPLORED)
+
+    def mark_path(self, cell):
+        if self.state[cell] <= PATH:
+            self.state[cell] = PATH
+            if self.dirty_cells is not None:
+                self.dirty_cells.add(cell)
+            if self.trace_events is not None:
+                self.trace_events.append(cell << 2 | PATH)
+
+    def apply_events(self, events):
+        """
+        Replay overlay events packed as in trace_events. They must come
+        from a grid that held the same state, e.g. a fork searching in
+        another thread, so every event is known to apply.
+        """
+        state = self.state
+        for event in events:
+            state[event >> 2] = event & 3
+        if self.dirty_cells is not None:
+            self.dirty_cells.update(event >> 2 for event in events)
+        if self.trace_events is not None:
+            self.trace_events.extend(events)
+
+    def load_walls(self, wall_flags):
+        """Replace the whole grid with walls where wall_flags is non-zero."""
+        self.state[:] = bytes(wall_flags).translate(_WALL_FLAG_TABLE)
+        self.rebuild_adjacency()
+        self.map_version = next(_MAP_VERSIONS)
+        self.invalidate()
+
+    def load_state(self, state):
+        """Replace every cell state at once, e.g. from a saved snapshot."""
+        self.state[:] = state
+        self.rebuild_adjacency()
+        self.map_version = next(_MAP_VERSIONS)
+        self.invalidate()
+
+    def load_overlay(self, state):
+        """
+        load_state for a snapshot of this same map, e.g. a replay keyframe:
+        only search marks differ, so adjacency and map_version are kept.
+        """
+        self.state[:] = state
+        self.invalidate()
+
+    def clear_search_marks(self):
+        self.state[:] = self.state.translate(_CLEAR_MARKS_TABLE)
+        self.invalidate()
+
+    def clear_marks(self, cells):
+        state = self.state
+        for cell in cells:
+            if FRONTIER <= state[cell] <= PATH:
+                state[cell] = EMPTY
+                if self.dirty_cells is not None:
+                    self.dirty_cells.add(cell)
+                if self.trace_events is not None:
+                    self.trace_events.append(cell << 2 | EMPTY)
+
+    def enable_dirty_tracking(self):
+        if self.dirty_cells is None:
+            self.dirty_cells = set()
+        self.invalidate()
+
+    def pause_dirty_tracking(self):
+        self.paused_dirty_cells = self.dirty_cells
+        self.dirty_cells = None
+
+    def resume_dirty_tracking(self):
+        if self.paused_dirty_cells is not None:
+            self.dirty_cells = self.paused_dirty_cells
+            self.paused_dirty_cells = None
+        self.invalidate()
+
+    def invalidate(self):
+        self.full_redraw_pending = True
+
+    def take_dirty_cells(self):
+        """
+        Hand the cells changed since the last call to the renderer.
+        Returns None when a bulk operation requires a full redraw.
+        """
+        if self.full_redraw_pending:
+            self.full_redraw_pending = False
+            if self.dirty_cells:
+                self.dirty_cells.clear()
+            return None
+        if not self.dirty_cells:
+            return ()
+        changed_cells = self.dirty_cells
+        self.dirty_cells = set()
+        return changed_cells
+
+    def neighbors_of(self, cell):
+        return [cell + delta for delta in self.mask_deltas[self.neighbor_masks[cell]]]
+
+    def rebuild_adjacency(self):
+        """
+        Recompute every neighbor mask in bulk.
+        Each byte of a big integer acts as one cell lane, so the shifts and
+        ANDs below evaluate all cells at once in C.
+        """
+        size, cols = self.size, self.cols
+        lane_bits = 8
+        all_lanes = (1 << (lane_bits * size)) - 1
+
+        def lanes(buffer):
+            return int.from_bytes(buffer, "little")
+
+        open_cells = lanes(self.state.translate(_OPEN_CELL_TABLE))
+        not_last_col = lanes((b"\x01" * (cols - 1) + b"\x00") * self.rows)
+        not_first_col = lanes((b"\x00" + b"\x01" * (cols - 1)) * self.rows)
+
+        row_shift = lane_bits * cols
+        up = (open_cells << row_shift) & all_lanes
+        down = open_cells >> row_shift
+        right = (open_cells >> lane_bits) & not_last_col
+        left = ((open_cells << lane_bits) & all_lanes) & not_first_col
+        down_right = (open_cells >> (row_shift + lane_bits)) & right & down & not_last_col
+        up_left = ((open_cells << (row_shift + lane_bits)) & all_lanes) & left & up & not_first_col
+
+        direction_lanes = {
+            (-1, 0): up,
+            (0, 1): right,
+            (1, 0): down,
+            (1, 1): down_right,
+            (0, -1): left,
+            (-1, -1): up_left,
+        }
+        combined = 0
+        for bit, direction in enumerate(STRICT_MOVEMENT_ORDER):
+            combined |= direction_lanes[direction] << bit
+
+        # Walls never expand, so their masks stay empty.
+        combined &= open_cells * ((1 << len(STRICT_MOVEMENT_ORDER)) - 1)
+        if self.owns_adjacency:
+            self.neighbor_masks[:] = combined.to_bytes(size, "little")
+        else:
+            self.neighbor_masks = bytearray(combined.to_bytes(size, "little"))
+            self.owns_adjacency = True
+
+    def _patch_adjacency(self, cell):
+        # A cell's wall status only affects moves inside its 3x3 block:
+        # direct moves into it and the corner-cutting check of diagonals.
+        if not self.owns_adjacency:
+            self.neighbor_masks = bytearray(self.neighbor_masks)
+            self.owns_adjacency = True
+        row, col = divmod(cell, self.cols)
+        for affected_row in range(max(row - 1, 0), min(row + 2, self.rows)):
+            for affected_col in range(max(col - 1, 0), min(col + 2, self.cols)):
+                affected_cell = affected_row * self.cols + affected_col
+                self.neighbor_masks[affected_cell] = self._compute_mask(affected_cell)
+
+    def _compute_mask(self, cell):
+        state = self.state
+        if state[cell] == WALL:
+            return 0
+
+        row, col = divmod(cell, self.cols)
+        mask = 0
+        for bit, (row_change, col_change) in enumerate(STRICT_MOVEMENT_ORDER):
+            target_row = row + row_change
+            target_col = col + col_change
+
+            if 0 <= target_row < self.rows and 0 <= target_col < self.cols:
+                if state[target_row * self.cols + target_col] == WALL:
+                    continue
+                if (
+                    row_change != 0
+                    and col_change != 0
+                    and (
+                        state[row * self.cols + target_col] == WALL
+                        or state[target_row * self.cols + col] == WALL
+                    )
+                ):
+                    continue
+                mask |= 1 << bit
+        return mask
@@ -0,0 +1,325 @@
+"""
+Landmark (ALT) Heuristics for the AI Pathfinder.
+Precomputed costs from a few landmark cells give tighter A* estimates.
+"""
+import argparse
+import mmap
+import os
+import random
+import struct
+import sys
+import time
+import zlib
+from array import array
+
+from ai_path_finder.algorithms.astar import make_heuristic
+from ai_path_finder.algorithms.metrics import SearchMetrics
+from ai_path_finder.algorithms.result import run_to_completion
+from ai_path_finder.algorithms.ucs import uniform_cost_sweep
+from ai_path_finder.logic.grid_model import WALL
+
+LANDMARK_MAGIC = b"PFLMK001"
+LANDMARK_EXTENSION = ".pflm"
+# magic, rows, cols, landmark count, bytes per distance, map fingerprint
+_HEADER = struct.Struct("<8sIIIII")
+_SECTION_ALIGNMENT = 8
+
+DEFAULT_LANDMARK_COUNT = 8
+# Each query only consults the landmarks that bound its start best.
+ACTIVE_LANDMARK_COUNT = 4
+UNREACHED_DISTANCE = -1
+PROBE_ATTEMPTS = 8
+
+# Solvers that take heuristic= (and start_heuristic= for BIDIR A*). LPA*
+# is left out: it keeps planning through edits, which void the table.
+LANDMARK_ALGORITHMS = frozenset({"A*", "WEIGHTED A*", "GREEDY", "BIDIR A*"})
+
+
+def map_fingerprint(grid):
+    """Checksum of everything the distances depend on: weights and moves."""
+    return zlib.crc32(grid.neighbor_masks, zlib.crc32(grid.weights))
+
+
+def landmark_path_for(map_path):
+    return os.path.splitext(map_path)[0] + LANDMARK_EXTENSION
+
+
+class LandmarkTable:
+    """
+    distances[i][cell] is the cost from landmark_cells[i] to cell, or
+    UNREACHED_DISTANCE. Entering a cell costs its weight and moves are
+    reversible, so the cost back to a landmark is the same route paid from
+    the other end: d(v, L) = d(L, v) + w[L] - w[v]. The triangle inequality
+    then bounds the cost from v to t from below twice per landmark:
+
+        d(v, t) >= d(L, t) - d(L, v)
+        d(v, t) >= d(v, L) - d(t, L) = d(L, v) - d(L, t) - w[v] + w[t]
+
+    Both bounds are consistent, and so is their maximum with the plain
+    geometric estimate, so A* keeps returning optimal paths.
+
+    The table belongs to one exact set of weights and walls. It stays bound
+    to the grid's map_version and is re-checked against the fingerprint
+    when that moves, so undoing an edit brings it back.
+    """
+
+    def __init__(self, rows, cols, landmark_cells, distances, fingerprint, build_time=None):
+        self.rows = rows
+        self.cols = cols
+        self.landmark_cells = landmark_cells
+        self.distances = distances
+        self.fingerprint = fingerprint
+        self.build_time = build_time
+        self.bound_version = None
+
+    @property
+    def count(self):
+        return len(self.landmark_cells)
+
+    @property
+    def nbytes(self):
+        return sum(distances.itemsize * len(distances) for distances in self.distances)
+
+    def matches(self, grid):
+        if (grid.rows, grid.cols) != (self.rows, self.cols):
+            return False
+        if self.bound_version == (grid.map_id, grid.map_version):
+            return True
+        if map_fingerprint(grid) != self.fingerprint:
+            return False
+        self.bound_version = (grid.map_id, grid.map_version)
+        return True
+
+    def _active_landmarks(self, anchor_cell, query_cell, score):
+        # Landmarks that cannot reach query_cell say nothing about it.
+        candidates = [
+            distances for distances in self.distances
+            if distances[anchor_cell] != UNREACHED_DISTANCE and distances[query_cell] != UNREACHED_DISTANCE
+        ]
+        candidates.sort(key=score, reverse=True)
+        return [(distances, distances[anchor_cell]) for distances in candidates[:ACTIVE_LANDMARK_COUNT]]
+
+    def heuristic_to(self, grid, start_cell, target_cell):
+        """Lower bound on the cost from a cell to target_cell."""
+        weights = grid.weights
+        target_weight = weights[target_cell]
+        start_weight = weights[start_cell]
+        geometric = make_heuristic(grid, target_cell)
+
+        def score(distances):
+            gap = distances[start_cell] - distances[target_cell]
+            return max(-gap, gap - start_weight + target_weight)
+
+        active = self._active_landmarks(target_cell, start_cell, score)
+
+        def heuristic(cell):
+            best = geometric(cell)
+            weight_gap = target_weight - weights[cell]
+            for distances, target_distance in active:
+                gap = distances[cell] - target_distance
+                # Plain comparisons: max() would triple the cost of an
+                # estimate, and one is taken for every pushed cell.
+                if -gap > best:
+                    best = -gap
+                if gap + weight_gap > best:
+                    best = gap + weight_gap
+            return best
+
+        return heuristic
+
+    def heuristic_from(self, grid, start_cell, target_cell):
+        """Lower bound on the cost from start_cell to a cell."""
+        weights = grid.weights
+        start_weight = weights[start_cell]
+        target_weight = weights[target_cell]
+        geometric = make_heuristic(grid, start_cell)
+
+        def score(distances):
+            gap = distances[target_cell] - distances[start_cell]
+            return max(gap, -gap - start_weight + target_weight)
+
+        active = self._active_landmarks(start_cell, target_cell, score)
+
+        def heuristic(cell):
+            # The geometric estimate is symmetric apart from the lightest
+            # weight, which it already assumes for every move.
+            best = geometric(cell)
+            weight_gap = weights[cell] - start_weight
+            for distances, start_distance in active:
+                gap = distances[cell] - start_distance
+                if gap > best:
+                    best = gap
+                if weight_gap - gap > best:
+                    best = weight_gap - gap
+            return best
+
+        return heuristic
+
+    def solver_options(self, algorithm, grid, start_cell, target_cell):
+        """Extra solver keyword arguments, or {} when the table does not apply."""
+        if algorithm not in LANDMARK_ALGORITHMS or not self.matches(grid):
+            return {}
+        options = {"heuristic": self.heuristic_to(grid, start_cell, target_cell)}
+        if algorithm == "BIDIR A*":
+            options["start_heuristic"] = self.heuristic_from(grid, start_cell, target_cell)
+        return options
+
+
+def _sweep_distances(grid, source_cell):
+    """One-to-all UCS from source_cell as an int64 NumPy array."""
+    import numpy as np
+
+    parent_tracker = array("i", [-1]) * grid.size
+    _, cost_so_far, settled = run_to_completion(
+        uniform_cost_sweep(grid.fork(), source_cell, -1, parent_tracker, SearchMetrics())
+    )
+    costs = np.frombuffer(cost_so_far, dtype=np.int64 if cost_so_far.typecode == "q" else np.float64)
+    is_settled = np.frombuffer(settled, dtype=np.uint8).astype(bool)
+    return np.where(is_settled, costs, UNREACHED_DISTANCE).astype(np.int64)
+
+
+def build_landmarks(grid, count=DEFAULT_LANDMARK_COUNT, seed=0):
+    """
+    Farthest-point placement: the first landmark is the cell furthest from
+    a probe cell, and every later one the cell furthest from all landmarks
+    so far. Placement stays inside the probe's region, since sealed pockets
+    never share a path with it; the probe is redrawn a few times until it
+    reaches most of the open cells.
+    """
+    # NumPy is imported here rather than at the top, so the solvers and
+    # the simulation manager can load this module without it.
+    import numpy as np
+
+    started = time.perf_counter()
+    open_indices = np.flatnonzero(np.frombuffer(grid.state, dtype=np.uint8) != WALL)
+    if not len(open_indices):
+        raise ValueError("the map has no open cells")
+
+    rng = random.Random(seed)
+    probe_distances = None
+    probe_reached_count = -1
+    for _ in range(PROBE_ATTEMPTS):
+        distances = _sweep_distances(grid, int(open_indices[rng.randrange(len(open_indices))]))
+        reached_count = np.count_nonzero(distances != UNREACHED_DISTANCE)
+        if reached_count > probe_reached_count:
+            probe_distances, probe_reached_count = distances, reached_count
+        if 2 * reached_count > len(open_indices):
+            break
+
+    landmark_cell = int(np.argmax(probe_distances))
+    nearest_distance = np.where(probe_distances != UNREACHED_DISTANCE, np.iinfo(np.int64).max, -1)
+
+    landmark_cells = []
+    distance_arrays = []
+    while len(landmark_cells) < count and nearest_distance[landmark_cell] > 0:
+        distances = _sweep_distances(grid, landmark_cell)
+        landmark_cells.append(landmark_cell)
+        distance_arrays.append(distances)
+        reached = distances != UNREACHED_DISTANCE
+        nearest_distance[reached] = np.minimum(nearest_distance[reached], distances[reached])
+        nearest_distance[landmark_cell] = 0
+        landmark_cell = int(np.argmax(nearest_distance))
+
+    # Costs fit in int32 unless the map is both huge and heavy.
+    largest = max(int(distances.max()) for distances in distance_arrays)
+    typecode = "i" if largest < 2**31 else "q"
+    dtype = np.int32 if typecode == "i" else np.int64
+    compact = [array(typecode, distances.astype(dtype).tobytes()) for distances in distance_arrays]
+    return LandmarkTable(
+        grid.rows, grid.cols, landmark_cells, compact, map_fingerprint(grid), time.perf_counter() - started
+    )
+
+
+def save_landmarks(table, path):
+    itemsize = table.distances[0].itemsize if table.distances else 4
+    with open(path, "wb") as handle:
+        handle.write(_HEADER.pack(LANDMARK_MAGIC, table.rows, table.cols, table.count, itemsize, table.fingerprint))
+        handle.write(array("q", table.landmark_cells))
+        for distances in table.distances:
+            handle.write(bytes(-handle.tell() % _SECTION_ALIGNMENT))
+            handle.write(distances)
+
+
+def load_landmarks(path):
+    with open(path, "rb") as handle:
+        backing_map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        magic, rows, cols, count, itemsize, fingerprint = _HEADER.unpack_from(backing_map)
+        if magic != LANDMARK_MAGIC:
+            raise ValueError(f"{path} is not a landmark table")
+        typecode = {4: "i", 8: "q"}.get(itemsize)
+        if typecode is None:
+            raise ValueError(f"{path} has an unsupported distance size")
+
+        offset = _HEADER.size
+        landmark_cells = list(struct.unpack_from(f"<{count}q", backing_map, offset))
+        offset += 8 * count
+        section_size = rows * cols * itemsize
+        distances = []
+        for _ in range(count):
+            offset += -offset % _SECTION_ALIGNMENT
+            if offset + section_size > len(backing_map):
+                raise ValueError(f"{path} is truncated")
+            distances.append(array(typecode, backing_map[offset:offset + section_size]))
+            offset += section_size
+        return LandmarkTable(rows, cols, landmark_cells, distances, fingerprint)
+    finally:
+        backing_map.close()
+
+
+def load_landmarks_for(grid, map_path):
+    """The table saved next to map_path if it still fits grid, else None."""
+    try:
+        table = load_landmarks(landmark_path_for(map_path))
+    except (OSError, ValueError):
+        return None
+    return table if table.matches(grid) else None
+
+
+def _compare_on_queries(grid, table, query_count, seed):
+    import numpy as np
+
+    from ai_path_finder.logic.pathfinding import find_path
+
+    open_indices = np.flatnonzero(np.frombuffer(grid.state, dtype=np.uint8) != WALL)
+    rng = random.Random(seed)
+    totals = {"plain": [0, 0.0], "landmarks": [0, 0.0]}
+    for _ in range(query_count):
+        start_cell, target_cell = (int(open_indices[rng.randrange(len(open_indices))]) for _ in range(2))
+        for label, total in totals.items():
+            options = table.solver_options("A*", grid, start_cell, target_cell) if label == "landmarks" else {}
+            started = time.perf_counter()
+            result = find_path(grid, start_cell, target_cell, "A*", **options)
+            total[0] += result.metrics.nodes_expanded
+            total[1] += time.perf_counter() - started
+    for label, (expanded, seconds) in totals.items():
+        print(f"A* {label:>9}: {expanded / query_count:10.0f} expanded, {seconds / query_count * 1000:8.1f} ms per query")
+
+
+def main(argv=None):
+    from ai_path_finder.logic.map_io import load_map
+
+    parser = argparse.ArgumentParser(description="Precompute ALT landmarks for a map and save them next to it.")
+    parser.add_argument("map_path")
+    parser.add_argument("--count", type=int, default=DEFAULT_LANDMARK_COUNT)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="defaults to the map path with " + LANDMARK_EXTENSION)
+    parser.add_argument("--queries", type=int, default=0, help="compare A* with and without on this many random queries")
+    args = parser.parse_args(argv)
+
+    grid = load_map(args.map_path)
+    table = build_landmarks(grid, args.count, args.seed)
+    output_path = args.output or landmark_path_for(args.map_path)
+    save_landmarks(table, output_path)
+    print(
+        f"{table.count} landmarks on {grid.rows}x{grid.cols} in {table.build_time:.2f}s, "
+        f"{table.nbytes / 2**20:.1f} MB -> {output_path}"
+    )
+    if args.queries > 0:
+        _compare_on_queries(grid, table, args.queries, args.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,351 @@
+"""
+Seeded Map Generators for the AI Pathfinder.
+Bulk NumPy wall layouts and weight terrain; the same seed gives the same map.
+"""
+import argparse
+import sys
+
+import numpy as np
+
+from ai_path_finder.logic.grid_model import STRICT_MOVEMENT_ORDER, WALL, GridModel
+
+DEFAULT_SEED = 1337
+DEFAULT_WALL_DENSITY = 0.25
+TERRAIN_OCTAVES = 5
+MAX_WEIGHT = 5
+# Eller-style maze: chance that a cell joins its left neighbor, and that a
+# cell drops a passage to the next row.
+MAZE_JOIN_CHANCE = 0.5
+MAZE_DROP_CHANCE = 0.35
+
+
+def empty_walls(rows, cols, rng):
+    return np.zeros((rows, cols), dtype=bool)
+
+
+def random_walls(rows, cols, rng, density=DEFAULT_WALL_DENSITY):
+    return rng.random((rows, cols), dtype=np.float32) < density
+
+
+def spanning_tree_maze(rows, cols, rng):
+    """
+    Perfect maze on the odd-coordinate lattice, carved one lattice row at a
+    time in the manner of Eller's algorithm. Cells of a row that the rows
+    above already link share a set, labelled by its leftmost cell. A cell
+    only joins its left neighbor while it is the leftmost cell of its set,
+    which can never close a loop, so a row needs no union-find. Every set
+    then drops at least one passage to the next row, and the last row joins
+    whatever sets are left.
+    """
+    walls = np.ones((rows, cols), dtype=bool)
+    lattice_rows = (rows - 1) // 2
+    lattice_cols = (cols - 1) // 2
+    if lattice_rows <= 0 or lattice_cols <= 0:
+        return walls
+    walls[1:2 * lattice_rows:2, 1:2 * lattice_cols:2] = False
+
+    join_draws = rng.random((lattice_rows, lattice_cols - 1), dtype=np.float32) < MAZE_JOIN_CHANCE
+    drop_draws = rng.random((lattice_rows - 1, lattice_cols), dtype=np.float32)
+    cells = np.arange(lattice_cols)
+    labels = cells
+    no_draw = np.full(lattice_cols, 2, dtype=np.float32)
+    for lattice_row in range(lattice_rows):
+        is_last_row = lattice_row == lattice_rows - 1
+        joined = labels[1:] == cells[1:]
+        if not is_last_row:
+            joined &= join_draws[lattice_row]
+        walls[2 * lattice_row + 1, 2:2 * lattice_cols:2] = ~joined
+
+        # A joined set hangs under the set to its left, whose label is
+        # smaller, so pointer jumping ends on the leftmost set of each group.
+        parent = cells.copy()
+        parent[1:][joined] = labels[:-1][joined]
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+        labels = parent[labels]
+        if is_last_row:
+            break
+
+        # Besides the random drops, the cell with the lowest draw of each
+        # set always drops, so no set is cut off.
+        draws = drop_draws[lattice_row]
+        lowest_draws = no_draw.copy()
+        np.minimum.at(lowest_draws, labels, draws)
+        drops = (draws < MAZE_DROP_CHANCE) | (draws == lowest_draws[labels])
+        walls[2 * lattice_row + 2, 1:2 * lattice_cols:2] = ~drops
+
+        # Dropped cells keep their set and the rest start new ones; then
+        # every set is relabelled by its leftmost cell again.
+        next_labels = np.where(drops, labels, cells + lattice_cols)
+        leftmost_cells = np.full(2 * lattice_cols, lattice_cols, dtype=cells.dtype)
+        np.minimum.at(leftmost_cells, next_labels, cells)
+        labels = leftmost_cells[next_labels]
+    return walls
+
+
+def recursive_division(rows, cols, rng):
+    """
+    Classic recursive division, processed one whole depth level at a time:
+    every chamber of a level is split by the same vectorized pass.
+    """
+    # Walls are collected as runs, marked where they start and just past
+    # where they end: horizontal ones in a rows x (cols + 1) block of a
+    # flat buffer, vertical ones in a (rows + 1) x cols block after it.
+    row_block_size = rows * (cols + 1)
+    run_starts = []
+    run_ends = []
+    door_cells = []
+
+    # Chambers are interior rectangles; walls land on even and doors on odd
+    # coordinates. The rows of chambers are tops, lefts, heights and widths,
+    # so dropping finished chambers is a single pass.
+    chambers = np.array([[1], [1], [rows - 2], [cols - 2]], dtype=np.int32)
+
+    while chambers.shape[1]:
+        # A wall across a one-cell-wide chamber would be all door, so such
+        # chambers are finished.
+        heights, widths = chambers[2], chambers[3]
+        splittable = ((heights >= 3) & (widths >= 2)) | ((widths >= 3) & (heights >= 2))
+        chambers = chambers[:, splittable]
+        tops, lefts, heights, widths = chambers
+        chamber_count = len(tops)
+        if not chamber_count:
+            break
+        can_split_rows = (heights >= 3) & (widths >= 2)
+        can_split_cols = (widths >= 3) & (heights >= 2)
+
+        coin = rng.random(chamber_count, dtype=np.float32) < 0.5
+        horizontal = np.where(heights == widths, coin, heights > widths)
+        horizontal = (horizontal & can_split_rows) | ~can_split_cols
+
+        span = np.where(horizontal, heights, widths)
+        along = np.where(horizontal, widths, heights)
+        wall_offset = 1 + 2 * (rng.random(chamber_count, dtype=np.float32) * ((span - 1) // 2)).astype(np.int32)
+        door_offset = 2 * (rng.random(chamber_count, dtype=np.float32) * ((along + 1) // 2)).astype(np.int32)
+
+        wall_rows = tops + wall_offset
+        wall_cols = lefts + wall_offset
+        run_start = np.where(horizontal, wall_rows * (cols + 1) + lefts, row_block_size + tops * cols + wall_cols)
+        run_starts.append(run_start)
+        run_ends.append(run_start + along * np.where(horizontal, 1, cols))
+        door_cells.append(np.where(
+            horizontal, wall_rows * cols + lefts + door_offset, (tops + door_offset) * cols + wall_cols
+        ))
+
+        # The two halves on either side of the new wall.
+        halves = np.empty((4, 2 * chamber_count), dtype=np.int32)
+        first_halves, second_halves = halves[:, :chamber_count], halves[:, chamber_count:]
+        first_halves[:2] = chambers[:2]
+        first_halves[2] = np.where(horizontal, wall_offset, heights)
+        first_halves[3] = np.where(horizontal, widths, wall_offset)
+        second_halves[0] = np.where(horizontal, wall_rows + 1, tops)
+        second_halves[1] = np.where(horizontal, lefts, wall_cols + 1)
+        second_halves[2] = np.where(horizontal, heights - wall_offset - 1, heights)
+        second_halves[3] = np.where(horizontal, widths, widths - wall_offset - 1)
+        chambers = halves
+
+    # Runs on one line never touch, and a new wall only spans its own
+    # chamber, so no later wall covers an older door. A prefix sum along
+    # each direction draws every wall at once.
+    runs = np.zeros(row_block_size + (rows + 1) * cols, dtype=np.int8)
+    if run_starts:
+        runs[np.concatenate(run_starts)] = 1
+        runs[np.concatenate(run_ends)] = -1
+    row_runs = runs[:row_block_size].reshape(rows, cols + 1)
+    col_runs = runs[row_block_size:].reshape(rows + 1, cols)
+    np.cumsum(row_runs, axis=1, out=row_runs)
+    _accumulate_down(col_runs)
+
+    walls = row_runs[:, :cols] != 0
+    walls |= col_runs[:rows] != 0
+    walls[0, :] = walls[-1, :] = True
+    walls[:, 0] = walls[:, -1] = True
+    if door_cells:
+        walls.ravel()[np.concatenate(door_cells)] = False
+    return walls
+
+
+def rooms_and_corridors(rows, cols, rng, min_room=4, max_room=16):
+    """
+    Scatter rectangular rooms over solid rock and join consecutive rooms
+    (in a snake order through horizontal bands) with L-shaped corridors.
+    Rooms and corridors are all rectangles, carved with one summed-area pass.
+    """
+    if rows < 3 or cols < 3:
+        # No room fits inside a rock border, so the whole map is one room.
+        return empty_walls(rows, cols, rng)
+    max_room = max(min(max_room, rows - 2, cols - 2), 1)
+    min_room = min(min_room, max_room)
+    room_count = max(rows * cols // (max_room * max_room * 2), 1)
+
+    room_heights = rng.integers(min_room, max_room + 1, room_count)
+    room_widths = rng.integers(min_room, max_room + 1, room_count)
+    room_tops = 1 + (rng.random(room_count) * (rows - 1 - room_heights)).astype(np.int64)
+    room_lefts = 1 + (rng.random(room_count) * (cols - 1 - room_widths)).astype(np.int64)
+
+    center_rows = room_tops + room_heights // 2
+    center_cols = room_lefts + room_widths // 2
+    band = center_rows // (2 * max_room)
+    snake_cols = np.where(band % 2 == 0, center_cols, cols - center_cols)
+    order = np.lexsort((snake_cols, band))
+    center_rows, center_cols = center_rows[order], center_cols[order]
+
+    # Corridor legs: along the row of room i, then down the column of room i + 1.
+    from_rows, to_rows = center_rows[:-1], center_rows[1:]
+    from_cols, to_cols = center_cols[:-1], center_cols[1:]
+    corridor_tops = np.concatenate((from_rows, np.minimum(from_rows, to_rows)))
+    corridor_lefts = np.concatenate((np.minimum(from_cols, to_cols), to_cols))
+    corridor_bottoms = np.concatenate((from_rows + 1, np.maximum(from_rows, to_rows) + 1))
+    corridor_rights = np.concatenate((np.maximum(from_cols, to_cols) + 1, to_cols + 1))
+
+    tops = np.concatenate((room_tops, corridor_tops))
+    lefts = np.concatenate((room_lefts, corridor_lefts))
+    bottoms = np.concatenate((room_tops + room_heights, corridor_bottoms))
+    rights = np.concatenate((room_lefts + room_widths, corridor_rights))
+
+    # Corners go in through flat indices and both sums run in place, so
+    # no full-size temporary is allocated.
+    coverage = np.zeros((rows + 1, cols + 1), dtype=np.int32)
+    top_corners = tops * (cols + 1)
+    bottom_corners = bottoms * (cols + 1)
+    corners = np.concatenate((top_corners + lefts, top_corners + rights, bottom_corners + lefts, bottom_corners + rights))
+    signs = np.repeat(np.array([1, -1, -1, 1], dtype=np.int32), len(tops))
+    np.add.at(coverage.ravel(), corners, signs)
+    _accumulate_down(coverage)
+    np.cumsum(coverage, axis=1, out=coverage)
+    return coverage[:rows, :cols] <= 0
+
+
+def _accumulate_down(array):
+    # Prefix sum along axis 0 in place; adding whole rows is several times
+    # quicker than np.cumsum along that axis.
+    for row in range(1, len(array)):
+        np.add(array[row - 1], array[row], out=array[row])
+
+
+def uniform_weights(rows, cols, rng):
+    return rng.integers(1, MAX_WEIGHT + 1, (rows, cols), dtype=np.uint8)
+
+
+def noise_terrain(rows, cols, rng, octaves=TERRAIN_OCTAVES):
+    """
+    Value-noise terrain: octaves of bilinearly upsampled random lattices,
+    each twice as fine and half as strong, quantized to weights 1..5.
+    Upsampling is linear, so every octave becomes one block of a single
+    matrix product: height = sum(R_o @ L_o @ C_o.T).
+    """
+    row_blocks = []
+    col_blocks = []
+    # Maps under four cells across still get their coarsest octave.
+    lattice_step = max(max(rows, cols) / 4, 1)
+    amplitude = 1.0
+    for _ in range(octaves):
+        if lattice_step < 1:
+            break
+        lattice = rng.random((int(rows / lattice_step) + 2, int(cols / lattice_step) + 2), dtype=np.float32)
+        row_blocks.append(_interpolation_matrix(rows, lattice.shape[0], lattice_step) @ (amplitude * lattice))
+        col_blocks.append(_interpolation_matrix(cols, lattice.shape[1], lattice_step))
+        lattice_step /= 2
+        amplitude /= 2
+
+    height_field = np.hstack(row_blocks) @ np.hstack(col_blocks).T
+    low, high = height_field.min(), height_field.max()
+    height_field -= low
+    height_field *= MAX_WEIGHT / max(high - low, 1e-6)
+    weights = height_field.astype(np.uint8)
+    weights += 1
+    return np.minimum(weights, MAX_WEIGHT, out=weights)
+
+
+def _interpolation_matrix(length, lattice_length, lattice_step):
+    # Row i blends lattice points floor(i / step) and the one after it.
+    position = np.arange(length, dtype=np.float32) / np.float32(lattice_step)
+    index = position.astype(np.int64)
+    blend = position - index
+    matrix = np.zeros((length, lattice_length), dtype=np.float32)
+    matrix[np.arange(length), index] = 1 - blend
+    matrix[np.arange(length), index + 1] = blend
+    return matrix
+
+
+WALL_GENERATORS = {
+    "EMPTY": empty_walls,
+    "RANDOM": random_walls,
+    "MAZE": spanning_tree_maze,
+    "DIVISION": recursive_division,
+    "ROOMS": rooms_and_corridors,
+}
+
+WEIGHT_GENERATORS = {
+    "UNIFORM": uniform_weights,
+    "TERRAIN": noise_terrain,
+}
+
+
+def generate_layers(rows, cols, walls="RANDOM", weights="TERRAIN", seed=DEFAULT_SEED, wall_options=None):
+    """
+    (state bytes, weight bytes) for a fresh map. Walls and weights draw from
+    separate streams of the seed, so switching one keeps the other.
+    """
+    wall_rng = np.random.default_rng([seed, 0])
+    weight_rng = np.random.default_rng([seed, 1])
+    wall_flags = WALL_GENERATORS[walls](rows, cols, wall_rng, **(wall_options or {}))
+    weight_values = WEIGHT_GENERATORS[weights](rows, cols, weight_rng)
+    # EMPTY is 0, so scaling the flags gives the state buffer directly.
+    return (wall_flags.view(np.uint8) * np.uint8(WALL)).tobytes(), weight_values.tobytes()
+
+
+def neighbor_masks_of(wall_flags):
+    """
+    The neighbor masks GridModel.rebuild_adjacency gives a map with these
+    walls, built from shifted views of a padded array instead.
+    """
+    rows, cols = wall_flags.shape
+    padded_open = np.zeros((rows + 2, cols + 2), dtype=bool)
+    open_cells = padded_open[1:-1, 1:-1]
+    np.logical_not(wall_flags, out=open_cells)
+
+    def shifted(row_change, col_change):
+        return padded_open[1 + row_change:rows + 1 + row_change, 1 + col_change:cols + 1 + col_change]
+
+    masks = np.zeros((rows, cols), dtype=np.uint8)
+    for bit, (row_change, col_change) in enumerate(STRICT_MOVEMENT_ORDER):
+        legal = open_cells & shifted(row_change, col_change)
+        if row_change and col_change:
+            # Diagonals may not cut a corner.
+            legal &= shifted(row_change, 0)
+            legal &= shifted(0, col_change)
+        masks |= legal.view(np.uint8) << np.uint8(bit)
+    return masks.tobytes()
+
+
+def generate_grid(rows, cols, walls="RANDOM", weights="TERRAIN", seed=DEFAULT_SEED, wall_options=None):
+    state, weight_values = generate_layers(rows, cols, walls, weights, seed, wall_options)
+    wall_flags = np.frombuffer(state, dtype=np.uint8).reshape(rows, cols) == WALL
+    return GridModel(rows, cols, weights=weight_values, state=state, neighbor_masks=neighbor_masks_of(wall_flags))
+
+
+def main(argv=None):
+    from ai_path_finder.logic.map_io import save_grid
+
+    parser = argparse.ArgumentParser(description="Generate a seeded map and save it as a .pfmap.")
+    parser.add_argument("output_path")
+    parser.add_argument("--rows", type=int, default=1024)
+    parser.add_argument("--cols", type=int, default=None, help="defaults to --rows")
+    parser.add_argument("--walls", choices=list(WALL_GENERATORS), default="RANDOM")
+    parser.add_argument("--weights", choices=list(WEIGHT_GENERATORS), default="TERRAIN")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--density", type=float, default=DEFAULT_WALL_DENSITY, help="wall density for RANDOM")
+    args = parser.parse_args(argv)
+
+    wall_options = {"density": args.density} if args.walls == "RANDOM" else None
+    grid = generate_grid(args.rows, args.cols or args.rows, args.walls, args.weights, args.seed, wall_options)
+    save_grid(grid, args.output_path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""
+Map Files for the AI Pathfinder.
+Raw binary grid snapshots plus MovingAI .map/.scen import.
+"""
+import mmap
+import struct
+from collections import namedtuple
+
+from ai_path_finder.logic.grid_model import EMPTY, START, TARGET, WALL, GridModel
+
+MAP_MAGIC = b"PFMAP001"
+MAP_EXTENSION = ".pfmap"
+# magic, rows, cols, start cell, target cell (-1 when unset)
+_HEADER = struct.Struct("<8sIIqq")
+_SECTION_ALIGNMENT = 8
+
+# Search overlays are never saved; only walls and endpoints are structure.
+_STRUCTURE_TABLE = bytes([EMPTY, EMPTY, EMPTY, EMPTY]) + bytes(range(4, 256))
+
+# MovingAI terrain: '.', 'G' and 'S' (swamp) are passable, every other
+# character ('@', 'O', 'T', 'W', ...) blocks movement.
+MOVINGAI_PASSABLE = b".GS"
+_MOVINGAI_STATE_TABLE = bytes(EMPTY if bytes([value]) in MOVINGAI_PASSABLE else WALL for value in range(256))
+
+MovingAIScenario = namedtuple(
+    "MovingAIScenario",
+    "bucket map_name map_width map_height start_col start_row goal_col goal_row optimal_length",
+)
+
+
+def find_endpoints(grid):
+    """(start cell, target cell) of a grid, each None when not placed."""
+    start_cell = grid.state.find(START)
+    target_cell = grid.state.find(TARGET)
+    return (start_cell if start_cell >= 0 else None, target_cell if target_cell >= 0 else None)
+
+
+def save_grid(grid, path):
+    """
+    Write walls, weights, endpoints and adjacency as raw aligned sections,
+    so loading is a few buffer copies no matter how large the map is.
+    """
+    start_cell, target_cell = find_endpoints(grid)
+    header = _HEADER.pack(
+        MAP_MAGIC,
+        grid.rows,
+        grid.cols,
+        -1 if start_cell is None else start_cell,
+        -1 if target_cell is None else target_cell,
+    )
+    with open(path, "wb") as handle:
+        handle.write(header)
+        for section in (grid.state.translate(_STRUCTURE_TABLE), grid.weights, grid.neighbor_masks):
+            handle.write(bytes(-handle.tell() % _SECTION_ALIGNMENT))
+            handle.write(section)
+
+
+def load_grid(path):
+    with open(path, "rb") as handle:
+        backing_map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # Each section is copied straight out of the mapping into the grid.
+    whole_file = memoryview(backing_map)
+    sections = []
+    try:
+        magic, rows, cols, _, _ = _HEADER.unpack_from(backing_map)
+        if magic != MAP_MAGIC:
+            raise ValueError(f"{path} is not a pathfinder map")
+
+        size = rows * cols
+        offset = _HEADER.size
+        for _ in range(3):
+            offset += -offset % _SECTION_ALIGNMENT
+            if offset + size > len(backing_map):
+                raise ValueError(f"{path} is truncated")
+            sections.append(whole_file[offset:offset + size])
+            offset += size
+
+        state, weights, neighbor_masks = sections
+        return GridModel(rows, cols, weights=weights, state=state, neighbor_masks=neighbor_masks)
+    finally:
+        for view in (whole_file, *sections):
+            view.release()
+        backing_map.close()
+
+
+def load_movingai_map(path):
+    """
+    Import a MovingAI benchmark map. These maps are unweighted, so every
+    cell costs 1 to enter.
+    """
+    with open(path, "rb") as handle:
+        lines = handle.read().splitlines()
+
+    header = {}
+    line_index = 0
+    while line_index < len(lines):
+        line = lines[line_index].strip()
+        line_index += 1
+        if line == b"map":
+            break
+        if line:
+            key, _, value = line.partition(b" ")
+            header[key.decode("ascii")] = value.strip().decode("ascii")
+    else:
+        raise ValueError(f"{path} has no 'map' section")
+
+    rows = int(header["height"])
+    cols = int(header["width"])
+    map_lines = [line.rstrip(b"\r") for line in lines[line_index:line_index + rows]]
+    if len(map_lines) != rows or any(len(line) != cols for line in map_lines):
+        raise ValueError(f"{path} does not match its declared {cols}x{rows} size")
+
+    return GridModel(
+        rows,
+        cols,
+        weights=b"\x01" * (rows * cols),
+        state=b"".join(map_lines).translate(_MOVINGAI_STATE_TABLE),
+    )
+
+
+def load_movingai_scenarios(path):
+    scenarios = []
+    with open(path, "r", encoding="utf-8") as handle:
+        for line in handle:
+            fields = line.split()
+            if len(fields) < 9 or fields[0] == "version":
+                continue
+            # The map name may contain spaces, so fields are taken from both ends.
+            scenarios.append(MovingAIScenario(
+                int(fields[0]),
+                " ".join(fields[1:-7]),
+                int(fields[-7]),
+                int(fields[-6]),
+                int(fields[-5]),
+                int(fields[-4]),
+                int(fields[-3]),
+                int(fields[-2]),
+                float(fields[-1]),
+            ))
+    return scenarios
+
+
+def load_map(path):
+    """Open either a saved .pfmap or a MovingAI .map, by extension."""
+    if str(path).lower().endswith(MAP_EXTENSION):
+        return load_grid(path)
+    return load_movingai_map(path)
+
@@ -0,0 +1,95 @@
+"""
+Shortest-Path-Tree Cache for the AI Pathfinder.
+Answers repeated BFS/UCS queries on an unchanged map from earlier trees.
+"""
+from collections import OrderedDict
+
+from ai_path_finder.algorithms.metrics import SearchMetrics
+from ai_path_finder.algorithms.result import SearchResult
+
+# Solvers whose trees are shortest for every settled cell, not just the target.
+CACHEABLE_ALGORITHMS = frozenset({"BFS", "UCS"})
+
+# A 2000x2000 tree takes 20 MB (int32 parents plus a settled byte per cell).
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class PathTreeCache:
+    """
+    Trees are keyed on (map_id, map_version, algorithm, source) and kept in
+    least-recently-used order under max_bytes. A query (start, target) is
+    answered from the tree rooted at start, or from the one rooted at
+    target walked backwards. Any wall or weight edit gives the grid a new
+    map_version, so older trees stop matching; they are dropped the next
+    time that map is queried.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.trees = OrderedDict()
+        self.total_bytes = 0
+        self.latest_versions = {}
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, grid, algorithm, start_cell, target_cell):
+        """A SearchResult built from a cached tree, or None on a miss."""
+        self._drop_stale(grid)
+        for source, cell in ((start_cell, target_cell), (target_cell, start_cell)):
+            key = (grid.map_id, grid.map_version, algorithm, source)
+            tree = self.trees.get(key)
+            if tree is None:
+                continue
+            if tree.settled[cell]:
+                path = tree.path_to(cell)
+                if source == target_cell:
+                    path.reverse()
+                result = SearchResult.from_path(grid, path, SearchMetrics())
+            elif tree.is_complete:
+                # The whole component was settled without reaching cell.
+                result = SearchResult.not_found(SearchMetrics())
+            else:
+                continue
+            self.trees.move_to_end(key)
+            self.hits += 1
+            return result
+        self.misses += 1
+        return None
+
+    def store(self, grid, algorithm, tree):
+        """Keep tree for grid as it is now; replaces any tree from the same source."""
+        if algorithm not in CACHEABLE_ALGORITHMS or tree.nbytes > self.max_bytes:
+            return
+        self._drop_stale(grid)
+        key = (grid.map_id, grid.map_version, algorithm, tree.source)
+        self._discard(key)
+        self.trees[key] = tree
+        self.total_bytes += tree.nbytes
+        while self.total_bytes > self.max_bytes:
+            self._discard(next(iter(self.trees)))
+
+    def clear(self):
+        self.trees.clear()
+        self.total_bytes = 0
+        self.latest_versions.clear()
+
+    def _drop_stale(self, grid):
+        if self.latest_versions.get(grid.map_id) == grid.map_version:
+            return
+        self.latest_versions[grid.map_id] = grid.map_version
+        stale_keys = [key for key in self.trees if key[0] == grid.map_id and key[1] != grid.map_version]
+        for key in stale_keys:
+            self._discard(key)
+
+    def _discard(self, key):
+        tree = self.trees.pop(key, None)
+        if tree is not None:
+            self.total_bytes -= tree.nbytes
+
+
+def replay_cached_path(grid, result):
+    """Solver-shaped generator that draws a cached answer one cell per step."""
+    for cell in result.path[1:-1]:
+        grid.mark_path(cell)
+        yield True
+    return result
@@ -0,0 +1,38 @@
+"""
+Pathfinding Library Call for the AI Pathfinder.
+Runs any registered solver to completion without touching the caller's grid.
+"""
+from ai_path_finder.algorithms.metrics import SearchMetrics
+from ai_path_finder.algorithms.result import run_to_completion
+from ai_path_finder.logic.path_cache import CACHEABLE_ALGORITHMS
+from ai_path_finder.logic.simulation_manager import SOLVERS
+
+
+def find_path(grid, start_cell, target_cell, algorithm="A*", metrics=None, cache=None, landmarks=None, **options):
+    """
+    Search a fork of grid, so its cells, endpoints and dirty tracking are
+    left alone, and return the solver's SearchResult. options are passed to
+    the solver as-is, e.g. epsilon for "WEIGHTED A*" or limit for "DLS".
+
+    With a PathTreeCache, BFS and UCS queries are first answered from trees
+    of earlier queries on the same map version, and new trees are kept.
+    With a LandmarkTable that still matches grid, the A* family uses its
+    landmark bounds as the heuristic.
+    """
+    if algorithm not in SOLVERS:
+        raise ValueError(f"unknown algorithm {algorithm!r}; expected one of {', '.join(SOLVERS)}")
+    use_cache = cache is not None and algorithm in CACHEABLE_ALGORITHMS
+    if use_cache:
+        cached_result = cache.lookup(grid, algorithm, start_cell, target_cell)
+        if cached_result is not None:
+            return cached_result
+
+    if landmarks is not None:
+        options = {**landmarks.solver_options(algorithm, grid, start_cell, target_cell), **options}
+    if metrics is None:
+        metrics = SearchMetrics()
+    search_grid = grid.fork()
+    result = run_to_completion(SOLVERS[algorithm](search_grid, start_cell, target_cell, metrics=metrics, **options))
+    if use_cache and result.tree is not None:
+        cache.store(grid, algorithm, result.tree)
+    return result
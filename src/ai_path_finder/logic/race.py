@@ -0,0 +1,78 @@
+"""
+Race Mode for the AI Pathfinder.
+Every registered solver searches its own fork of one grid, interleaved.
+"""
+import time
+
+from ai_path_finder.algorithms.metrics import SearchMetrics
+
+
+class RaceLane:
+    def __init__(self, algorithm_name, grid, solver_generator, metrics, start_cell, target_cell):
+        self.algorithm_name = algorithm_name
+        self.grid = grid
+        self.solver_generator = solver_generator
+        self.metrics = metrics
+        self.start_cell = start_cell
+        self.target_cell = target_cell
+
+        self.solver_time = 0.0
+        self.is_finished = False
+        self.result = None
+
+    def step(self):
+        started = time.perf_counter()
+        try:
+            next(self.solver_generator)
+        except StopIteration as stop:
+            self.is_finished = True
+            self.solver_generator = None
+            self.result = stop.value
+        self.solver_time += time.perf_counter() - started
+        return not self.is_finished
+
+    @property
+    def found(self):
+        return self.result is not None and self.result.found
+
+    @property
+    def path_cost(self):
+        return self.result.cost if self.found else None
+
+
+class SearchRace:
+    """
+    Advances all lanes round-robin, one solver step each per round, so
+    every algorithm gets the same share of the interpreter.
+    """
+
+    def __init__(self, grid, start_cell, target_cell, algorithm_map, algorithm_options=None):
+        algorithm_options = algorithm_options or {}
+        self.lanes = []
+        for algorithm_name, solver_function in algorithm_map.items():
+            lane_grid = grid.fork()
+            metrics = SearchMetrics()
+            solver_generator = solver_function(
+                lane_grid,
+                start_cell,
+                target_cell,
+                metrics=metrics,
+                **algorithm_options.get(algorithm_name, {}),
+            )
+            self.lanes.append(RaceLane(algorithm_name, lane_grid, solver_generator, metrics, start_cell, target_cell))
+
+    @property
+    def is_finished(self):
+        return all(lane.is_finished for lane in self.lanes)
+
+    @property
+    def grids(self):
+        return [lane.grid for lane in self.lanes]
+
+    def step_round(self):
+        """One step for every unfinished lane; returns whether any is left."""
+        any_running = False
+        for lane in self.lanes:
+            if not lane.is_finished and lane.step():
+                any_running = True
+        return any_running
@@ -0,0 +1,94 @@
+"""
+Run Metrics for the AI Pathfinder.
+Counters, timings, memory and path stats for one interactive search.
+"""
+import json
+import time
+import tracemalloc
+
+from ai_path_finder.algorithms.metrics import SearchMetrics
+
+
+class RunMetrics:
+    """
+    solver_time only counts time spent inside the solver generator and
+    render_time the frames drawn while the run was live. wall_time covers
+    everything from start to finish, step delays included, so it is the
+    number the old duration reported.
+
+    With track_memory, tracemalloc follows the run and peak_memory_bytes is
+    the highest Python heap growth above where the run started. It slows
+    allocation down noticeably, so it is off unless asked for.
+    """
+
+    def __init__(self, algorithm_name, grid, start_cell, target_cell, options=None, track_memory=False):
+        self.algorithm_name = algorithm_name
+        self.rows = grid.rows
+        self.cols = grid.cols
+        self.start_cell = start_cell
+        self.target_cell = target_cell
+        self.options = dict(options or {})
+        self.search = SearchMetrics()
+
+        self.steps = 0
+        self.solver_time = 0.0
+        self.render_time = 0.0
+        self.wall_time = 0.0
+        self.started = time.perf_counter()
+        self.is_live = True
+
+        self.found = None
+        self.path_length = None
+        self.path_cost = None
+
+        # Someone else (a profiler, the benchmark) may already be tracing.
+        self.is_tracking_memory = track_memory and not tracemalloc.is_tracing()
+        self.peak_memory_bytes = None
+        if self.is_tracking_memory:
+            tracemalloc.start()
+            self.memory_baseline = tracemalloc.get_traced_memory()[0]
+
+    def finish(self, result):
+        self.is_live = False
+        self.wall_time = time.perf_counter() - self.started
+        if self.is_tracking_memory:
+            _, peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.is_tracking_memory = False
+            self.peak_memory_bytes = max(peak_memory - self.memory_baseline, 0)
+        self.record_result(result)
+
+    def elapsed_time(self):
+        return time.perf_counter() - self.started if self.is_live else self.wall_time
+
+    def record_result(self, result):
+        # A run stopped before its solver returned has no result.
+        if result is not None:
+            self.found = result.found
+            self.path_length = result.path_length
+            self.path_cost = result.cost
+
+    def to_dict(self):
+        search = self.search
+        return {
+            "algorithm": self.algorithm_name,
+            "options": self.options,
+            "rows": self.rows,
+            "cols": self.cols,
+            "start_cell": self.start_cell,
+            "target_cell": self.target_cell,
+            "found": self.found,
+            "path_length": self.path_length,
+            "path_cost": self.path_cost,
+            **search.to_dict(),
+            "steps": self.steps,
+            "expansions_per_sec": search.nodes_expanded / self.solver_time if self.solver_time > 0 else None,
+            "solver_time_s": self.solver_time,
+            "render_time_s": self.render_time,
+            "wall_time_s": self.wall_time,
+            "peak_memory_bytes": self.peak_memory_bytes,
+        }
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.to_dict(), handle, indent=2)
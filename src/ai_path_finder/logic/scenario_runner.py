@@ -0,0 +1,232 @@
+"""
+Scenario Suite Runner for the AI Pathfinder.
+Runs MovingAI .scen queries against one map with any registered solver.
+"""
+import argparse
+import csv
+import functools
+import json
+import sys
+
+from ai_path_finder.algorithms.hpastar import ClusterGraph
+from ai_path_finder.logic.benchmark import DEFAULT_MAX_EXPANSIONS, run_case
+from ai_path_finder.logic.grid_model import WALL
+from ai_path_finder.logic.map_io import (
+    find_endpoints,
+    load_map,
+    load_movingai_scenarios,
+    save_grid,
+)
+from ai_path_finder.logic.simulation_manager import SimulationManager
+
+QUERY_FIELDS = (
+    "query",
+    "bucket",
+    "algorithm",
+    "start_row",
+    "start_col",
+    "target_row",
+    "target_col",
+    "reference_length",
+    "found",
+    "truncated",
+    "nodes_expanded",
+    "nodes_pushed",
+    "nodes_reopened",
+    "peak_frontier",
+    "expansions_per_sec",
+    "wall_time_s",
+    "path_length",
+    "path_cost",
+)
+
+
+def select_scenarios(scenarios, buckets=None, limit=None):
+    if buckets:
+        scenarios = [scenario for scenario in scenarios if scenario.bucket in buckets]
+    return scenarios[:limit] if limit else scenarios
+
+
+def run_scenarios(grid, scenarios, algorithms=None, max_expansions=DEFAULT_MAX_EXPANSIONS, progress=None):
+    """
+    One record per (query, algorithm). Queries whose endpoints fall on a
+    wall or coincide are skipped, as the solvers expect distinct open cells.
+    """
+    algorithm_map = SimulationManager().algorithm_map
+    selected = algorithms or list(algorithm_map)
+    results = []
+    skipped = 0
+
+    # HPA* builds its cluster graph once for the map, during the first query.
+    if "HPA*" in selected:
+        algorithm_map["HPA*"] = functools.partial(algorithm_map["HPA*"], hierarchy=ClusterGraph(grid))
+
+    # Endpoints already on the map are cleared so each query places its own.
+    for cell in find_endpoints(grid):
+        if cell is not None:
+            grid.reset_cell(cell)
+
+    for query_index, scenario in enumerate(scenarios):
+        if (scenario.map_width, scenario.map_height) != (grid.cols, grid.rows):
+            raise ValueError(
+                f"scenario {query_index} expects a {scenario.map_width}x{scenario.map_height} map, "
+                f"not {grid.cols}x{grid.rows}"
+            )
+        start_cell = grid.cell_id(scenario.start_row, scenario.start_col)
+        target_cell = grid.cell_id(scenario.goal_row, scenario.goal_col)
+        if start_cell == target_cell or grid.state[start_cell] == WALL or grid.state[target_cell] == WALL:
+            skipped += 1
+            continue
+
+        grid.set_start(start_cell)
+        grid.set_target(target_cell)
+        for algorithm_name in selected:
+            record = run_case(
+                algorithm_name,
+                algorithm_map[algorithm_name],
+                grid,
+                start_cell,
+                target_cell,
+                max_expansions,
+                measure_memory=False,
+            )
+            record.update(
+                query=query_index,
+                bucket=scenario.bucket,
+                start_row=scenario.start_row,
+                start_col=scenario.start_col,
+                target_row=scenario.goal_row,
+                target_col=scenario.goal_col,
+                reference_length=scenario.optimal_length,
+            )
+            results.append(record)
+            if progress:
+                progress(record)
+        grid.reset_cell(start_cell)
+        grid.reset_cell(target_cell)
+
+    grid.clear_search_marks()
+    return results, skipped
+
+
+def summarize(results):
+    """
+    Aggregate stats per algorithm. cost_ratio compares each found path with
+    the cheapest one any selected solver found for the same query.
+    """
+    best_cost = {}
+    for record in results:
+        if record["found"]:
+            query = record["query"]
+            best_cost[query] = min(best_cost.get(query, record["path_cost"]), record["path_cost"])
+
+    summaries = {}
+    for record in results:
+        summary = summaries.setdefault(record["algorithm"], {
+            "algorithm": record["algorithm"],
+            "queries": 0,
+            "solved": 0,
+            "truncated": 0,
+            "optimal": 0,
+            "nodes_expanded": 0,
+            "wall_time_s": 0.0,
+            "cost_ratio_sum": 0.0,
+        })
+        summary["queries"] += 1
+        summary["truncated"] += record["truncated"]
+        summary["nodes_expanded"] += record["nodes_expanded"]
+        summary["wall_time_s"] += record["wall_time_s"]
+        if record["found"]:
+            summary["solved"] += 1
+            summary["optimal"] += record["path_cost"] == best_cost[record["query"]]
+            summary["cost_ratio_sum"] += record["path_cost"] / best_cost[record["query"]]
+
+    for summary in summaries.values():
+        cost_ratio_sum = summary.pop("cost_ratio_sum")
+        summary["mean_cost_ratio"] = cost_ratio_sum / summary["solved"] if summary["solved"] else None
+        summary["mean_nodes_expanded"] = summary["nodes_expanded"] / summary["queries"]
+        summary["mean_time_ms"] = summary["wall_time_s"] * 1000 / summary["queries"]
+        summary["expansions_per_sec"] = (
+            summary["nodes_expanded"] / summary["wall_time_s"] if summary["wall_time_s"] > 0 else None
+        )
+    return list(summaries.values())
+
+
+def write_json(results, summaries, path):
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump({"summary": summaries, "queries": results}, handle, indent=2)
+
+
+def write_csv(results, path):
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=QUERY_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def _print_record(record):
+    print(
+        f"#{record['query']:<6} b{record['bucket']:<3} {record['algorithm']:<14} "
+        f"expanded={record['nodes_expanded']:<9} time={record['wall_time_s']:.4f}s "
+        f"path={record['path_length']} cost={record['path_cost']} ref={record['reference_length']:.2f}"
+        f"{' (truncated)' if record['truncated'] else ''}",
+        flush=True,
+    )
+
+
+def _print_summary(summaries, skipped):
+    print(f"{'ALGORITHM':<14} {'SOLVED':>13} {'OPTIMAL':>8} {'COST RATIO':>10} "
+          f"{'MEAN EXPANDED':>14} {'MEAN MS':>9} {'RATE/S':>12}")
+    for summary in summaries:
+        ratio = summary["mean_cost_ratio"]
+        print(
+            f"{summary['algorithm']:<14} {summary['solved']:>6}/{summary['queries']:<6} "
+            f"{summary['optimal']:>8} {(ratio or 0):>10.4f} {summary['mean_nodes_expanded']:>14,.0f} "
+            f"{summary['mean_time_ms']:>9.2f} {(summary['expansions_per_sec'] or 0):>12,.0f}"
+        )
+    if skipped:
+        print(f"skipped {skipped} queries with blocked or identical endpoints")
+
+
+def main(argv=None):
+    algorithm_names = list(SimulationManager().algorithm_map)
+
+    parser = argparse.ArgumentParser(description="Run a MovingAI scenario file against one map.")
+    parser.add_argument("map_path", help="MovingAI .map or saved .pfmap")
+    parser.add_argument("scenario_path", nargs="?", help="MovingAI .scen file")
+    parser.add_argument("--algorithms", nargs="+", choices=algorithm_names, default=None)
+    parser.add_argument("--buckets", type=int, nargs="+", help="only run these scenario buckets")
+    parser.add_argument("--limit", type=int, help="run at most this many queries")
+    parser.add_argument("--max-expansions", type=int, default=DEFAULT_MAX_EXPANSIONS)
+    parser.add_argument("--verbose", action="store_true", help="print every query")
+    parser.add_argument("--save-map", help="also write the loaded map as a .pfmap")
+    parser.add_argument("--json", dest="json_path", help="write summary and queries as JSON")
+    parser.add_argument("--csv", dest="csv_path", help="write per-query results as CSV")
+    args = parser.parse_args(argv)
+
+    grid = load_map(args.map_path)
+    if args.save_map:
+        save_grid(grid, args.save_map)
+    if not args.scenario_path:
+        return 0
+
+    scenarios = select_scenarios(load_movingai_scenarios(args.scenario_path), args.buckets, args.limit)
+    results, skipped = run_scenarios(
+        grid,
+        scenarios,
+        algorithms=args.algorithms,
+        max_expansions=args.max_expansions,
+        progress=_print_record if args.verbose else None,
+    )
+    summaries = summarize(results)
+    _print_summary(summaries, skipped)
+
+    if args.json_path:
+        write_json(results, summaries, args.json_path)
+    if args.csv_path:
+        write_csv(results, args.csv_path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""
+Search Trace Recording and Replay.
+Typed-array event stream with keyframes; saved files load through mmap.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+
+from ai_path_finder.logic.grid_model import GridModel
+
+# Each event packs (cell << 2) | state, with state one of EMPTY, FRONTIER,
+# EXPLORED or PATH, so an event fits one unsigned 32-bit slot.
+EVENT_STATE_MASK = 0b11
+EVENT_CELL_SHIFT = 2
+
+# A keyframe is taken once this many events (at least) have passed, so
+# seeking replays a bounded number of events from the nearest snapshot.
+MIN_KEYFRAME_EVENTS = 4096
+
+TRACE_MAGIC = b"PFTRACE1"
+# magic, rows, cols, step count, event count, keyframe count, algorithm name
+_HEADER = struct.Struct("<8sIIQQQ32s")
+_SECTION_ALIGNMENT = 8
+
+
+class SearchTrace:
+    """
+    Compact record of one search. steps[i] is where step i starts in
+    events, so the events of steps a..b-1 are events[steps[a]:steps[b]].
+    """
+
+    def __init__(self, rows, cols, weights, base_state, algorithm_name=""):
+        self.rows = rows
+        self.cols = cols
+        self.size = rows * cols
+        self.weights = weights
+        self.base_state = base_state
+        self.algorithm_name = algorithm_name
+
+        self.events = array("I")
+        self.steps = array("Q", [0])
+        self.keyframe_steps = array("Q")
+        self.keyframe_states = bytearray()
+        self.keyframe_interval = max(self.size // 4, MIN_KEYFRAME_EVENTS)
+
+        self.recording_grid = None
+        self.last_keyframe_event = 0
+        self.backing_map = None
+
+    @classmethod
+    def from_grid(cls, grid, algorithm_name=""):
+        return cls(grid.rows, grid.cols, bytes(grid.weights), bytes(grid.state), algorithm_name)
+
+    @property
+    def step_count(self):
+        return len(self.steps) - 1
+
+    def attach(self, grid):
+        """Start appending grid's overlay changes to this trace."""
+        self.recording_grid = grid
+        grid.trace_events = self.events
+
+    def end_step(self):
+        self.steps.append(len(self.events))
+        self._take_keyframe_if_due()
+
+    def end_steps(self, step_sizes):
+        """end_step for several steps whose events were appended at once."""
+        steps = self.steps
+        for step_size in step_sizes:
+            steps.append(steps[-1] + step_size)
+        self._take_keyframe_if_due()
+
+    def _take_keyframe_if_due(self):
+        if len(self.events) - self.last_keyframe_event >= self.keyframe_interval:
+            self.last_keyframe_event = len(self.events)
+            self.keyframe_steps.append(self.step_count)
+            self.keyframe_states += self.recording_grid.state
+
+    def detach(self):
+        # Changes made after the last yield still form a final step.
+        if len(self.events) > self.steps[-1]:
+            self.steps.append(len(self.events))
+        if self.recording_grid is not None:
+            self.recording_grid.trace_events = None
+            self.recording_grid = None
+
+    def state_at(self, step):
+        """Cell states after the first `step` steps, rebuilt from a keyframe."""
+        step = min(max(step, 0), self.step_count)
+        keyframe_index = bisect_right(self.keyframe_steps, step) - 1
+        if keyframe_index >= 0:
+            snapshot_start = keyframe_index * self.size
+            state = bytearray(self.keyframe_states[snapshot_start:snapshot_start + self.size])
+            replay_from = self.keyframe_steps[keyframe_index]
+        else:
+            state = bytearray(self.base_state)
+            replay_from = 0
+
+        for event in self.events[self.steps[replay_from]:self.steps[step]]:
+            state[event >> EVENT_CELL_SHIFT] = event & EVENT_STATE_MASK
+        return state
+
+    def build_grid(self):
+        """Fresh grid with the walls, weights and endpoints of the recording."""
+        return GridModel(self.rows, self.cols, weights=self.weights, state=self.base_state)
+
+    def save(self, path):
+        events, steps, keyframe_steps = self.events, self.steps, self.keyframe_steps
+        if sys.byteorder != "little":
+            events, steps, keyframe_steps = array("I", events), array("Q", steps), array("Q", keyframe_steps)
+            for section in (events, steps, keyframe_steps):
+                section.byteswap()
+
+        header = _HEADER.pack(
+            TRACE_MAGIC,
+            self.rows,
+            self.cols,
+            self.step_count,
+            len(events),
+            len(keyframe_steps),
+            self.algorithm_name.encode("utf-8")[:32],
+        )
+        with open(path, "wb") as handle:
+            handle.write(header)
+            for section in (
+                self.weights,
+                self.base_state,
+                events,
+                steps,
+                keyframe_steps,
+                self.keyframe_states,
+            ):
+                handle.write(section)
+                handle.write(bytes(-handle.tell() % _SECTION_ALIGNMENT))
+
+    def close(self):
+        if self.backing_map is not None:
+            for view in (self.events, self.steps, self.keyframe_steps, self.keyframe_states):
+                view.release()
+            self.backing_map.close()
+            self.backing_map = None
+
+
+def load_trace(path):
+    """
+    Open a saved trace. On little-endian machines the event, step and
+    keyframe sections are zero-copy views into a read-only memory map.
+    """
+    with open(path, "rb") as handle:
+        backing_map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, rows, cols, step_count, event_count, keyframe_count, raw_name = _HEADER.unpack_from(backing_map)
+    if magic != TRACE_MAGIC:
+        backing_map.close()
+        raise ValueError(f"{path} is not a search trace")
+
+    size = rows * cols
+    section_lengths = (size, size, 4 * event_count, 8 * (step_count + 1), 8 * keyframe_count, size * keyframe_count)
+    sections = []
+    offset = _HEADER.size + (-_HEADER.size % _SECTION_ALIGNMENT)
+    whole_file = memoryview(backing_map)
+    for length in section_lengths:
+        sections.append(whole_file[offset:offset + length])
+        offset += length + (-length % _SECTION_ALIGNMENT)
+    weights, base_state, events, steps, keyframe_steps, keyframe_states = sections
+
+    trace = SearchTrace(rows, cols, bytes(weights), bytes(base_state), raw_name.rstrip(b"\0").decode("utf-8"))
+    if sys.byteorder == "little":
+        trace.events = events.cast("I")
+        trace.steps = steps.cast("Q")
+        trace.keyframe_steps = keyframe_steps.cast("Q")
+        trace.keyframe_states = keyframe_states
+        trace.backing_map = backing_map
+        transient_views = (whole_file, weights, base_state, events, steps, keyframe_steps)
+    else:
+        trace.events = array("I", events.tobytes())
+        trace.steps = array("Q", steps.tobytes())
+        trace.keyframe_steps = array("Q", keyframe_steps.tobytes())
+        for section in (trace.events, trace.steps, trace.keyframe_steps):
+            section.byteswap()
+        trace.keyframe_states = keyframe_states.tobytes()
+        transient_views = (whole_file, *sections)
+
+    # The mapping can only close once no view into it is left alive.
+    for view in transient_views:
+        view.release()
+    if trace.backing_map is None:
+        backing_map.close()
+    return trace
+
+
+class TracePlayer:
+    """Drives a grid through a trace, one recorded step per yield."""
+
+    def __init__(self, trace, grid, position=0):
+        # position is the number of steps already applied to grid.
+        self.trace = trace
+        self.grid = grid
+        self.position = position
+        self.mark_for_state = (self._clear_cell, grid.mark_frontier, grid.mark_explored, grid.mark_path)
+
+    @property
+    def at_end(self):
+        return self.position >= self.trace.step_count
+
+    def seek(self, step):
+        step = min(max(step, 0), self.trace.step_count)
+        self.grid.load_overlay(self.trace.state_at(step))
+        self.position = step
+
+    def play(self):
+        events = self.trace.events
+        steps = self.trace.steps
+        mark_for_state = self.mark_for_state
+        while self.position < self.trace.step_count:
+            for event in events[steps[self.position]:steps[self.position + 1]]:
+                mark_for_state[event & EVENT_STATE_MASK](event >> EVENT_CELL_SHIFT)
+            self.position += 1
+            yield True
+
+    def _clear_cell(self, cell):
+        self.grid.clear_marks((cell,))
@@ -0,0 +1,160 @@
+"""
+Background Search Worker for the AI Pathfinder.
+Runs a solver on a grid fork in its own thread and streams the changes back.
+"""
+import queue
+import threading
+import time
+from array import array
+
+# Solver steps are shipped in batches so the queue's locking is paid once per
+# batch; a batch also goes out once it is this old, so a slow solver still
+# shows progress.
+DELTA_BATCH_STEPS = 64
+DELTA_BATCH_SECONDS = 0.005
+
+# At most this many batches wait for the screen; a worker that gets this
+# far ahead blocks until the UI catches up.
+DELTA_QUEUE_BATCHES = 64
+
+# How often a blocked worker checks whether it was cancelled.
+CANCEL_POLL_SECONDS = 0.02
+CANCEL_JOIN_SECONDS = 1.0
+
+
+class DeltaBatch:
+    """
+    Overlay events of consecutive solver steps, packed like SearchTrace
+    events; step_ends[i] is where step i ends in events. The last batch
+    of a run is final and carries the SearchResult (or the exception the
+    solver raised, traceback included); its events past the last step end
+    are the changes made after the solver's final yield.
+    """
+
+    __slots__ = ("error", "events", "is_final", "result", "step_ends")
+
+    def __init__(self, events, step_ends, is_final=False, result=None, error=None):
+        self.events = events
+        self.step_ends = step_ends
+        self.is_final = is_final
+        self.result = result
+        self.error = error
+
+
+class SearchWorker:
+    """
+    The solver runs against search_grid, a fork of grid, in a daemon
+    thread, so a slow step never holds up a frame. take_steps() replays
+    solver steps onto grid with apply_events, which keeps dirty tracking
+    and trace recording working as if the solver ran in place.
+
+    solver_time is measured in the worker and also counts the moments
+    the UI thread held the interpreter during a step.
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.search_grid = grid.fork()
+        self.deltas = queue.Queue(maxsize=DELTA_QUEUE_BATCHES)
+        self.cancel_requested = threading.Event()
+        self.thread = None
+
+        self.solver_time = 0.0
+        self.is_finished = False
+        self.result = None
+
+        self.batch = None
+        self.step_index = 0
+        self.event_index = 0
+
+    def start(self, search_generator):
+        """Run search_generator, which must search search_grid, in the background."""
+        self.thread = threading.Thread(target=self._run, args=(search_generator,), daemon=True)
+        self.thread.start()
+
+    def cancel(self):
+        """Stop the solver at its next step and wait briefly for the thread."""
+        self.cancel_requested.set()
+        if self.thread is not None:
+            self.thread.join(CANCEL_JOIN_SECONDS)
+
+    def take_steps(self, max_steps):
+        """
+        Apply up to max_steps solver steps to grid with one apply_events
+        call and return how many events each of them had; the list is
+        empty when the worker has not produced a step yet. The changes
+        made after the solver's last yield are applied on a call of their
+        own, which then sets is_finished and result. If the solver raised,
+        that call raises a RuntimeError chained to the solver's exception.
+        """
+        if self.is_finished:
+            return []
+        batch = self.batch
+        if batch is None or (self.step_index >= len(batch.step_ends) and not batch.is_final):
+            try:
+                batch = self.deltas.get_nowait()
+            except queue.Empty:
+                return []
+            self.batch = batch
+            self.step_index = 0
+            self.event_index = 0
+
+        first_event = self.event_index
+        step_ends = batch.step_ends
+        if self.step_index < len(step_ends):
+            last_step = min(self.step_index + max_steps, len(step_ends))
+            step_sizes = []
+            for step_end in step_ends[self.step_index:last_step]:
+                step_sizes.append(step_end - self.event_index)
+                self.event_index = step_end
+            self.step_index = last_step
+        else:
+            if batch.error is not None:
+                raise RuntimeError("search worker failed") from batch.error
+            step_sizes = []
+            self.event_index = len(batch.events)
+            self.is_finished = True
+            self.result = batch.result
+
+        self.grid.apply_events(batch.events[first_event:self.event_index])
+        return step_sizes
+
+    def _run(self, search_generator):
+        search_grid = self.search_grid
+        events = search_grid.trace_events = array("I")
+        step_ends = array("Q")
+        batch_started = time.perf_counter()
+        try:
+            while not self.cancel_requested.is_set():
+                step_started = time.perf_counter()
+                try:
+                    next(search_generator)
+                except StopIteration as stop:
+                    self.solver_time += time.perf_counter() - step_started
+                    self._publish(DeltaBatch(events, step_ends, True, stop.value))
+                    return
+                step_finished = time.perf_counter()
+                self.solver_time += step_finished - step_started
+                step_ends.append(len(events))
+
+                if len(step_ends) >= DELTA_BATCH_STEPS or step_finished - batch_started >= DELTA_BATCH_SECONDS:
+                    if not self._publish(DeltaBatch(events, step_ends)):
+                        return
+                    events = search_grid.trace_events = array("I")
+                    step_ends = array("Q")
+                    batch_started = time.perf_counter()
+        except Exception as error:
+            # Whatever the solver raised must reach the UI thread instead
+            # of silently ending this one; take_steps re-raises it there.
+            self._publish(DeltaBatch(events, step_ends, True, error=error))
+        finally:
+            search_generator.close()
+
+    def _publish(self, batch):
+        while not self.cancel_requested.is_set():
+            try:
+                self.deltas.put(batch, timeout=CANCEL_POLL_SECONDS)
+                return True
+            except queue.Full:
+                pass
+        return False
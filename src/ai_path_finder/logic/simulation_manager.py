@@ -0,0 +1,540 @@
+"""
+Logic Manager for the AI Pathfinder.
+Bridges UI and Algorithms.
+"""
+import time
+from ai_path_finder.algorithms.astar import DEFAULT_EPSILON, run_astar, run_greedy_best_first, run_weighted_astar
+from ai_path_finder.algorithms.bfs import run_bfs
+from ai_path_finder.algorithms.bidirectional import run_bidirectional, run_bidirectional_astar, run_bidirectional_dijkstra
+from ai_path_finder.algorithms.dfs import run_dfs
+from ai_path_finder.algorithms.dls import run_dls
+from ai_path_finder.algorithms.hpastar import ClusterGraph, run_hpastar
+from ai_path_finder.algorithms.iddfs import run_iddfs
+from ai_path_finder.algorithms.lpastar import LifelongPlanner, run_lpastar
+from ai_path_finder.algorithms.result import run_for, run_to_completion
+from ai_path_finder.algorithms.ucs import run_ucs
+from ai_path_finder.logic.landmarks import LANDMARK_ALGORITHMS
+from ai_path_finder.logic.path_cache import CACHEABLE_ALGORITHMS, PathTreeCache, replay_cached_path
+from ai_path_finder.logic.race import SearchRace
+from ai_path_finder.logic.run_metrics import RunMetrics
+from ai_path_finder.logic.search_trace import SearchTrace, TracePlayer
+from ai_path_finder.logic.search_worker import DELTA_BATCH_STEPS, SearchWorker
+
+# PACED: one step per step_delay. BUDGET: as many steps as fit in
+# frame_budget seconds. STEPS: steps_per_frame steps. INSTANT: run to the
+# end with grid marking deferred until the search completes.
+STEP_MODES = ("PACED", "BUDGET", "STEPS", "INSTANT")
+
+DEFAULT_STEP_DELAY = 0.05
+DEFAULT_FRAME_BUDGET = 0.008
+DEFAULT_STEPS_PER_FRAME = 16
+
+# INSTANT mode still yields to the event loop after this many seconds.
+INSTANT_SLICE_SECONDS = 0.25
+# With a worker thread the solver runs elsewhere, so INSTANT only spends
+# about a frame applying the changes it has shipped so far.
+WORKER_INSTANT_SLICE_SECONDS = 0.012
+# A cluster graph that must be refreshed before a worker run is brought up
+# to date in slices of this many seconds, one per frame.
+PREPARATION_SLICE_SECONDS = 0.012
+
+# Every solver by display name; each returns a SearchResult when it stops.
+SOLVERS = {
+    "BFS": run_bfs,
+    "DFS": run_dfs,
+    "UCS": run_ucs,
+    "DLS": run_dls,
+    "IDDFS": run_iddfs,
+    "BIDIRECTIONAL": run_bidirectional,
+    "BIDIR DIJKSTRA": run_bidirectional_dijkstra,
+    "BIDIR A*": run_bidirectional_astar,
+    "A*": run_astar,
+    "WEIGHTED A*": run_weighted_astar,
+    "GREEDY": run_greedy_best_first,
+    "LPA*": run_lpastar,
+    "HPA*": run_hpastar,
+}
+
+# Solvers whose cost depends on the per-cell weights.
+WEIGHTED_ALGORITHMS = frozenset({"UCS", "A*", "WEIGHTED A*", "GREEDY", "BIDIR DIJKSTRA", "BIDIR A*", "LPA*", "HPA*"})
+
+# Solvers whose planner can repair its answer after edits; the manager
+# builds the planner itself so it outlives the first search.
+INCREMENTAL_PLANNERS = {"LPA*": LifelongPlanner}
+
+
+class SimulationManager:
+    def __init__(self, step_delay=DEFAULT_STEP_DELAY, use_worker=True):
+        self.is_running = False
+        self.is_finished = False
+        self.current_generator = None
+        self.active_grid = None
+
+        # Plain solver runs go to a SearchWorker thread, which the frame
+        # loop drains; cached answers, replays, races and incremental
+        # planners still step on the UI thread.
+        self.use_worker = use_worker
+        self.worker = None
+        self.worker_preparation = None
+        self.pending_search = None
+        self.selected_algorithm = "BFS"
+
+        # Stepping scheduler
+        self.step_mode = "PACED"
+        self.step_delay = step_delay
+        self.frame_budget = DEFAULT_FRAME_BUDGET
+        self.steps_per_frame = DEFAULT_STEPS_PER_FRAME
+        self.last_step_time = 0.0
+        self.is_marking_deferred = False
+        
+        # The last run's trace; live runs record it, replays play it back.
+        self.trace = None
+        self.recording_trace = None
+        self.trace_player = None
+        self.is_replaying = False
+
+        # Race mode runs every algorithm at once on forks of the grid.
+        self.race = None
+
+        # After an incremental solver finishes, its planner follows grid
+        # edits and replan() repairs the path in place.
+        self.replanner = None
+        self.pending_replanner = None
+        self.repair_expansions = 0
+
+        # Timer variables
+        self.start_time = 0
+        self.duration = 0.0
+
+        # Counters and timings of the last single-algorithm run, and the
+        # SearchResult its solver returned.
+        self.run_metrics = None
+        self.result = None
+        self.track_memory = False
+
+        # BFS/UCS trees of earlier runs answer later runs on the same map.
+        self.path_cache = PathTreeCache()
+        self.is_cached_run = False
+
+        # Precomputed ALT landmarks for the current map, if any; heuristic
+        # solvers use them while they still match the grid.
+        self.landmarks = None
+
+        # HPA* cluster graph of the current grid. It follows edits and is
+        # only rebuilt where they landed.
+        self.hierarchy = None
+
+        self.algorithm_map = dict(SOLVERS)
+
+        # Extra keyword arguments handed to a solver when it starts.
+        self.algorithm_options = {
+            "WEIGHTED A*": {"epsilon": DEFAULT_EPSILON}
+        }
+
+    def set_algorithm(self, algorithm_name):
+        if not self.is_running:
+            self.selected_algorithm = algorithm_name
+
+    def uses_weights(self):
+        return self.selected_algorithm in WEIGHTED_ALGORITHMS
+
+    def toggle_memory_tracking(self):
+        if not self.is_running:
+            self.track_memory = not self.track_memory
+
+    def record_render_time(self, seconds):
+        """Charge a drawn frame to the live run, if there is one."""
+        if self.run_metrics is not None and self.run_metrics.is_live and not self.is_replaying:
+            self.run_metrics.render_time += seconds
+
+    def hierarchy_for(self, grid):
+        """The attached cluster graph of grid, replacing one for an older grid."""
+        if self.hierarchy is None or self.hierarchy.grid is not grid:
+            if self.hierarchy is not None:
+                self.hierarchy.detach()
+            self.hierarchy = ClusterGraph(grid)
+            self.hierarchy.attach()
+        return self.hierarchy
+
+    def _extra_solver_options(self, algorithm_name, grid, start_cell, target_cell):
+        # Per-map state the solvers take as keyword arguments; kept out of
+        # algorithm_options, which the run metrics export as-is.
+        if algorithm_name == "HPA*":
+            return {"hierarchy": self.hierarchy_for(grid)}
+        if self.landmarks is not None:
+            return self.landmarks.solver_options(algorithm_name, grid, start_cell, target_cell)
+        return {}
+
+    def adjust_heuristic_weight(self, direction):
+        options = self.algorithm_options["WEIGHTED A*"]
+        options["epsilon"] = min(max(options["epsilon"] + 0.25 * direction, 1.0), 10.0)
+
+    def algorithm_detail(self):
+        if self.trace_player is not None:
+            return f"{self.trace_player.position}/{self.trace.step_count}"
+        if self.is_cached_run and self.result is not None:
+            return "cached"
+        if self.replanner is not None and self.repair_expansions:
+            return f"repair {self.repair_expansions}"
+        if self.selected_algorithm == "HPA*" and self.hierarchy is not None and self.hierarchy.last_rebuilt:
+            return f"rebuilt {self.hierarchy.last_rebuilt}"
+        details = []
+        if self.selected_algorithm == "WEIGHTED A*":
+            details.append(f"w={self.algorithm_options['WEIGHTED A*']['epsilon']:.2f}")
+        if self.landmarks is not None and self.selected_algorithm in LANDMARK_ALGORITHMS:
+            details.append(f"ALT {self.landmarks.count}")
+        return " ".join(details)
+
+    def start_simulation(self, grid, start_cell, target_cell):
+        if not self.is_running and start_cell is not None and target_cell is not None:
+            self.is_finished = False
+            self.duration = 0.0
+            self.discard_replanner()
+
+            solver_function = self.algorithm_map[self.selected_algorithm]
+            solver_options = self.algorithm_options.get(self.selected_algorithm, {})
+            extra_options = self._extra_solver_options(self.selected_algorithm, grid, start_cell, target_cell)
+            self.run_metrics = RunMetrics(
+                self.selected_algorithm, grid, start_cell, target_cell,
+                dict(solver_options, landmarks=self.landmarks.count) if "heuristic" in extra_options else solver_options,
+                self.track_memory,
+            )
+            self.result = None
+            cached_result = None
+            if self.selected_algorithm in CACHEABLE_ALGORITHMS:
+                cached_result = self.path_cache.lookup(grid, self.selected_algorithm, start_cell, target_cell)
+            self.is_cached_run = cached_result is not None
+
+            planner_class = INCREMENTAL_PLANNERS.get(self.selected_algorithm)
+            if cached_result is not None:
+                self.current_generator = replay_cached_path(grid, cached_result)
+            elif planner_class is not None:
+                self.pending_replanner = planner_class(grid, start_cell, target_cell, self.run_metrics.search)
+                self.current_generator = self.pending_replanner.search()
+            elif self.use_worker:
+                self.worker = SearchWorker(grid)
+                self.pending_search = solver_function(
+                    self.worker.search_grid, start_cell, target_cell,
+                    metrics=self.run_metrics.search, **solver_options, **extra_options
+                )
+                hierarchy = extra_options.get("hierarchy")
+                if hierarchy is not None and hierarchy.needs_refresh:
+                    # The screen draws the cluster graph, so the worker may
+                    # only read it; advance() brings it up to date first.
+                    self.worker_preparation = hierarchy.refresh()
+                else:
+                    self.worker.start(self.pending_search)
+            else:
+                self.current_generator = solver_function(
+                    grid, start_cell, target_cell, metrics=self.run_metrics.search, **solver_options, **extra_options
+                )
+            self.active_grid = grid
+
+            self.trace = SearchTrace.from_grid(grid, self.selected_algorithm)
+            self.trace.attach(grid)
+            self.recording_trace = self.trace
+            self.trace_player = None
+            self.is_running = True
+            self.start_time = time.time() # Start Timer
+            return True
+        return False
+
+    def start_race(self, grid, start_cell, target_cell):
+        if self.is_running or start_cell is None or target_cell is None:
+            return False
+        self.discard_replanner()
+        self.run_metrics = None
+        self.result = None
+        self.is_cached_run = False
+        race_options = dict(self.algorithm_options)
+        if "HPA*" in self.algorithm_map:
+            race_options["HPA*"] = {"hierarchy": self.hierarchy_for(grid)}
+        self.race = SearchRace(grid, start_cell, target_cell, self.algorithm_map, race_options)
+        self.active_grid = grid
+        self.discard_trace()
+        self.is_finished = False
+        self.duration = 0.0
+        self.is_running = True
+        self.start_time = time.time()
+        return True
+
+    def end_race(self):
+        if self.race is not None:
+            self.race = None
+            self.is_running = False
+            self.is_finished = False
+
+    def displayed_grids(self):
+        if self.race is not None:
+            return self.race.grids
+        return [self.active_grid]
+
+    def step(self):
+        if self.is_running and self.race is not None:
+            if self.race.step_round():
+                return True
+            self.stop_simulation()
+            return False
+
+        if self.is_running and self.current_generator:
+            run_metrics = None if self.is_replaying else self.run_metrics
+            step_started = time.perf_counter()
+            try:
+                next(self.current_generator)
+            except StopIteration as stop:
+                if run_metrics is not None:
+                    run_metrics.solver_time += time.perf_counter() - step_started
+                if not self.is_replaying:
+                    self._accept_result(stop.value)
+                self.stop_simulation()
+                return False
+
+            if run_metrics is not None:
+                run_metrics.solver_time += time.perf_counter() - step_started
+                run_metrics.steps += 1
+            if self.recording_trace is not None:
+                self.recording_trace.end_step()
+            return True
+        return False
+
+    def _accept_result(self, result):
+        self.result = result
+        if result.tree is not None and not self.is_cached_run:
+            self.path_cache.store(self.active_grid, self.selected_algorithm, result.tree)
+        if self.pending_replanner is not None:
+            self.replanner, self.pending_replanner = self.pending_replanner, None
+            self.replanner.attach()
+
+    def cancel_run(self):
+        """Stop the running search, race or replay where it is."""
+        if not self.is_running:
+            return False
+        if self.worker is not None:
+            self.worker.cancel()
+        # A cancelled incremental search has nothing to repair.
+        self.pending_replanner = None
+        self.stop_simulation()
+        return True
+
+    def advance(self, current_time):
+        """Run the steps the current mode allows this frame; returns steps taken."""
+        if not self.is_running:
+            return 0
+        if self.worker is not None:
+            return self._advance_worker(current_time)
+
+        if self.step_mode == "PACED":
+            if current_time - self.last_step_time < self.step_delay:
+                return 0
+            self.last_step_time = current_time
+            self.step()
+            return 1
+
+        if self.step_mode == "STEPS":
+            steps_taken = 0
+            while steps_taken < self.steps_per_frame and self.step():
+                steps_taken += 1
+            return steps_taken
+
+        if self.step_mode == "INSTANT":
+            if not self.is_marking_deferred:
+                self.is_marking_deferred = True
+                for grid in self.displayed_grids():
+                    grid.pause_dirty_tracking()
+            budget = INSTANT_SLICE_SECONDS
+        else:
+            budget = self.frame_budget
+
+        steps_taken = 0
+        deadline = time.perf_counter() + budget
+        while self.step():
+            steps_taken += 1
+            if time.perf_counter() >= deadline:
+                break
+        return steps_taken
+
+    def _advance_worker(self, current_time):
+        # Same modes, but steps come from the worker's queue in bulk and a
+        # frame never waits for a step the worker has not finished.
+        if self.worker_preparation is not None and not self._prepare_worker():
+            return 0
+
+        if self.step_mode == "PACED":
+            if current_time - self.last_step_time < self.step_delay:
+                return 0
+            steps_taken = self._take_worker_steps(1)
+            if steps_taken:
+                self.last_step_time = current_time
+            return steps_taken
+
+        steps_taken = 0
+        if self.step_mode == "STEPS":
+            while self.worker is not None and steps_taken < self.steps_per_frame:
+                taken = self._take_worker_steps(self.steps_per_frame - steps_taken)
+                if not taken and self.worker is not None:
+                    break
+                steps_taken += taken
+            return steps_taken
+
+        if self.step_mode == "INSTANT":
+            if not self.is_marking_deferred:
+                self.is_marking_deferred = True
+                self.active_grid.pause_dirty_tracking()
+            budget = WORKER_INSTANT_SLICE_SECONDS
+        else:
+            budget = self.frame_budget
+
+        deadline = time.perf_counter() + budget
+        while self.worker is not None and time.perf_counter() < deadline:
+            taken = self._take_worker_steps(DELTA_BATCH_STEPS)
+            if not taken and self.worker is not None:
+                break
+            steps_taken += taken
+        return steps_taken
+
+    def _prepare_worker(self):
+        """Run one slice of the worker's preparation; starts it once done."""
+        worker = self.worker
+        slice_started = time.perf_counter()
+        is_prepared = run_for(self.worker_preparation, PREPARATION_SLICE_SECONDS)
+        worker.solver_time += time.perf_counter() - slice_started
+        self.run_metrics.solver_time = worker.solver_time
+        if is_prepared:
+            self.worker_preparation = None
+            worker.start(self.pending_search)
+            self.pending_search = None
+        return is_prepared
+
+    def _take_worker_steps(self, max_steps):
+        worker = self.worker
+        step_sizes = worker.take_steps(max_steps)
+        self.run_metrics.solver_time = worker.solver_time
+        self.run_metrics.steps += len(step_sizes)
+        if step_sizes and self.recording_trace is not None:
+            self.recording_trace.end_steps(step_sizes)
+        if worker.is_finished:
+            self._accept_result(worker.result)
+            self.stop_simulation()
+        return len(step_sizes)
+
+    def cycle_step_mode(self):
+        next_index = (STEP_MODES.index(self.step_mode) + 1) % len(STEP_MODES)
+        self.step_mode = STEP_MODES[next_index]
+
+    def adjust_speed(self, direction):
+        """Make the current mode faster (direction > 0) or slower (direction < 0)."""
+        if self.step_mode == "PACED":
+            factor = 0.5 if direction > 0 else 2.0
+            self.step_delay = min(max(self.step_delay * factor, 0.001), 1.0)
+        elif self.step_mode == "BUDGET":
+            factor = 2.0 if direction > 0 else 0.5
+            self.frame_budget = min(max(self.frame_budget * factor, 0.001), 0.1)
+        elif self.step_mode == "STEPS":
+            factor = 2 if direction > 0 else 0.5
+            self.steps_per_frame = min(max(int(self.steps_per_frame * factor), 1), 65536)
+
+    def speed_label(self):
+        if self.step_mode == "PACED":
+            return f"{self.step_delay * 1000:.0f}ms/step"
+        if self.step_mode == "BUDGET":
+            return f"{self.frame_budget * 1000:.0f}ms/frame"
+        if self.step_mode == "STEPS":
+            return f"x{self.steps_per_frame}/frame"
+        return "to completion"
+
+    def start_replay(self):
+        """Play the last trace back from the beginning with the current step mode."""
+        if self.is_running or self.trace is None:
+            return False
+        if self.trace_player is None:
+            self.trace_player = TracePlayer(self.trace, self.active_grid, self.trace.step_count)
+        if self.trace_player.at_end:
+            self.trace_player.seek(0)
+
+        self.current_generator = self.trace_player.play()
+        self.is_replaying = True
+        self.is_running = True
+        self.is_finished = False
+        return True
+
+    def load_replay(self, grid, trace):
+        """Review a trace opened from a file on grid, built with trace.build_grid()."""
+        self.discard_replanner()
+        self.run_metrics = None
+        self.result = None
+        self.is_cached_run = False
+        self.duration = 0.0
+        if trace.algorithm_name in self.algorithm_map:
+            self.selected_algorithm = trace.algorithm_name
+        self.active_grid = grid
+        self.trace = trace
+        self.trace_player = TracePlayer(trace, grid)
+        self.is_finished = True
+
+    def seek_replay(self, step_change):
+        if self.is_running or self.trace is None:
+            return
+        if self.trace_player is None:
+            self.trace_player = TracePlayer(self.trace, self.active_grid, self.trace.step_count)
+        self.trace_player.seek(self.trace_player.position + step_change)
+
+    def is_reviewing(self):
+        """True while a replay is paused somewhere before its last step."""
+        return self.trace_player is not None and not self.trace_player.at_end
+
+    def replan(self):
+        """
+        Repair the finished incremental search after grid edits. Runs to
+        completion in one go; returns True when the path was redrawn.
+        """
+        if self.replanner is None or self.is_running or not self.replanner.needs_repair:
+            return False
+        # The recorded trace no longer matches what the grid shows.
+        self.discard_trace()
+        metrics = self.replanner.metrics
+        expanded_before = metrics.nodes_expanded
+        repair_started = time.perf_counter()
+        self.result = run_to_completion(self.replanner.search())
+        self.duration = time.perf_counter() - repair_started
+        if self.run_metrics is not None:
+            self.run_metrics.solver_time += self.duration
+            self.run_metrics.record_result(self.result)
+        self.repair_expansions = metrics.nodes_expanded - expanded_before
+        self.is_finished = True
+        return True
+
+    def discard_replanner(self):
+        if self.replanner is not None:
+            self.replanner.detach()
+            self.replanner = None
+        self.pending_replanner = None
+        self.repair_expansions = 0
+
+    def discard_trace(self):
+        self.trace = None
+        self.trace_player = None
+
+    def stop_simulation(self):
+        self.is_running = False
+        self.is_finished = True
+        self.current_generator = None
+        self.worker = None
+        self.worker_preparation = None
+        self.pending_search = None
+
+        # A replay keeps the duration of the run it reproduces.
+        if self.is_replaying:
+            self.is_replaying = False
+        else:
+            self.duration = time.time() - self.start_time # Calculate Duration
+            if self.run_metrics is not None and self.run_metrics.is_live:
+                self.run_metrics.finish(self.result)
+
+        if self.recording_trace is not None:
+            self.recording_trace.detach()
+            self.recording_trace = None
+
+        if self.is_marking_deferred:
+            self.is_marking_deferred = False
+            for grid in self.displayed_grids():
+                grid.resume_dirty_tracking()
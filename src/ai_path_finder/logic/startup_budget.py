@@ -0,0 +1,99 @@
+"""
+Startup Budget for the AI Pathfinder.
+Times cold imports and GUI construction, each in a fresh interpreter.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# name -> (statement, budget in seconds, modules it must not load). The
+# headless layers stay free of pygame, and the solvers of NumPy as well.
+STARTUP_CASES = {
+    "config": ("import ai_path_finder.utils.config", 0.02, ("pygame", "numpy")),
+    "solvers": ("import ai_path_finder.logic.pathfinding", 0.1, ("pygame", "numpy")),
+    "benchmark": ("import ai_path_finder.logic.benchmark", 0.3, ("pygame",)),
+    "gui": ("from ai_path_finder.logic.app import PathfinderApp; PathfinderApp()", 1.0, ()),
+}
+
+DEFAULT_REPEAT = 3
+
+# Runs in the child; the interpreter's own boot is left out of "seconds".
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+exec(sys.argv[1])
+seconds = time.perf_counter() - started
+print(json.dumps({"seconds": seconds, "loaded": [name for name in sys.argv[2:] if name in sys.modules]}))
+"""
+
+SOURCE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _probe_environment():
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(filter(None, (SOURCE_ROOT, environment.get("PYTHONPATH"))))
+    # The GUI case must also run on machines without a display.
+    environment.setdefault("SDL_VIDEODRIVER", "dummy")
+    environment.setdefault("SDL_AUDIODRIVER", "dummy")
+    environment["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    return environment
+
+
+def measure_case(name, repeat=DEFAULT_REPEAT):
+    """Median in-process and whole-process seconds of one case over repeat runs."""
+    statement, budget, forbidden_modules = STARTUP_CASES[name]
+    environment = _probe_environment()
+    in_process, whole_process, loaded = [], [], set()
+    for _ in range(repeat):
+        started = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-c", _PROBE, statement, *forbidden_modules],
+            capture_output=True, text=True, env=environment, check=True,
+        )
+        whole_process.append(time.perf_counter() - started)
+        report = json.loads(completed.stdout.strip().splitlines()[-1])
+        in_process.append(report["seconds"])
+        loaded.update(report["loaded"])
+
+    seconds = statistics.median(in_process)
+    return {
+        "case": name,
+        "statement": statement,
+        "seconds": seconds,
+        "process_seconds": statistics.median(whole_process),
+        "budget_seconds": budget,
+        "forbidden_loaded": sorted(loaded),
+        "within_budget": seconds <= budget and not loaded,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check cold-start times against their budgets.")
+    parser.add_argument("--cases", nargs="+", choices=list(STARTUP_CASES), default=list(STARTUP_CASES))
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--json", dest="json_path", help="write results as JSON")
+    args = parser.parse_args(argv)
+
+    results = []
+    for name in args.cases:
+        record = measure_case(name, args.repeat)
+        results.append(record)
+        verdict = "ok" if record["within_budget"] else "OVER"
+        extra = f"  loaded {', '.join(record['forbidden_loaded'])}" if record["forbidden_loaded"] else ""
+        print(
+            f"{name:>10}: {record['seconds'] * 1000:7.1f} ms (process {record['process_seconds'] * 1000:7.1f} ms)"
+            f"  budget {record['budget_seconds'] * 1000:6.0f} ms  {verdict}{extra}"
+        )
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+    return 0 if all(record["within_budget"] for record in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Checks for the landmark (ALT) heuristics.
+Compares landmark-guided searches with Dijkstra's costs on random maps and edits.
+"""
+import random
+
+import pytest
+
+from ai_path_finder.logic.grid_model import WALL
+from ai_path_finder.logic.landmarks import (
+    build_landmarks,
+    load_landmarks,
+    save_landmarks,
+)
+from ai_path_finder.logic.map_generators import generate_grid
+from ai_path_finder.logic.pathfinding import find_path
+
+
+def random_queries(grid, rng, query_count):
+    open_cells = [cell for cell in range(grid.size) if grid.state[cell] != WALL]
+    return [(rng.choice(open_cells), rng.choice(open_cells)) for _ in range(query_count)]
+
+
+@pytest.mark.parametrize("walls", ["RANDOM", "MAZE", "ROOMS"])
+def test_landmark_searches_match_dijkstra(walls):
+    grid = generate_grid(60, 45, walls, "TERRAIN", seed=11)
+    table = build_landmarks(grid, count=6, seed=3)
+    for start_cell, target_cell in random_queries(grid, random.Random(5), query_count=30):
+        expected = find_path(grid, start_cell, target_cell, "UCS")
+        if expected.found:
+            heuristic = table.heuristic_to(grid, start_cell, target_cell)
+            assert heuristic(start_cell) <= expected.cost
+            start_heuristic = table.heuristic_from(grid, start_cell, target_cell)
+            assert start_heuristic(target_cell) <= expected.cost
+        for algorithm in ("A*", "BIDIR A*"):
+            result = find_path(grid, start_cell, target_cell, algorithm, landmarks=table)
+            assert result.found == expected.found
+            assert result.cost == expected.cost
+
+
+def test_edits_void_the_table_until_undone():
+    grid = generate_grid(40, 40, "RANDOM", "TERRAIN", seed=2)
+    table = build_landmarks(grid, count=4)
+    rng = random.Random(9)
+    for start_cell, target_cell in random_queries(grid, rng, query_count=10):
+        cell = rng.randrange(grid.size)
+        old_weight = grid.weights[cell]
+        was_wall = grid.state[cell] == WALL
+        if was_wall:
+            grid.reset_cell(cell)
+        else:
+            grid.set_weight(cell, old_weight % 5 + 1)
+        assert table.solver_options("A*", grid, start_cell, target_cell) == {}
+        expected = find_path(grid, start_cell, target_cell, "UCS")
+        assert find_path(grid, start_cell, target_cell, "A*", landmarks=table).cost == expected.cost
+
+        if was_wall:
+            grid.set_wall(cell)
+        else:
+            grid.set_weight(cell, old_weight)
+        assert table.matches(grid)
+
+
+def test_saved_table_loads_back(tmp_path):
+    grid = generate_grid(30, 50, "ROOMS", "TERRAIN", seed=4)
+    table = build_landmarks(grid, count=5)
+    path = tmp_path / "map.pflm"
+    save_landmarks(table, str(path))
+    loaded = load_landmarks(str(path))
+    assert loaded.landmark_cells == table.landmark_cells
+    assert [list(distances) for distances in loaded.distances] == [list(distances) for distances in table.distances]
+    assert loaded.matches(grid)
@@ -0,0 +1,69 @@
+"""
+Checks for the seeded map generators.
+Covers maze structure, seeding and small maps.
+"""
+from collections import deque
+
+import numpy as np
+import pytest
+
+from ai_path_finder.logic.grid_model import WALL
+from ai_path_finder.logic.map_generators import (
+    MAX_WEIGHT,
+    WALL_GENERATORS,
+    WEIGHT_GENERATORS,
+    generate_grid,
+    generate_layers,
+    noise_terrain,
+    spanning_tree_maze,
+)
+
+
+def open_cells_form_a_tree(walls):
+    open_cells = {(row, col) for row, col in zip(*np.nonzero(~walls), strict=True)}
+    edge_count = sum(((row, col + 1) in open_cells) + ((row + 1, col) in open_cells) for row, col in open_cells)
+    first_cell = next(iter(open_cells))
+    reached = {first_cell}
+    queue = deque([first_cell])
+    while queue:
+        row, col = queue.popleft()
+        for neighbor in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if neighbor in open_cells and neighbor not in reached:
+                reached.add(neighbor)
+                queue.append(neighbor)
+    return len(reached) == len(open_cells) and edge_count == len(open_cells) - 1
+
+
+@pytest.mark.parametrize(("rows", "cols"), [(3, 3), (3, 41), (41, 3), (4, 7), (21, 21), (60, 33)])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_maze_is_a_spanning_tree(rows, cols, seed):
+    walls = spanning_tree_maze(rows, cols, np.random.default_rng(seed))
+    assert open_cells_form_a_tree(walls)
+    assert walls[0].all() and walls[-1].all()
+    assert walls[:, 0].all() and walls[:, -1].all()
+
+
+def test_same_seed_gives_the_same_map():
+    assert generate_layers(40, 30, "MAZE", "TERRAIN", seed=9) == generate_layers(40, 30, "MAZE", "TERRAIN", seed=9)
+    assert generate_layers(40, 30, "MAZE", "TERRAIN", seed=9) != generate_layers(40, 30, "MAZE", "TERRAIN", seed=10)
+
+
+@pytest.mark.parametrize(("rows", "cols"), [(1, 1), (2, 2), (3, 3), (1, 10), (10, 1), (3, 7)])
+def test_terrain_covers_small_maps(rows, cols):
+    weights = noise_terrain(rows, cols, np.random.default_rng(0))
+    assert weights.shape == (rows, cols)
+    assert weights.min() >= 1
+    assert weights.max() <= MAX_WEIGHT
+
+
+@pytest.mark.parametrize("weights", list(WEIGHT_GENERATORS))
+@pytest.mark.parametrize("walls", list(WALL_GENERATORS))
+@pytest.mark.parametrize(("rows", "cols"), [(1, 1), (1, 10), (10, 1), (2, 2), (2, 9), (3, 3), (4, 5)])
+def test_every_layout_builds_small_maps(walls, weights, rows, cols):
+    grid = generate_grid(rows, cols, walls, weights, seed=3)
+    assert grid.size == rows * cols
+
+
+def test_thin_rooms_map_is_open():
+    grid = generate_grid(1, 10, "ROOMS", "UNIFORM", seed=1)
+    assert WALL not in grid.state
@@ -4,15 +4,12 @@ This is a minimalist launcher that abstracts all implementation details,
 simply initializing the application orchestrator.
 """
 import sys
-import os
 
-# Add the parent directory (src) to the Python path so we can find 'logic' and 'ui'
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from logic.app import PathfinderApp
+from ai_path_finder.logic.app import PathfinderApp
 
 def main():
-    app = PathfinderApp()
+    # An optional argument opens a saved .pfmap or a MovingAI .map.
+    app = PathfinderApp(map_path=sys.argv[1] if len(sys.argv) > 1 else None)
     app.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,10 @@
+"""
+AI Pathfinder Scenario Runner Entry Point.
+Runs a MovingAI scenario suite headlessly; never opens a window or imports pygame.
+"""
+import sys
+
+from ai_path_finder.logic.scenario_runner import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,10 @@
+"""
+AI Pathfinder Startup Budget Entry Point.
+Times cold starts of the headless layers and the GUI against fixed budgets.
+"""
+import sys
+
+from ai_path_finder.logic.startup_budget import main
+
+if __name__ == "__main__":
+    sys.exit(main())
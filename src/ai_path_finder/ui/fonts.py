@@ -0,0 +1,22 @@
+"""
+Shared Font Cache.
+Each size and weight of the UI font is looked up and loaded once.
+"""
+import pygame
+
+import ai_path_finder.utils.config as cfg
+
+_FONTS = {}
+
+
+def get_font(size, bold=False):
+    """
+    The UI font at size. Resolving and loading a face is slow (the first
+    lookup also scans the system fonts), so widgets share one per size.
+    """
+    font_key = (size, bold)
+    font = _FONTS.get(font_key)
+    if font is None:
+        font = pygame.font.SysFont(cfg.FONT_NAME, size, bold=bold)
+        _FONTS[font_key] = font
+    return font
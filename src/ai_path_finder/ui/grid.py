@@ -0,0 +1,346 @@
+"""
+Grid definition for the AI Pathfinder.
+Modern Render Style.
+"""
+import numpy
+import pygame
+
+import ai_path_finder.utils.config as cfg
+from ai_path_finder.logic.grid_model import START, STATE_NAMES, TARGET, WALL
+from ai_path_finder.ui.fonts import get_font
+
+STATE_COLORS = (
+    cfg.COLOR_EMPTY,
+    cfg.COLOR_FRONTIER,
+    cfg.COLOR_EXPLORED,
+    cfg.COLOR_PATH,
+    cfg.COLOR_WALL,
+    cfg.COLOR_START,
+    cfg.COLOR_TARGET,
+)
+
+
+class GridNode:
+    """Lightweight view over one cell of a GridModel."""
+
+    __slots__ = ("cell", "grid")
+
+    def __init__(self, grid, cell):
+        self.grid = grid
+        self.cell = cell
+
+    def __eq__(self, other):
+        return isinstance(other, GridNode) and self.grid is other.grid and self.cell == other.cell
+
+    def __hash__(self):
+        return hash(self.cell)
+
+    @property
+    def row(self):
+        return self.cell // self.grid.cols
+
+    @property
+    def col(self):
+        return self.cell % self.grid.cols
+
+    @property
+    def weight(self):
+        return self.grid.weights[self.cell]
+
+    @property
+    def state_type(self):
+        return STATE_NAMES[self.grid.state[self.cell]]
+
+    @property
+    def current_color(self):
+        return STATE_COLORS[self.grid.state[self.cell]]
+
+    def get_grid_coordinates(self):
+        return self.row, self.col
+
+    def is_barrier(self):
+        return self.grid.is_barrier(self.cell)
+
+    def reset_to_empty(self):
+        self.grid.reset_cell(self.cell)
+
+    def set_as_wall(self):
+        self.grid.set_wall(self.cell)
+
+    def set_as_start(self):
+        self.grid.set_start(self.cell)
+
+    def set_as_target(self):
+        self.grid.set_target(self.cell)
+
+    def mark_as_frontier(self):
+        self.grid.mark_frontier(self.cell)
+
+    def mark_as_explored(self):
+        self.grid.mark_explored(self.cell)
+
+    def mark_as_path_segment(self):
+        self.grid.mark_path(self.cell)
+
+
+class GridRenderer:
+    """
+    Keeps a persistent surface of the visible part of the grid and
+    repaints only the cells the model reports as dirty since the previous
+    frame. Whole-view repaints are a few NumPy operations: a lookup of
+    each pixel's cell, a palette LUT and a precomputed gap mask.
+    """
+
+    # Past this many dirty cells a full vectorized repaint is cheaper.
+    MAX_DIRTY_RECTS = 512
+    # Below this zoom there is no room for gaps, so the state buffer is
+    # scaled as an 8-bit palette image instead.
+    GAP_ZOOM = 4
+    ROUNDED_CORNER_ZOOM = 6
+    WEIGHT_TEXT_ZOOM = 16
+    # The abstract overlay draws nodes from this zoom up, and routes only
+    # while this few clusters are in view.
+    ABSTRACT_NODE_ZOOM = 2
+    MAX_ABSTRACT_EDGE_CLUSTERS = 64
+
+    def __init__(self, grid, viewport):
+        self.viewport = viewport
+        self.show_weights = False
+        self.weight_font = None
+        self.weight_glyphs = {}
+        self.grid = None
+        self.view_surface = pygame.Surface(viewport.screen_rect.size)
+        self.drawn_revision = None
+
+        # Palette LUT of surface-mapped colors, indexed by cell state.
+        self.palette = numpy.array([self.view_surface.map_rgb(color) for color in STATE_COLORS], dtype=numpy.uint32)
+        self.background = self.view_surface.map_rgb(cfg.COLOR_BG)
+        self.pixel_cells = None
+        self.pixel_background = None
+        self.abstract_level = None
+        self.attach(grid)
+
+    def attach(self, grid):
+        self.grid = grid
+        grid.enable_dirty_tracking()
+        if (self.viewport.rows, self.viewport.cols) != (grid.rows, grid.cols):
+            self.viewport.resize_grid(grid.rows, grid.cols)
+        self.drawn_revision = None
+
+    @property
+    def screen_rect(self):
+        return self.viewport.screen_rect
+
+    def set_show_weights(self, show_weights):
+        if show_weights != self.show_weights:
+            self.show_weights = show_weights
+            self.grid.invalidate()
+
+    def set_abstract_level(self, hierarchy):
+        """Overlay an HPA* ClusterGraph on the grid, or None to hide it."""
+        self.abstract_level = hierarchy
+        self.grid.invalidate()
+
+    def update(self):
+        """Repaint changed cells; returns the screen rects that changed."""
+        changed_cells = self.grid.take_dirty_cells()
+        if self.drawn_revision != self.viewport.revision:
+            self.drawn_revision = self.viewport.revision
+            self._build_pixel_lookup()
+            changed_cells = None
+
+        # Overlay lines cross many cells, so any change repaints the view.
+        needs_full_repaint = self.viewport.zoom < self.GAP_ZOOM or self.abstract_level is not None
+        if changed_cells is None or (changed_cells and needs_full_repaint):
+            self._draw_visible_region()
+            return [self.screen_rect]
+        if not changed_cells:
+            return []
+
+        first_row, end_row, first_col, end_col = self.viewport.visible_range()
+        cols = self.grid.cols
+        visible_cells = []
+        for cell in changed_cells:
+            row, col = divmod(cell, cols)
+            if first_row <= row < end_row and first_col <= col < end_col:
+                visible_cells.append(cell)
+
+        if len(visible_cells) > self.MAX_DIRTY_RECTS:
+            self._draw_visible_region()
+            return [self.screen_rect]
+        return self._draw_cells(visible_cells)
+
+    def blit(self, surface, screen_rects=None):
+        screen_rect = self.screen_rect
+        if screen_rects is None:
+            surface.blit(self.view_surface, screen_rect.topleft)
+            return
+        for rect in screen_rects:
+            local_area = rect.clip(screen_rect).move(-screen_rect.x, -screen_rect.y)
+            surface.blit(self.view_surface, (local_area.x + screen_rect.x, local_area.y + screen_rect.y), local_area)
+
+    def _build_pixel_lookup(self):
+        """
+        For every view pixel, the cell it shows and whether it is background
+        (outside the grid, the 1 px gap, or a cut tile corner). Rebuilt only
+        when the camera moves; arrays are (width, height) like surfarray.
+        """
+        if self.viewport.zoom < self.GAP_ZOOM:
+            self.pixel_cells = self.pixel_background = None
+            return
+
+        first_row, end_row, first_col, end_col = self.viewport.visible_range()
+        width, height = self.view_surface.get_size()
+        col_of_x, gap_x, corner_x = self._axis_lookup(width, first_col, end_col, self.viewport.origin_col)
+        row_of_y, gap_y, corner_y = self._axis_lookup(height, first_row, end_row, self.viewport.origin_row)
+
+        self.pixel_cells = col_of_x[:, None] + row_of_y[None, :] * self.grid.cols
+        self.pixel_background = gap_x[:, None] | gap_y[None, :]
+        if self.viewport.zoom >= self.ROUNDED_CORNER_ZOOM:
+            self.pixel_background |= corner_x[:, None] & corner_y[None, :]
+
+    def _axis_lookup(self, pixel_count, first_index, end_index, origin):
+        # Same rounding as Viewport.cell_pixel_x/y, so tiles line up with
+        # the mouse mapping and with incremental cell updates.
+        zoom = self.viewport.zoom
+        edges = numpy.round((numpy.arange(first_index, end_index + 1) - origin) * zoom).astype(numpy.int64)
+        pixels = numpy.arange(pixel_count)
+        slot = numpy.searchsorted(edges, pixels, side="right") - 1
+        outside = (slot < 0) | (slot >= end_index - first_index)
+        slot = numpy.clip(slot, 0, max(end_index - first_index - 1, 0))
+
+        offset = pixels - edges[slot]
+        tile_size = edges[slot + 1] - edges[slot] if end_index > first_index else numpy.ones_like(slot)
+        gap = outside | (offset >= tile_size - 1)
+        corner = (offset == 0) | (offset == tile_size - 2)
+        return (slot + first_index).astype(numpy.intp), gap, corner
+
+    def _draw_visible_region(self):
+        first_row, end_row, first_col, end_col = self.viewport.visible_range()
+        if end_row <= first_row or end_col <= first_col:
+            self.view_surface.fill(cfg.COLOR_BG)
+            return
+
+        if self.viewport.zoom < self.GAP_ZOOM:
+            # One byte per cell is already an 8-bit palette image.
+            self.view_surface.fill(cfg.COLOR_BG)
+            state_image = pygame.image.frombuffer(self.grid.state, (self.grid.cols, self.grid.rows), "P")
+            state_image.set_palette(STATE_COLORS)
+            visible_image = state_image.subsurface(
+                (first_col, first_row, end_col - first_col, end_row - first_row)
+            )
+            left = self.viewport.cell_pixel_x(first_col) - self.screen_rect.x
+            top = self.viewport.cell_pixel_y(first_row) - self.screen_rect.y
+            width = self.viewport.cell_pixel_x(end_col) - self.screen_rect.x - left
+            height = self.viewport.cell_pixel_y(end_row) - self.screen_rect.y - top
+            self.view_surface.blit(pygame.transform.scale(visible_image, (max(width, 1), max(height, 1))), (left, top))
+            if self.abstract_level is not None:
+                self._draw_abstract_level(first_row, end_row, first_col, end_col)
+            return
+
+        state = numpy.frombuffer(self.grid.state, dtype=numpy.uint8)
+        pixels = numpy.where(self.pixel_background, self.background, self.palette[state[self.pixel_cells]])
+        pygame.surfarray.blit_array(self.view_surface, pixels)
+
+        if self.show_weights and self.viewport.zoom >= self.WEIGHT_TEXT_ZOOM:
+            cols = self.grid.cols
+            for row in range(first_row, end_row):
+                for cell in range(row * cols + first_col, row * cols + end_col):
+                    self._draw_weight(cell)
+
+        if self.abstract_level is not None:
+            self._draw_abstract_level(first_row, end_row, first_col, end_col)
+
+    def _draw_cells(self, cells):
+        """Repaint visible cells through the same mask; returns their screen rects."""
+        state = self.grid.state
+        screen_x, screen_y = self.screen_rect.topleft
+        view_rect = self.view_surface.get_rect()
+        cell_rects = []
+
+        surface_pixels = pygame.surfarray.pixels2d(self.view_surface)
+        for cell in cells:
+            row, col = divmod(cell, self.grid.cols)
+            local_rect = self.viewport.cell_rect(row, col).move(-screen_x, -screen_y).clip(view_rect)
+            tile = (slice(local_rect.left, local_rect.right), slice(local_rect.top, local_rect.bottom))
+            surface_pixels[tile] = numpy.where(self.pixel_background[tile], self.background, self.palette[state[cell]])
+            cell_rects.append(local_rect.move(screen_x, screen_y))
+        del surface_pixels
+
+        if self.show_weights and self.viewport.zoom >= self.WEIGHT_TEXT_ZOOM:
+            for cell in cells:
+                self._draw_weight(cell)
+        return cell_rects
+
+    def _draw_abstract_level(self, first_row, end_row, first_col, end_col):
+        hierarchy = self.abstract_level
+        viewport = self.viewport
+        screen_x, screen_y = self.screen_rect.topleft
+        cols = self.grid.cols
+        size = hierarchy.cluster_size
+        left = viewport.cell_pixel_x(first_col) - screen_x
+        right = viewport.cell_pixel_x(end_col) - screen_x
+        top = viewport.cell_pixel_y(first_row) - screen_y
+        bottom = viewport.cell_pixel_y(end_row) - screen_y
+
+        for row in range(-(-first_row // size) * size, end_row, size):
+            y = viewport.cell_pixel_y(row) - screen_y - 1
+            pygame.draw.line(self.view_surface, cfg.COLOR_CLUSTER_BORDER, (left, y), (right, y))
+        for col in range(-(-first_col // size) * size, end_col, size):
+            x = viewport.cell_pixel_x(col) - screen_x - 1
+            pygame.draw.line(self.view_surface, cfg.COLOR_CLUSTER_BORDER, (x, top), (x, bottom))
+
+        if viewport.zoom < self.ABSTRACT_NODE_ZOOM:
+            return
+        half_cell = viewport.zoom / 2
+
+        def center(cell):
+            row, col = divmod(cell, cols)
+            return (viewport.cell_pixel_x(col) - screen_x + half_cell, viewport.cell_pixel_y(row) - screen_y + half_cell)
+
+        visible_clusters = [
+            cluster_row * hierarchy.cluster_cols + cluster_col
+            for cluster_row in range(first_row // size, -(-end_row // size))
+            for cluster_col in range(first_col // size, -(-end_col // size))
+        ]
+        if len(visible_clusters) <= self.MAX_ABSTRACT_EDGE_CLUSTERS:
+            for cluster in visible_clusters:
+                for node in hierarchy.cluster_nodes[cluster]:
+                    node_center = center(node)
+                    for edges in (hierarchy.intra_edges.get(node, {}), hierarchy.inter_edges.get(node, {})):
+                        for other_node in edges:
+                            # Each pair is drawn once, from its lower cell.
+                            if other_node > node:
+                                pygame.draw.aaline(self.view_surface, cfg.COLOR_ABSTRACT_EDGE, node_center, center(other_node))
+
+        node_size = max(int(viewport.zoom / 2), 2)
+        for cluster in visible_clusters:
+            for node in hierarchy.cluster_nodes[cluster]:
+                node_rect = pygame.Rect(0, 0, node_size, node_size)
+                node_rect.center = center(node)
+                self.view_surface.fill(cfg.COLOR_ABSTRACT_NODE, node_rect)
+
+    def _draw_weight(self, cell):
+        cell_state = self.grid.state[cell]
+        if cell_state == WALL:
+            return
+        if self.weight_font is None:
+            self.weight_font = get_font(12, bold=True)
+
+        text_color = (255, 255, 255) if cell_state in (START, TARGET) else (0, 0, 0)
+        glyph_key = (self.grid.weights[cell], text_color)
+        text_surf = self.weight_glyphs.get(glyph_key)
+        if text_surf is None:
+            text_surf = self.weight_font.render(str(glyph_key[0]), True, text_color)
+            self.weight_glyphs[glyph_key] = text_surf
+
+        row, col = divmod(cell, self.grid.cols)
+        local_rect = self.viewport.cell_rect(row, col).move(-self.screen_rect.x, -self.screen_rect.y)
+        # Center on the drawn tile, which excludes the 1 px gap.
+        tile_center = (local_rect.x + (local_rect.width - 1) // 2, local_rect.y + (local_rect.height - 1) // 2)
+        self.view_surface.blit(text_surf, text_surf.get_rect(center=tile_center))
+
+
+def get_node_from_mouse_click(mouse_position, viewport):
+    """Grid (row, col) under the mouse, mapped through the camera."""
+    return viewport.cell_at(mouse_position)
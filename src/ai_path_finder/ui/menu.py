@@ -0,0 +1,340 @@
+"""
+User Interface Management Layer.
+Modern Dashboard Design.
+"""
+import pygame
+import ai_path_finder.utils.config as cfg
+from ai_path_finder.ui.fonts import get_font
+
+
+def format_count(value):
+    if value < 10_000:
+        return str(value)
+    if value < 10_000_000:
+        return f"{value / 1000:.1f}k"
+    return f"{value / 1_000_000:.1f}M"
+
+
+def format_seconds(seconds):
+    return f"{seconds * 1000:.0f}ms" if seconds < 10 else f"{seconds:.1f}s"
+
+
+def format_bytes(byte_count):
+    if byte_count < 1024 * 1024:
+        return f"{byte_count / 1024:.0f}KB"
+    return f"{byte_count / (1024 * 1024):.1f}MB"
+
+
+class ModernButton:
+    def __init__(self, x, y, width, height, text, action_payload, font_size=16):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.text = text
+        self.action_payload = action_payload
+        
+        self.col_idle = cfg.COLOR_PANEL
+        self.col_hover = cfg.COLOR_FRONTIER
+        self.col_active = cfg.COLOR_PATH
+        self.col_text = cfg.COLOR_TEXT_MAIN
+        
+        self.font = get_font(font_size, bold=True)
+        self.active = False
+        # Finished button images by (background, text color).
+        self.surfaces = {}
+
+    def is_hovered(self):
+        return self.rect.collidepoint(pygame.mouse.get_pos())
+
+    def draw(self, surface, is_selected=False):
+        if is_selected:
+            bg_color = self.col_active
+            text_color = cfg.COLOR_SIDEBAR
+        elif self.is_hovered():
+            bg_color = self.col_hover
+            text_color = cfg.COLOR_SIDEBAR
+        else:
+            bg_color = self.col_idle
+            text_color = self.col_text
+
+        surface_key = (tuple(bg_color), tuple(text_color))
+        button_surf = self.surfaces.get(surface_key)
+        if button_surf is None:
+            # Buttons sit on the sidebar, so its color fills the corners.
+            button_surf = pygame.Surface(self.rect.size)
+            button_surf.fill(cfg.COLOR_SIDEBAR)
+            pygame.draw.rect(button_surf, bg_color, button_surf.get_rect(), border_radius=8)
+            text_surf = self.font.render(self.text, True, text_color)
+            button_surf.blit(text_surf, text_surf.get_rect(center=button_surf.get_rect().center))
+            self.surfaces[surface_key] = button_surf
+        surface.blit(button_surf, self.rect)
+
+    def is_clicked(self, pos):
+        return self.rect.collidepoint(pos)
+
+
+class InterfaceRenderer:
+    TEXT_CACHE_LIMIT = 512
+
+    KEY_LEGEND = (
+        ("SPACE/ESC", "Start / Cancel"),
+        ("V", "Race All"),
+        ("C/X", "Clear Grid / Search"),
+        ("M/T", "Step Mode / Memory"),
+        ("+/-", "Speed"),
+        ("BRACKETS", "A* Weight"),
+        ("R/ARROWS", "Replay / Scrub"),
+        ("E/SHIFT+E/J", "Trace Out / In / Stats"),
+        ("S/O/L", "Save / Open / ALT"),
+        ("G/SHIFT+G", "Generate / Reseed"),
+        ("WHEEL/M-DRAG", "Zoom / Pan"),
+        ("F/N/H", "Fit / Size / Clusters"),
+        ("L/R-CLICK", "Place / Remove"),
+        ("1-5", "Cell Weight")
+    )
+
+    METRIC_LABELS = ("EXPANDED", "PUSHED", "REOPENED", "FRONTIER", "SOLVER", "RENDER", "MEMORY", "WALL")
+
+    def __init__(self, display_surface, algorithm_names):
+        self.display = display_surface
+        
+        self.font_title = get_font(28, bold=True)
+        self.font_label = get_font(14)
+        self.font_value = get_font(20, bold=True)
+        self.font_small = get_font(12)
+        
+        self.sidebar_width = 280
+        self.padding = 20
+        
+        self.buttons = []
+        
+        # Up to six algorithms fit in one column; more switch to two, and
+        # past six rows the buttons shrink to stay clear of the key legend.
+        columns = 1 if len(algorithm_names) <= 6 else 2
+        rows = -(-len(algorithm_names) // columns)
+        btn_start_y = 335
+        if columns == 1:
+            btn_height, btn_gap = 32, 8
+        elif rows <= 6:
+            btn_height, btn_gap = 28, 6
+        else:
+            btn_height, btn_gap = 24, 4
+        btn_width = (self.sidebar_width - (self.padding * 2) - btn_gap * (columns - 1)) // columns
+        font_size = 16 if columns == 1 else 13
+        for i, algo in enumerate(algorithm_names):
+            row, col = divmod(i, columns)
+            btn = ModernButton(
+                self.padding + col * (btn_width + btn_gap), 
+                btn_start_y + row * (btn_height + btn_gap), 
+                btn_width, 
+                btn_height, 
+                algo, 
+                algo,
+                font_size
+            )
+            self.buttons.append(btn)
+
+        self.sidebar_rect = pygame.Rect(0, 0, self.sidebar_width, cfg.WINDOW_HEIGHT)
+        self.panel_rect = pygame.Rect(self.padding, 100, self.sidebar_width - 40, 220)
+        # The sidebar is composed off-screen: static_panel holds everything
+        # that never changes, and panel_surface is rebuilt from it only when
+        # panel_state (every value shown) differs from the last frame.
+        self.static_panel = None
+        self.panel_surface = pygame.Surface(self.sidebar_rect.size)
+        self.panel_state = None
+        # Rendered strings by (font, text, color); cleared when it grows
+        # past TEXT_CACHE_LIMIT, e.g. from live counters during a long run.
+        self.text_cache = {}
+        self.dim_overlay = None
+
+    def _render_text(self, font, text, color):
+        text_key = (font, text, tuple(color))
+        text_surf = self.text_cache.get(text_key)
+        if text_surf is None:
+            if len(self.text_cache) >= self.TEXT_CACHE_LIMIT:
+                self.text_cache.clear()
+            text_surf = font.render(text, True, color)
+            self.text_cache[text_key] = text_surf
+        return text_surf
+
+    def render_control_panel(self, active_algorithm, status, step_mode, speed_label, algorithm_detail="", run_metrics=None, track_memory=False):
+        """
+        Blit the sidebar and return its rect, or None when it shows the
+        same as last frame and that part of the screen needs no update.
+        """
+        hovered_button = next((index for index, btn in enumerate(self.buttons) if btn.is_hovered()), None)
+        panel_state = (
+            active_algorithm, status, step_mode, speed_label, algorithm_detail,
+            self._metric_values(run_metrics, track_memory), hovered_button,
+        )
+        is_changed = panel_state != self.panel_state
+        if is_changed:
+            self.panel_state = panel_state
+            self._compose_panel(active_algorithm, status, step_mode, speed_label, algorithm_detail, panel_state[5])
+        self.display.blit(self.panel_surface, self.sidebar_rect)
+        return self.sidebar_rect if is_changed else None
+
+    def _build_static_panel(self):
+        static_panel = pygame.Surface(self.sidebar_rect.size)
+        static_panel.fill(cfg.COLOR_SIDEBAR)
+
+        title_surf = self.font_title.render("PATHFINDER", True, cfg.COLOR_PATH)
+        static_panel.blit(title_surf, (self.padding, 30))
+        
+        sub_surf = self.font_label.render("AI VISUALIZER v2.0", True, cfg.COLOR_GRID)
+        static_panel.blit(sub_surf, (self.padding, 65))
+
+        panel_rect = self.panel_rect
+        pygame.draw.rect(static_panel, cfg.COLOR_PANEL, panel_rect, border_radius=12)
+        
+        lbl_status = self.font_label.render("CURRENT STATUS", True, cfg.COLOR_FRONTIER)
+        static_panel.blit(lbl_status, (panel_rect.x + 15, panel_rect.y + 15))
+
+        pygame.draw.line(static_panel, cfg.COLOR_SIDEBAR, (panel_rect.x + 10, panel_rect.y + 70), (panel_rect.right - 10, panel_rect.y + 70), 2)
+
+        lbl_algo = self.font_label.render("SELECTED ALGORITHM", True, cfg.COLOR_FRONTIER)
+        static_panel.blit(lbl_algo, (panel_rect.x + 15, panel_rect.y + 85))
+
+        pygame.draw.line(static_panel, cfg.COLOR_SIDEBAR, (panel_rect.x + 10, panel_rect.y + 140), (panel_rect.right - 10, panel_rect.y + 140), 2)
+
+        column_width = (panel_rect.width - 30) // 2
+        for index, label in enumerate(self.METRIC_LABELS):
+            row, col = divmod(index, 2)
+            x = panel_rect.x + 15 + col * (column_width + 10)
+            y = panel_rect.y + 150 + row * 16
+            static_panel.blit(self.font_small.render(label, True, cfg.COLOR_FRONTIER), (x, y))
+
+        instr_y = cfg.WINDOW_HEIGHT - 20 - 17 * len(self.KEY_LEGEND)
+        for key, desc in self.KEY_LEGEND:
+            k_surf = self.font_label.render(f"[{key}]", True, cfg.COLOR_FRONTIER)
+            d_surf = self.font_label.render(desc, True, cfg.COLOR_GRID)
+            
+            static_panel.blit(k_surf, (self.padding, instr_y))
+            static_panel.blit(d_surf, (self.padding + 120, instr_y))
+            instr_y += 17
+        return static_panel
+
+    def _compose_panel(self, active_algorithm, status, step_mode, speed_label, algorithm_detail, metric_values):
+        if self.static_panel is None:
+            self.static_panel = self._build_static_panel()
+        panel = self.panel_surface
+        panel.blit(self.static_panel, (0, 0))
+        panel_rect = self.panel_rect
+
+        col_status = cfg.COLOR_START if status == "FINISHED" else (cfg.COLOR_TARGET if status == "RUNNING" else cfg.COLOR_TEXT_MAIN)
+        val_status = self._render_text(self.font_value, status, col_status)
+        panel.blit(val_status, (panel_rect.x + 15, panel_rect.y + 35))
+
+        mode_surf = self._render_text(self.font_label, step_mode, cfg.COLOR_FRONTIER)
+        panel.blit(mode_surf, mode_surf.get_rect(topright=(panel_rect.right - 15, panel_rect.y + 15)))
+        speed_surf = self._render_text(self.font_label, speed_label, cfg.COLOR_TEXT_MAIN)
+        panel.blit(speed_surf, speed_surf.get_rect(topright=(panel_rect.right - 15, panel_rect.y + 40)))
+
+        val_algo = self._render_text(self.font_value, active_algorithm, cfg.COLOR_TEXT_MAIN)
+        panel.blit(val_algo, (panel_rect.x + 15, panel_rect.y + 105))
+
+        if algorithm_detail:
+            detail_surf = self._render_text(self.font_label, algorithm_detail, cfg.COLOR_TEXT_MAIN)
+            panel.blit(detail_surf, detail_surf.get_rect(topright=(panel_rect.right - 15, panel_rect.y + 110)))
+
+        column_width = (panel_rect.width - 30) // 2
+        for index, value in enumerate(metric_values):
+            row, col = divmod(index, 2)
+            x = panel_rect.x + 15 + col * (column_width + 10)
+            y = panel_rect.y + 150 + row * 16
+            value_surf = self._render_text(self.font_small, value, cfg.COLOR_TEXT_MAIN)
+            panel.blit(value_surf, value_surf.get_rect(topright=(x + column_width - 5, y)))
+
+        for btn in self.buttons:
+            is_selected = (btn.action_payload == active_algorithm)
+            btn.draw(panel, is_selected)
+
+    def _metric_values(self, run_metrics, track_memory):
+        """Text of the two columns of live counters under the selected algorithm."""
+        if run_metrics is not None and run_metrics.peak_memory_bytes is not None:
+            memory_text = format_bytes(run_metrics.peak_memory_bytes)
+        elif run_metrics is not None and run_metrics.is_tracking_memory:
+            memory_text = "..."
+        else:
+            memory_text = "on" if track_memory else "off"
+
+        if run_metrics is None:
+            return ("-",) * 6 + (memory_text, "-")
+        search = run_metrics.search
+        return (
+            format_count(search.nodes_expanded),
+            format_count(search.nodes_pushed),
+            format_count(search.nodes_reopened),
+            format_count(search.peak_frontier),
+            format_seconds(run_metrics.solver_time),
+            format_seconds(run_metrics.render_time),
+            memory_text,
+            format_seconds(run_metrics.elapsed_time()),
+        )
+
+    def render_result_popup(self, result, duration, run_metrics=None):
+        if self.dim_overlay is None:
+            self.dim_overlay = pygame.Surface((cfg.WINDOW_WIDTH, cfg.WINDOW_HEIGHT), pygame.SRCALPHA)
+            self.dim_overlay.fill((0, 0, 0, 150))
+        self.display.blit(self.dim_overlay, (0, 0))
+
+        cw, ch = 400, 250 if run_metrics is None else 320
+        cx = (cfg.WINDOW_WIDTH // 2) - (cw // 2)
+        cy = (cfg.WINDOW_HEIGHT // 2) - (ch // 2)
+        
+        modal_rect = pygame.Rect(cx, cy, cw, ch)
+        
+        pygame.draw.rect(self.display, cfg.COLOR_SIDEBAR, modal_rect, border_radius=15)
+        pygame.draw.rect(self.display, cfg.COLOR_PANEL, modal_rect, 2, border_radius=15)
+
+        success = result is not None and result.found
+        header_text = "SEARCH COMPLETE"
+        sub_text = "Target Found Successfully" if success else "Target Unreachable"
+        if result is None:
+            # Only a cancelled run ends without a result.
+            header_text = "SEARCH CANCELLED"
+            sub_text = "Stopped before the solver finished"
+        color = cfg.COLOR_START if success else cfg.COLOR_TARGET
+        
+        surf_header = self.font_value.render(header_text, True, cfg.COLOR_TEXT_MAIN)
+        surf_sub = self.font_label.render(sub_text, True, color)
+        
+        self.display.blit(surf_header, (cx + 30, cy + 30))
+        self.display.blit(surf_sub, (cx + 30, cy + 60))
+
+        stats_rect = pygame.Rect(cx + 30, cy + 100, cw - 60, 60)
+        pygame.draw.rect(self.display, cfg.COLOR_PANEL, stats_rect, border_radius=8)
+        
+        time_lbl = self.font_label.render("Time Elapsed:", True, cfg.COLOR_GRID)
+        time_val = self.font_value.render(f"{duration:.4f}s", True, cfg.COLOR_TEXT_MAIN)
+        
+        self.display.blit(time_lbl, (stats_rect.x + 15, stats_rect.y + 10))
+        self.display.blit(time_val, (stats_rect.x + 15, stats_rect.y + 30))
+
+        if run_metrics is not None:
+            search = run_metrics.search
+            rows = (
+                ("Path Cost", str(result.cost) if success else "-", "Moves", str(result.path_length) if success else "-"),
+                ("Expanded", format_count(search.nodes_expanded), "Solver", format_seconds(run_metrics.solver_time)),
+                ("Pushed", format_count(search.nodes_pushed), "Render", format_seconds(run_metrics.render_time)),
+                ("Frontier", format_count(search.peak_frontier),
+                 "Memory", "-" if run_metrics.peak_memory_bytes is None else format_bytes(run_metrics.peak_memory_bytes)),
+            )
+            row_y = stats_rect.bottom + 12
+            half_width = stats_rect.width // 2
+            for row in rows:
+                for column, (label, value) in enumerate((row[:2], row[2:])):
+                    x = stats_rect.x + column * half_width
+                    self.display.blit(self.font_label.render(label, True, cfg.COLOR_GRID), (x, row_y))
+                    value_surf = self.font_label.render(value, True, cfg.COLOR_TEXT_MAIN)
+                    self.display.blit(value_surf, value_surf.get_rect(topright=(x + half_width - 15, row_y)))
+                row_y += 20
+
+        footer_text = "Press 'C' to Reset Grid" if run_metrics is None else "Press 'C' to Reset Grid, 'J' to Save Stats"
+        footer = self.font_label.render(footer_text, True, cfg.COLOR_FRONTIER)
+        footer_rect = footer.get_rect(center=(cx + cw//2, cy + ch - 30))
+        self.display.blit(footer, footer_rect)
+
+    def check_button_clicks(self, pos):
+        for btn in self.buttons:
+            if btn.is_clicked(pos):
+                return btn.action_payload
+        return None
@@ -0,0 +1,110 @@
+"""
+Race Mode View.
+Tiles one GridRenderer per lane next to a live results table.
+"""
+import math
+
+import pygame
+
+import ai_path_finder.utils.config as cfg
+from ai_path_finder.ui.fonts import get_font
+from ai_path_finder.ui.grid import GridRenderer
+from ai_path_finder.ui.viewport import Viewport
+
+
+class RaceView:
+    TILE_GAP = 12
+    LABEL_HEIGHT = 18
+    ROW_HEIGHT = 18
+
+    def __init__(self, race, area_rect):
+        self.race = race
+        self.font_label = get_font(12, bold=True)
+        self.font_table = get_font(12)
+
+        # One extra slot holds the results table.
+        slot_count = len(race.lanes) + 1
+        columns = max(1, math.ceil(math.sqrt(slot_count * area_rect.width / area_rect.height)))
+        rows = math.ceil(slot_count / columns)
+        tile_width = (area_rect.width - self.TILE_GAP * (columns - 1)) // columns
+        tile_height = (area_rect.height - self.TILE_GAP * (rows - 1)) // rows
+
+        grid = race.lanes[0].grid
+
+        self.tiles = []
+        self.renderers = []
+        for slot in range(slot_count):
+            row, col = divmod(slot, columns)
+            tile_rect = pygame.Rect(
+                area_rect.x + col * (tile_width + self.TILE_GAP),
+                area_rect.y + row * (tile_height + self.TILE_GAP),
+                tile_width,
+                tile_height,
+            )
+            self.tiles.append(tile_rect)
+            if slot < len(race.lanes):
+                viewport = Viewport(
+                    (tile_rect.x, tile_rect.y + self.LABEL_HEIGHT, tile_width, tile_height - self.LABEL_HEIGHT),
+                    grid.rows,
+                    grid.cols,
+                    1,
+                )
+                viewport.fit()
+                self.renderers.append(GridRenderer(race.lanes[slot].grid, viewport))
+        self.table_rect = self.tiles[-1]
+        self.final_results_drawn = False
+
+    def update(self):
+        """Repaint changed cells of every lane; returns the changed screen rects."""
+        changed_rects = []
+        for renderer in self.renderers:
+            changed_rects += renderer.update()
+        # Labels and table follow the counters until one frame after the end.
+        if not self.final_results_drawn:
+            self.final_results_drawn = self.race.is_finished
+            changed_rects += self._label_rects()
+            changed_rects.append(self.table_rect)
+        return changed_rects
+
+    def blit(self, surface, screen_rects=None):
+        for renderer in self.renderers:
+            renderer.blit(surface, None if screen_rects is None else [
+                rect for rect in screen_rects if rect.colliderect(renderer.screen_rect)
+            ])
+        for lane, label_rect in zip(self.race.lanes, self._label_rects()):
+            surface.fill(cfg.COLOR_BG, label_rect)
+            color = cfg.COLOR_START if lane.found else (cfg.COLOR_TARGET if lane.is_finished else cfg.COLOR_FRONTIER)
+            surface.blit(self.font_label.render(lane.algorithm_name, True, color), label_rect.topleft)
+        self._draw_table(surface)
+
+    def _label_rects(self):
+        return [pygame.Rect(tile.x, tile.y, tile.width, self.LABEL_HEIGHT) for tile in self.tiles[:-1]]
+
+    def _draw_table(self, surface):
+        table_rect = self.table_rect
+        pygame.draw.rect(surface, cfg.COLOR_BG, table_rect)
+        pygame.draw.rect(surface, cfg.COLOR_PANEL, table_rect, border_radius=8)
+
+        column_x = (table_rect.x + 10, table_rect.x + table_rect.width * 45 // 100,
+                    table_rect.x + table_rect.width * 68 // 100, table_rect.x + table_rect.width * 88 // 100)
+        row_y = table_rect.y + 8
+        for x, heading in zip(column_x, ("ALGORITHM", "EXPANDED", "MS", "COST")):
+            surface.blit(self.font_table.render(heading, True, cfg.COLOR_FRONTIER), (x, row_y))
+
+        for lane in self.race.lanes:
+            row_y += self.ROW_HEIGHT
+            if row_y + self.ROW_HEIGHT > table_rect.bottom:
+                break
+            if lane.found:
+                cost_text = str(lane.path_cost)
+            else:
+                cost_text = "-" if lane.is_finished else "..."
+            cells = (
+                lane.algorithm_name,
+                str(lane.metrics.nodes_expanded),
+                f"{lane.solver_time * 1000:.1f}",
+                cost_text,
+            )
+            color = cfg.COLOR_TEXT_MAIN if lane.is_finished else cfg.COLOR_GRID
+            for x, text in zip(column_x, cells):
+                surface.blit(self.font_table.render(text, True, color), (x, row_y))
@@ -0,0 +1,101 @@
+"""
+Camera over the grid.
+Maps cells to screen pixels through a pan offset and a zoom factor.
+"""
+import math
+
+import pygame
+
+
+class Viewport:
+    """
+    zoom is the on-screen size of one cell in pixels and may be below 1.
+    origin_col / origin_row is the (fractional) cell at the top-left
+    corner of screen_rect. Nothing about a cell's pixels is stored; every
+    position is derived from these three numbers on demand.
+    """
+
+    MIN_ZOOM = 0.05
+    MAX_ZOOM = 64.0
+
+    def __init__(self, screen_rect, rows, cols, zoom):
+        self.screen_rect = pygame.Rect(screen_rect)
+        self.rows = rows
+        self.cols = cols
+        self.zoom = zoom
+        self.origin_col = 0.0
+        self.origin_row = 0.0
+
+        # Bumped on every camera move so renderers know to repaint.
+        self.revision = 0
+
+    def resize_grid(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.fit()
+
+    def fit(self):
+        """Zoom so the whole grid is visible and center it."""
+        self.zoom = min(self.screen_rect.width / self.cols, self.screen_rect.height / self.rows)
+        self.zoom = min(max(self.zoom, self.MIN_ZOOM), self.MAX_ZOOM)
+        self.origin_col = (self.cols - self.screen_rect.width / self.zoom) / 2
+        self.origin_row = (self.rows - self.screen_rect.height / self.zoom) / 2
+        self.revision += 1
+
+    def pan(self, delta_x, delta_y):
+        self.origin_col -= delta_x / self.zoom
+        self.origin_row -= delta_y / self.zoom
+        self._clamp()
+        self.revision += 1
+
+    def zoom_at(self, screen_position, factor):
+        """Zoom by factor while keeping the cell under screen_position still."""
+        anchor_col, anchor_row = self._world_position(screen_position)
+        self.zoom = min(max(self.zoom * factor, self.MIN_ZOOM), self.MAX_ZOOM)
+        self.origin_col = anchor_col - (screen_position[0] - self.screen_rect.x) / self.zoom
+        self.origin_row = anchor_row - (screen_position[1] - self.screen_rect.y) / self.zoom
+        self._clamp()
+        self.revision += 1
+
+    def cell_at(self, screen_position):
+        """(row, col) under a screen position, or None outside the grid."""
+        if not self.screen_rect.collidepoint(screen_position):
+            return None
+        world_col, world_row = self._world_position(screen_position)
+        col = math.floor(world_col)
+        row = math.floor(world_row)
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return row, col
+        return None
+
+    def cell_pixel_x(self, col):
+        return self.screen_rect.x + round((col - self.origin_col) * self.zoom)
+
+    def cell_pixel_y(self, row):
+        return self.screen_rect.y + round((row - self.origin_row) * self.zoom)
+
+    def cell_rect(self, row, col):
+        left = self.cell_pixel_x(col)
+        top = self.cell_pixel_y(row)
+        return pygame.Rect(left, top, self.cell_pixel_x(col + 1) - left, self.cell_pixel_y(row + 1) - top)
+
+    def visible_range(self):
+        """Half-open (first_row, end_row, first_col, end_col) of cells on screen."""
+        first_col = max(math.floor(self.origin_col), 0)
+        first_row = max(math.floor(self.origin_row), 0)
+        end_col = min(math.ceil(self.origin_col + self.screen_rect.width / self.zoom), self.cols)
+        end_row = min(math.ceil(self.origin_row + self.screen_rect.height / self.zoom), self.rows)
+        return first_row, max(end_row, first_row), first_col, max(end_col, first_col)
+
+    def _world_position(self, screen_position):
+        return (
+            self.origin_col + (screen_position[0] - self.screen_rect.x) / self.zoom,
+            self.origin_row + (screen_position[1] - self.screen_rect.y) / self.zoom,
+        )
+
+    def _clamp(self):
+        # Keep at least half a screen of grid in view.
+        view_cols = self.screen_rect.width / self.zoom
+        view_rows = self.screen_rect.height / self.zoom
+        self.origin_col = min(max(self.origin_col, -view_cols / 2), self.cols - view_cols / 2)
+        self.origin_row = min(max(self.origin_row, -view_rows / 2), self.rows - view_rows / 2)
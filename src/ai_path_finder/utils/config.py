@@ -0,0 +1,66 @@
+"""
+Global constants and color palette.
+Plain values only, so headless code can import it without pygame.
+"""
+
+
+def _rgb(hex_code):
+    return tuple(int(hex_code[index:index + 2], 16) for index in (1, 3, 5))
+
+
+WINDOW_WIDTH = 1280
+WINDOW_HEIGHT = 800
+FPS = 60
+# While nothing animates the loop sleeps in the event queue for at most this long.
+IDLE_WAIT_MS = 500
+# The HPA* overlay rebuilds its cluster graph for at most this long per frame.
+ABSTRACT_REFRESH_SLICE_SECONDS = 0.012
+
+GRID_SIZE = 25
+CELL_SIZE = 22
+GRID_OFFSET_X = 300 
+GRID_OFFSET_Y = 50
+
+# N cycles through these map sizes; the camera refits on every change.
+GRID_SIZE_PRESETS = (25, 100, 500, 2000)
+ZOOM_STEP = 1.25
+
+# G cycles these wall layouts over noise terrain; SHIFT+G moves to the next seed.
+MAP_SEED = 1337
+MAP_GENERATORS = ("RANDOM", "MAZE", "DIVISION", "ROOMS")
+
+# (r, g, b) tuples, which pygame accepts anywhere it takes a Color.
+COLOR_BG = _rgb("#1e1e2e")
+COLOR_SIDEBAR = _rgb("#11111b")
+COLOR_PANEL = _rgb("#313244")
+COLOR_GRID = _rgb("#45475a")
+
+COLOR_EMPTY = _rgb("#313244")
+COLOR_WALL = _rgb("#cba6f7")
+COLOR_START = _rgb("#a6e3a1")
+COLOR_TARGET = _rgb("#fab387")
+COLOR_FRONTIER = _rgb("#89b4fa")
+COLOR_EXPLORED = _rgb("#585b70")
+COLOR_PATH = _rgb("#f5c2e7")
+COLOR_TEXT_MAIN = _rgb("#cdd6f4")
+
+# Resolved once through the shared cache in ui/fonts.py.
+FONT_NAME = "JetBrainsMono Nerd Font"
+
+# H overlays the HPA* abstract level: cluster borders, entrance nodes and
+# the routes between them.
+COLOR_CLUSTER_BORDER = _rgb("#6c7086")
+COLOR_ABSTRACT_EDGE = _rgb("#94e2d5")
+COLOR_ABSTRACT_NODE = _rgb("#f9e2af")
+
+STEP_DELAY = 0.05
+# Solvers run in a background thread and ESC cancels them.
+SEARCH_IN_WORKER = True
+
+TRACE_EXPORT_PATH = "search_trace.pftrace"
+# J writes the last run's counters and timings here as JSON.
+METRICS_EXPORT_PATH = "search_metrics.json"
+# S saves the current map here and O opens it (.pfmap or MovingAI .map).
+MAP_PATH = "grid.pfmap"
+# L places this many ALT landmarks on the current map.
+LANDMARK_COUNT = 8
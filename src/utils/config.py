@@ -1,26 +0,0 @@
-import pygame
-
-WINDOW_WIDTH = 1280
-WINDOW_HEIGHT = 800
-FPS = 60
-
-GRID_SIZE = 25
-CELL_SIZE = 22
-GRID_OFFSET_X = 300 
-GRID_OFFSET_Y = 50
-
-COLOR_BG = pygame.Color("#1e1e2e")
-COLOR_SIDEBAR = pygame.Color("#11111b")
-COLOR_PANEL = pygame.Color("#313244")
-COLOR_GRID = pygame.Color("#45475a")
-
-COLOR_EMPTY = pygame.Color("#313244")
-COLOR_WALL = pygame.Color("#cba6f7")
-COLOR_START = pygame.Color("#a6e3a1")
-COLOR_TARGET = pygame.Color("#fab387")
-COLOR_FRONTIER = pygame.Color("#89b4fa")
-COLOR_EXPLORED = pygame.Color("#585b70")
-COLOR_PATH = pygame.Color("#f5c2e7")
-COLOR_TEXT_MAIN = pygame.Color("#cdd6f4")
-
-STEP_DELAY = 0.05